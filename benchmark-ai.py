@@ -0,0 +1,73 @@
+import argparse
+import time
+from src.models.article import Article
+from src.services.ai_service import AIService
+from src.services.ai_executor import AIExecutor
+from src.services.concurrency_controller import AdaptiveConcurrencyController
+from src.services.ai_backends import FakeBackend, FakeModelServer, LocalHTTPBackend
+
+# 네트워크나 API 키 없이 가짜 모델로 AI 처리 파이프라인의 처리량, 동시성, 재시도 동작을 측정합니다.
+parser = argparse.ArgumentParser(description="AI 처리 파이프라인 오프라인 벤치마크")
+parser.add_argument('--mode', choices=['inprocess', 'http'], default='http',
+                    help="inprocess: 가짜 모델을 직접 호출, http: 로컬 가짜 모델 서버를 경유 (기본값: http)")
+parser.add_argument('--articles', type=int, default=40, help="처리할 기사 수")
+parser.add_argument('--latency', type=float, default=0.3, help="모델 응답 지연(초)")
+parser.add_argument('--jitter', type=float, default=0.2, help="응답 지연에 더할 최대 무작위 시간(초)")
+parser.add_argument('--server-rpm', type=int, default=0, help="가짜 모델의 분당 요청 한도 (0이면 제한 없음)")
+parser.add_argument('--error-rate', type=float, default=0.05, help="503 오류 비율")
+parser.add_argument('--malformed-rate', type=float, default=0.05, help="깨진 JSON 응답 비율")
+parser.add_argument('--rpm', type=int, default=600, help="클라이언트 분당 요청 한도")
+parser.add_argument('--workers', type=int, default=4, help="동시 처리 수 (--adaptive이면 시작값)")
+parser.add_argument('--adaptive', action='store_true', help="AIMD로 동시 처리 수를 자동 조절")
+parser.add_argument('--max-concurrency', type=int, default=16, help="--adaptive일 때 최대 동시 처리 수")
+parser.add_argument('--batch-budget', type=int, default=0, help="배치 토큰 예산 (0이면 기사별 요청)")
+parser.add_argument('--seed', type=int, default=42)
+args = parser.parse_args()
+
+fake = FakeBackend(latency=args.latency, jitter=args.jitter, requests_per_minute=args.server_rpm,
+                   error_rate=args.error_rate, malformed_rate=args.malformed_rate, seed=args.seed)
+server = None
+if args.mode == 'http':
+    server = FakeModelServer(fake).start()
+    backend = LocalHTTPBackend(server.url)
+else:
+    backend = fake
+
+articles = [
+    Article(
+        title=f"Benchmark article {i}: new AI model improves reasoning benchmark scores",
+        description=f"Synthetic article body number {i} describing an AI research result in a few sentences.",
+        url=f"https://example.com/articles/{i}",
+        source_name="Benchmark",
+        source_id="benchmark"
+    )
+    for i in range(args.articles)
+]
+
+controller = None
+if args.adaptive:
+    controller = AdaptiveConcurrencyController(initial_limit=args.workers, max_limit=args.max_concurrency)
+executor = AIExecutor(requests_per_minute=args.rpm, max_workers=args.workers, max_retries=4, base_delay=0.2, max_delay=5.0,
+                      controller=controller)
+ai_service = AIService(backend=backend, executor=executor, batch_token_budget=args.batch_budget)
+
+try:
+    started = time.perf_counter()
+    processed = ai_service.process_articles(articles)
+    process_elapsed = time.perf_counter() - started
+    categories = ai_service.categorize_articles(processed)
+    total_elapsed = time.perf_counter() - started
+finally:
+    if server:
+        server.stop()
+
+failed = sum(1 for article in processed if article.summary == "요약 생성에 실패했습니다.")
+stats = fake.get_stats()
+print(f"모드: {args.mode}, 기사 {args.articles}개, 동시 처리 {args.workers}개, 배치 예산 {args.batch_budget}")
+print(f"기사 처리: {process_elapsed:.2f}초 ({args.articles / process_elapsed:.1f}건/초), 실패 {failed}개")
+print(f"전체 (카테고리 포함): {total_elapsed:.2f}초, 카테고리 {len(categories)}개")
+if controller:
+    controller_stats = controller.get_stats()
+    print(f"동시 처리 한도: {controller_stats['concurrency']}개, 관측 처리량 {controller_stats['observed_rpm']:.1f}RPM")
+print(ai_service.usage.format_report())
+print(f"모델 호출 {stats['calls']}회 (429 {stats['rate_limited']}회, 503 {stats['errors']}회, 깨진 JSON {stats['malformed']}회)")
@@ -0,0 +1,54 @@
+import argparse
+import time
+from email.mime.text import MIMEText
+from src.services.smtp_pool import SMTPDeliveryPool, OutgoingEmail
+from src.services.fake_smtp_server import FakeSMTPServer
+
+# 실제 메일 서버 없이 로컬 가짜 SMTP 서버로 세션 풀 발송의 처리량, 재연결/재시도 동작과 수신자별 결과를 확인합니다.
+parser = argparse.ArgumentParser(description="SMTP 병렬 발송 엔진 오프라인 벤치마크")
+parser.add_argument('--recipients', type=int, default=100, help="수신자 수")
+parser.add_argument('--pool-size', type=int, default=4, help="동시에 열어 둘 SMTP 세션 수")
+parser.add_argument('--latency', type=float, default=0.05, help="메일 한 통당 서버 응답 지연(초)")
+parser.add_argument('--jitter', type=float, default=0.05, help="응답 지연에 더할 최대 무작위 시간(초)")
+parser.add_argument('--failure-rate', type=float, default=0.1, help="451 임시 오류 비율")
+parser.add_argument('--disconnect-rate', type=float, default=0.05, help="응답 없이 연결을 끊는 비율")
+parser.add_argument('--reject', type=int, default=2, help="550으로 거부할 수신자 수")
+parser.add_argument('--max-retries', type=int, default=3, help="메일당 최대 재시도 횟수")
+parser.add_argument('--per-minute', type=int, default=0, help="분당 발송 한도 (0이면 제한 없음)")
+parser.add_argument('--verbose', action='store_true', help="수신자별 결과를 모두 출력")
+parser.add_argument('--seed', type=int, default=42)
+args = parser.parse_args()
+
+recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+body = "<html><body><h1>AI 뉴스</h1>" + "<p>벤치마크용 기사 본문입니다.</p>" * 50 + "</body></html>"
+
+def render(address: str) -> str:
+    message = MIMEText(body, 'html', 'utf-8')
+    message['Subject'] = "SMTP 벤치마크"
+    message['From'] = "bench@example.com"
+    message['To'] = address
+    return message.as_string()
+
+emails = [OutgoingEmail(address, "email_template.html", lambda address=address: render(address)) for address in recipients]
+
+with FakeSMTPServer(latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+                    disconnect_rate=args.disconnect_rate, reject_addresses=recipients[:args.reject],
+                    credentials=("bench", "secret"), seed=args.seed) as server:
+    pool = SMTPDeliveryPool(server.host, server.port, "bench", "secret", pool_size=args.pool_size,
+                            max_retries=args.max_retries, base_delay=0.05, max_delay=0.5,
+                            messages_per_minute=args.per_minute, timeout=5.0, use_tls=False)
+    started = time.perf_counter()
+    results = pool.send("bench@example.com", emails)
+    elapsed = time.perf_counter() - started
+
+failed = [result for result in results if not result.success]
+retried = [result for result in results if result.attempts > 1]
+for result in results if args.verbose else failed:
+    status = "성공" if result.success else f"실패: {result.error}"
+    print(f"  {result.recipient}: 시도 {result.attempts}회, {result.elapsed:.2f}초, {status}")
+
+stats = server.stats
+print(f"수신자 {len(results)}명, SMTP 세션 {args.pool_size}개: {elapsed:.2f}초 ({len(results) / elapsed:.1f}통/초)")
+print(f"성공 {len(results) - len(failed)}명, 실패 {len(failed)}명, 재시도한 수신자 {len(retried)}명")
+print(f"서버: 연결 {stats.connections}회 (최대 동시 {stats.max_concurrent_sessions}개), 수신 {stats.delivered}통, "
+      f"451 {stats.temporary_failures}회, 연결 끊김 {stats.disconnects}회, 550 거부 {stats.rejected}회")
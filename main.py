@@ -1,14 +1,25 @@
+import os
 import sys
 import time
 import argparse
 from src.config.settings import Settings
 from src.services.news_service import NewsService
 from src.services.ai_service import AIService
+from src.services.ai_executor import AIExecutor
+from src.services.concurrency_controller import AdaptiveConcurrencyController
+from src.services.ai_backends import AIBackend, GeminiBackend, LocalHTTPBackend, FakeBackend
+from src.services.llm_cache import LLMResponseCache
+from src.services.local_categorizer import LocalCategorizer
+from src.services.translation_memory import TranslationMemory
 from src.services.template_service import TemplateService
 from src.services.email_service import EmailService
 from src.services.teams_service import TeamsService
+from src.services.pipeline import PipelineRunner
+from src.services.run_checkpoint import RunCheckpoint
 from src.utils.logger import get_logger
-from src.utils.exceptions import NewsFetchError, AIProcessingError, NotificationError, ConfigurationError
+from src.utils.token_budget import TokenUsageTracker
+from src.utils.run_budget import RunBudget
+from src.utils.exceptions import NewsFetchError, AIProcessingError, NotificationError, EmailSendError, ConfigurationError
 
 logger = get_logger(__name__)
 
@@ -54,13 +65,26 @@ def generate_mock_data():
     ]
     return mock_articles, categories
 
+def create_ai_backend(settings: Settings) -> AIBackend:
+    """설정에 맞는 AI 백엔드를 생성합니다."""
+    if settings.ai_backend == 'gemini':
+        return GeminiBackend(settings.gemini_api_key)
+    if settings.ai_backend == 'local':
+        return LocalHTTPBackend(settings.ai_backend_url)
+    if settings.ai_backend == 'fake':
+        return FakeBackend()
+    raise ConfigurationError(f"지원하지 않는 AI 백엔드입니다: {settings.ai_backend}")
+
 def main():
     """스크립트의 메인 실행 함수"""
+    run_started = time.monotonic()
     parser = argparse.ArgumentParser(description="AI 뉴스 피더")
     parser.add_argument('--notify', type=str, choices=['email', 'teams', 'all'], default='email',
                         help="알림을 보낼 방식 (기본값: email)")
     parser.add_argument('--preview', action='store_true',
                         help="실제 발송 대신 이메일 HTML 미리보기를 생성합니다.")
+    parser.add_argument('--resume', action='store_true',
+                        help="오늘 완료되지 않은 실행이 있으면 마지막으로 끝난 단계부터 이어서 실행합니다.")
     args = parser.parse_args()
 
     try:
@@ -104,42 +128,122 @@ def main():
             return
 
         # --- 메인 로직 ---
+        # 모든 단계가 함께 쓰는 시간 예산 (발송 몫은 항상 남겨 둠)
+        run_budget = None
+        if settings.run_time_budget > 0:
+            run_budget = RunBudget(settings.run_time_budget, settings.run_delivery_reserve, started_at=run_started)
         news_service = NewsService(settings)
-        ai_service = AIService(settings.gemini_api_key)
+        ai_backend = create_ai_backend(settings)
+        concurrency_controller = None
+        if settings.ai_adaptive_concurrency:
+            # 백엔드(모델)별로 학습한 동시 처리 한도를 이어서 사용
+            concurrency_controller = AdaptiveConcurrencyController(
+                initial_limit=settings.ai_max_workers,
+                max_limit=settings.ai_max_concurrency,
+                state_path=os.path.join(settings.cache_dir, 'ai_concurrency.json'),
+                state_key=f"{settings.ai_backend}:{ai_backend.get_model_name()}"
+            )
+        ai_executor = AIExecutor(
+            requests_per_minute=settings.ai_requests_per_minute,
+            tokens_per_minute=settings.ai_tokens_per_minute,
+            max_workers=settings.ai_max_workers,
+            max_retries=settings.ai_max_retries,
+            controller=concurrency_controller
+        )
+        llm_cache = None
+        if settings.llm_cache_ttl_days > 0:
+            llm_cache = LLMResponseCache(
+                os.path.join(settings.cache_dir, 'llm_cache.db'),
+                ttl_days=settings.llm_cache_ttl_days,
+                max_bytes=settings.llm_cache_max_mb * 1024 * 1024
+            )
+        translation_memory = None
+        if settings.translation_memory_ttl_days > 0:
+            translation_memory = TranslationMemory(
+                os.path.join(settings.cache_dir, 'translation_memory.db'),
+                threshold=settings.translation_memory_threshold,
+                ttl_days=settings.translation_memory_ttl_days
+            )
+        token_usage = TokenUsageTracker(settings.ai_price_input_per_mtok, settings.ai_price_output_per_mtok)
+        ai_service = AIService(
+            backend=ai_backend,
+            executor=ai_executor,
+            batch_token_budget=settings.ai_batch_token_budget,
+            batch_max_articles=settings.ai_batch_max_articles,
+            cache=llm_cache,
+            categorizer=LocalCategorizer(name_map_path=os.path.join(settings.cache_dir, 'category_names.json')),
+            categorizer_mode=settings.categorizer_mode,
+            llm_category_naming=settings.category_llm_naming,
+            translation_memory=translation_memory,
+            input_token_budget=settings.ai_input_token_budget,
+            usage=token_usage,
+            budget=run_budget
+        )
 
-        # 1. 뉴스 수집
-        articles = news_service.fetch_ai_news()
-        if not articles:
-            logger.warning("처리할 뉴스가 없습니다.")
-            return
+        email_service = None
+        if args.notify == 'email' or args.notify == 'all':
+            email_service = EmailService(settings, TemplateService())
+
+        # 단계별 결과를 저장할 체크포인트 (--resume이면 오늘의 미완료 실행을 이어서 사용)
+        runs_dir = os.path.join(settings.cache_dir, 'runs')
+        RunCheckpoint.cleanup(runs_dir)
+        checkpoint = RunCheckpoint.find_resumable(runs_dir) if args.resume else None
+        if checkpoint is None:
+            if args.resume:
+                logger.info("이어서 실행할 체크포인트가 없어 새로 실행합니다.")
+            checkpoint = RunCheckpoint.create(runs_dir)
 
-        # 2. AI 처리
-        processed_articles = []
-        for article in articles:
-            try:
-                processed_article = ai_service.process_article(article)
-                processed_articles.append(processed_article)
-                time.sleep(10)
-            except AIProcessingError as e:
-                logger.error(f"뉴스 처리 중 오류: {e}")
-                processed_articles.append(article)
-
-        # 3. 카테고리 분류
+        # 1~3. 뉴스 수집 → AI 처리 → 기사 조각 렌더링 → 카테고리 분류 → 이메일 렌더링
+        # 순위가 확정된 기사부터 다음 단계로 넘겨 각 단계를 겹쳐 실행합니다.
+        pipeline = PipelineRunner(news_service.aggregator, ai_service, settings.article_count,
+                                  email_service=email_service, budget=run_budget)
         try:
-            categories = ai_service.categorize_articles(processed_articles)
-        except AIProcessingError as e:
-            logger.error(f"카테고리 분류 중 오류: {e}")
-            categories = [{"category_name": "주요 뉴스", "articles": list(range(len(processed_articles)))}]
+            result = pipeline.run(checkpoint)
+        finally:
+            # 실패한 실행도 비용과 지연을 비교할 수 있도록 보고서를 남김
+            if token_usage.records:
+                logger.info(f"AI 호출 사용량 보고서\n{token_usage.format_report()}")
+                token_usage.save(os.path.join(checkpoint.path, 'usage.json'))
+            if run_budget:
+                run_budget.log_summary()
+        if not result.articles:
+            logger.warning("처리할 뉴스가 없습니다.")
+            checkpoint.mark_completed()
+            return
+        processed_articles, categories = result.articles, result.categories
+        executor_stats = ai_executor.get_stats()
+        if executor_stats:
+            logger.info(f"AI 동시 처리 한도 {executor_stats['concurrency']}개, "
+                        f"관측 처리량 {executor_stats['observed_rpm']:.1f}RPM")
 
-        # 4. 알림 발송
+        # 4. 알림 발송 (이전 실행에서 이미 발송한 채널은 건너뜀)
         if args.notify == 'teams' or args.notify == 'all':
-            teams_service = TeamsService(settings)
-            teams_service.send_news_message(processed_articles, categories)
+            if checkpoint.is_delivered('teams'):
+                logger.info("Teams 메시지는 이전 실행에서 이미 발송되어 건너뜁니다.")
+            else:
+                teams_service = TeamsService(settings)
+                teams_service.send_news_message(processed_articles, categories)
+                checkpoint.mark_delivered('teams')
 
-        if args.notify == 'email' or args.notify == 'all':
-            template_service = TemplateService()
-            email_service = EmailService(settings, template_service)
-            email_service.send_news_email(processed_articles, categories)
+        if email_service:
+            if checkpoint.is_delivered('email'):
+                logger.info("이메일은 이전 실행에서 이미 발송되어 건너뜁니다.")
+            else:
+                # 일부 수신자에게 실패하면 수신자별 결과를 남기고 실패로 끝내, --resume 때 받지 못한 수신자에게만 다시 보냄
+                try:
+                    delivery_results = email_service.send_news_email(
+                        processed_articles, categories, rendered=result.rendered,
+                        skip_recipients=checkpoint.load_email_recipients_sent())
+                except EmailSendError as e:
+                    if e.results:
+                        checkpoint.save_email_results(e.results)
+                    raise
+                checkpoint.save_email_results(delivery_results)
+                checkpoint.mark_delivered('email')
+
+        # 5. 발송 기록 저장
+        news_service.mark_delivered(processed_articles)
+        checkpoint.mark_completed()
 
         logger.info(f"AI 뉴스 피더 작업이 '{args.notify}' 방식으로 성공적으로 완료되었습니다.")
 
@@ -58,6 +58,48 @@ class Settings:
     # News Sources Configuration
     news_sources: List[NewsSourceConfig] = None
 
+    # Fetch Settings
+    fetch_max_workers: int = 8
+    source_timeout: float = 20.0
+    fetch_deadline: float = 60.0
+    relevance_min_score: float = 0.3
+    run_time_budget: float = 1200.0
+    run_delivery_reserve: float = 120.0
+
+    # AI Settings
+    ai_backend: str = "gemini"  # 'gemini', 'local' or 'fake'
+    ai_backend_url: str = ""
+    ai_requests_per_minute: int = 15
+    ai_tokens_per_minute: int = 1000000
+    ai_max_workers: int = 4
+    ai_max_retries: int = 4
+    ai_adaptive_concurrency: bool = True
+    ai_max_concurrency: int = 16
+    ai_batch_token_budget: int = 4000
+    ai_batch_max_articles: int = 8
+    ai_input_token_budget: int = 400
+    ai_price_input_per_mtok: float = 0.075
+    ai_price_output_per_mtok: float = 0.30
+    categorizer_mode: str = "local"  # 'local' or 'llm'
+    category_llm_naming: bool = False
+
+    # SMTP Delivery Settings
+    smtp_pool_size: int = 4
+    smtp_max_retries: int = 3
+    smtp_max_per_minute: int = 0
+    smtp_starttls: bool = True
+    ncloud_batch_size: int = 50
+    ncloud_max_workers: int = 4
+    ncloud_max_retries: int = 2
+
+    # Cache Settings
+    cache_dir: str = ".cache"
+    seen_ttl_days: int = 30
+    llm_cache_ttl_days: float = 3
+    llm_cache_max_mb: int = 50
+    translation_memory_ttl_days: float = 30
+    translation_memory_threshold: float = 0.8
+
     def __post_init__(self):
         """기본 뉴스 소스 설정"""
         if self.news_sources is None:
@@ -146,12 +188,54 @@ class Settings:
             recipients=[Recipient(**r) for r in json.loads(os.getenv("RECIPIENTS", "[]"))],
             sender_name=os.getenv("SENDER_NAME", "AI 뉴스 알리미"),
             default_email_template=os.getenv("DEFAULT_EMAIL_TEMPLATE", "email_template.html"),
-            article_count=int(os.getenv("NEWS_ARTICLE_COUNT", "5"))
+            article_count=int(os.getenv("NEWS_ARTICLE_COUNT", "5")),
+
+            fetch_max_workers=int(os.getenv("FETCH_MAX_WORKERS", "8")),
+            source_timeout=float(os.getenv("SOURCE_TIMEOUT", "20")),
+            fetch_deadline=float(os.getenv("FETCH_DEADLINE", "60")),
+            relevance_min_score=float(os.getenv("RELEVANCE_MIN_SCORE", "0.3")),
+            run_time_budget=float(os.getenv("RUN_TIME_BUDGET", "1200")),
+            run_delivery_reserve=float(os.getenv("RUN_DELIVERY_RESERVE", "120")),
+
+            ai_backend=os.getenv("AI_BACKEND", "gemini"),
+            ai_backend_url=os.getenv("AI_BACKEND_URL", ""),
+            ai_requests_per_minute=int(os.getenv("AI_REQUESTS_PER_MINUTE", "15")),
+            ai_tokens_per_minute=int(os.getenv("AI_TOKENS_PER_MINUTE", "1000000")),
+            ai_max_workers=int(os.getenv("AI_MAX_WORKERS", "4")),
+            ai_max_retries=int(os.getenv("AI_MAX_RETRIES", "4")),
+            ai_adaptive_concurrency=os.getenv("AI_ADAPTIVE_CONCURRENCY", "true").lower() == "true",
+            ai_max_concurrency=int(os.getenv("AI_MAX_CONCURRENCY", "16")),
+            ai_batch_token_budget=int(os.getenv("AI_BATCH_TOKEN_BUDGET", "4000")),
+            ai_batch_max_articles=int(os.getenv("AI_BATCH_MAX_ARTICLES", "8")),
+            ai_input_token_budget=int(os.getenv("AI_INPUT_TOKEN_BUDGET", "400")),
+            ai_price_input_per_mtok=float(os.getenv("AI_PRICE_INPUT_PER_MTOK", "0.075")),
+            ai_price_output_per_mtok=float(os.getenv("AI_PRICE_OUTPUT_PER_MTOK", "0.30")),
+            categorizer_mode=os.getenv("CATEGORIZER_MODE", "local"),
+            category_llm_naming=os.getenv("CATEGORY_LLM_NAMING", "false").lower() == "true",
+
+            smtp_pool_size=int(os.getenv("SMTP_POOL_SIZE", "4")),
+            smtp_max_retries=int(os.getenv("SMTP_MAX_RETRIES", "3")),
+            smtp_max_per_minute=int(os.getenv("SMTP_MAX_PER_MINUTE", "0")),
+            smtp_starttls=os.getenv("SMTP_STARTTLS", "true").lower() == "true",
+            ncloud_batch_size=int(os.getenv("NCLOUD_BATCH_SIZE", "50")),
+            ncloud_max_workers=int(os.getenv("NCLOUD_MAX_WORKERS", "4")),
+            ncloud_max_retries=int(os.getenv("NCLOUD_MAX_RETRIES", "2")),
+
+            cache_dir=os.getenv("CACHE_DIR", ".cache"),
+            seen_ttl_days=int(os.getenv("SEEN_TTL_DAYS", "30")),
+            llm_cache_ttl_days=float(os.getenv("LLM_CACHE_TTL_DAYS", "3")),
+            llm_cache_max_mb=int(os.getenv("LLM_CACHE_MAX_MB", "50")),
+            translation_memory_ttl_days=float(os.getenv("TRANSLATION_MEMORY_TTL_DAYS", "30")),
+            translation_memory_threshold=float(os.getenv("TRANSLATION_MEMORY_THRESHOLD", "0.8"))
         )
 
     def validate_common(self) -> bool:
         """모든 알림 방식에 공통적으로 필요한 설정값들을 검증합니다."""
-        if not self.news_api_key or not self.gemini_api_key:
+        if not self.news_api_key:
+            return False
+        if self.ai_backend == 'gemini' and not self.gemini_api_key:
+            return False
+        if self.ai_backend == 'local' and not self.ai_backend_url:
             return False
         return True
 
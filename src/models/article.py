@@ -2,6 +2,10 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+# 본문 설명이 없는 기사에 소스가 "{제목}{안내 문구}" 형태로 채워 넣는 설명의 안내 문구
+NAVER_DESCRIPTION_SUFFIX = " - 네이버 뉴스에서 제공하는 최신 정보입니다."
+BOILERPLATE_DESCRIPTION_SUFFIXES = (NAVER_DESCRIPTION_SUFFIX,)
+
 @dataclass
 class Article:
     """뉴스 기사를 나타내는 모델 클래스"""
@@ -22,6 +26,10 @@ class Article:
     # 품질 평가 필드
     quality_score: float = 0.0
     weight: float = 1.0
+    relevance_score: Optional[float] = None
+
+    # 같은 기사를 다룬 다른 출처의 URL
+    alternate_urls: List[str] = field(default_factory=list)
 
     def __post_init__(self):
         """데이터 검증 및 기본값 설정"""
@@ -34,6 +42,16 @@ class Article:
         if not self.source_name:
             self.source_name = "Unknown"
 
+    def content_description(self) -> str:
+        """소스가 제목으로 만들어 넣은 안내 문구를 뺀 실제 본문 설명을 반환합니다. 본문이 없으면 빈 문자열입니다."""
+        description = (self.description or '').strip()
+        for suffix in BOILERPLATE_DESCRIPTION_SUFFIXES:
+            if description.endswith(suffix.strip()):
+                description = description[:-len(suffix.strip())].strip()
+        if description == self.title.strip():
+            return ''
+        return description
+
     def to_dict(self) -> dict:
         """딕셔너리 형태로 변환"""
         return {
@@ -47,7 +65,9 @@ class Article:
             'summary': self.summary,
             'tags': self.tags,
             'quality_score': self.quality_score,
-            'weight': self.weight
+            'weight': self.weight,
+            'relevance_score': self.relevance_score,
+            'alternate_urls': self.alternate_urls
         }
 
     @classmethod
@@ -71,5 +91,7 @@ class Article:
             summary=data.get('summary'),
             tags=data.get('tags', []),
             quality_score=data.get('quality_score', 0.0),
-            weight=data.get('weight', 1.0)
+            weight=data.get('weight', 1.0),
+            relevance_score=data.get('relevance_score'),
+            alternate_urls=data.get('alternate_urls', [])
         )
\ No newline at end of file
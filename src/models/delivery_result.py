@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class DeliveryResult:
+    """수신자 한 명에 대한 이메일 발송 결과"""
+
+    recipient: str
+    template: str
+    success: bool
+    # 발송을 시도한 횟수 (재시도 포함)
+    attempts: int = 0
+    error: Optional[str] = None
+    # 첫 시도부터 결과가 정해질 때까지 걸린 시간(초)
+    elapsed: float = 0.0
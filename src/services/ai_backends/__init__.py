@@ -0,0 +1,7 @@
+from .base import AIBackend
+from .gemini_backend import GeminiBackend
+from .fake_backend import FakeBackend
+from .local_backend import LocalHTTPBackend
+from .fake_server import FakeModelServer
+
+__all__ = ['AIBackend', 'GeminiBackend', 'FakeBackend', 'LocalHTTPBackend', 'FakeModelServer']
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+class AIBackend(ABC):
+    """프롬프트를 받아 모델의 응답 텍스트를 돌려주는 AI 백엔드 추상 클래스
+
+    재시도할 수 있는 오류는 status_code(429, 5xx 등)와 retry_after 속성을 가진 예외로 알려야
+    AIExecutor가 백오프 후 다시 시도합니다.
+    """
+
+    model_name: str = "unknown"
+
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """프롬프트에 대한 응답 텍스트를 반환합니다."""
+        pass
+
+    def get_model_name(self) -> str:
+        """모델 이름 반환 (응답 캐시 키에 사용)"""
+        return self.model_name
@@ -0,0 +1,120 @@
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional
+from .base import AIBackend
+from ...utils.exceptions import AIBackendError
+
+_BATCH_ID_RE = re.compile(r'\[id: (\d+)\]\s*\n\s*Original Title: (.*)')
+_TITLE_RE = re.compile(r'Original Title: (.*)')
+_NEWS_INDEX_RE = re.compile(r'["\'](\d+): ')
+_TERM_GROUP_RE = re.compile(r'^\s*\d+: (.*)$', re.MULTILINE)
+
+# 카테고리 하나에 넣을 최대 기사 수 (카테고리 프롬프트의 규칙과 동일)
+_MAX_ARTICLES_PER_CATEGORY = 6
+
+@dataclass
+class FakeBackendStats:
+    """가짜 백엔드 호출 통계"""
+    calls: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    malformed: int = 0
+
+class FakeBackend(AIBackend):
+    """네트워크 없이 동작하는 가짜 모델
+
+    AIService의 단건/배치/카테고리 프롬프트를 알아보고 형식에 맞는 JSON 응답을 만들어 줍니다.
+    부하 시험을 위해 응답 지연, 분당 요청 한도(429), 서버 오류(503), 깨진 JSON 응답을 흉내낼 수 있습니다.
+    """
+
+    model_name = "fake-model"
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, requests_per_minute: int = 0,
+                 error_rate: float = 0.0, malformed_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.requests_per_minute = requests_per_minute
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.stats = FakeBackendStats()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._request_times: deque = deque()
+
+    def _check_rate_limit(self) -> None:
+        if self.requests_per_minute <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            while self._request_times and now - self._request_times[0] >= 60.0:
+                self._request_times.popleft()
+            if len(self._request_times) >= self.requests_per_minute:
+                self.stats.rate_limited += 1
+                retry_after = 60.0 - (now - self._request_times[0])
+                raise AIBackendError("요청 한도를 초과했습니다.", status_code=429, retry_after=retry_after)
+            self._request_times.append(now)
+
+    def generate(self, prompt: str) -> str:
+        with self._lock:
+            self.stats.calls += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+            malformed = self._random.random() < self.malformed_rate
+
+        self._check_rate_limit()
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            with self._lock:
+                self.stats.errors += 1
+            raise AIBackendError("일시적인 서버 오류입니다.", status_code=503)
+
+        text = json.dumps(self.respond(prompt), ensure_ascii=False)
+        if malformed:
+            with self._lock:
+                self.stats.malformed += 1
+            return text[:len(text) // 2]
+        return text
+
+    def respond(self, prompt: str) -> Any:
+        """프롬프트 종류에 맞는 응답 객체를 만듭니다."""
+        if 'key terms of one news category' in prompt:
+            return [f"{terms.split(',')[0].strip()} 소식" for terms in _TERM_GROUP_RE.findall(prompt)]
+
+        if 'News List:' in prompt:
+            indices = [int(i) for i in _NEWS_INDEX_RE.findall(prompt.split('News List:', 1)[1])]
+            return {"categories": self._categorize(indices)}
+
+        batch = _BATCH_ID_RE.findall(prompt)
+        if batch:
+            return [dict(id=int(index), **self._process(title.strip())) for index, title in batch]
+
+        match = _TITLE_RE.search(prompt)
+        return self._process(match.group(1).strip() if match else "")
+
+    def _process(self, title: str) -> Dict[str, Any]:
+        words = [word for word in re.findall(r'\w+', title) if len(word) > 2]
+        return {
+            "korean_title": f"[번역] {title}",
+            "summary": f"{title}에 대한 요약입니다.",
+            "tags": words[:3] or ["뉴스"]
+        }
+
+    def _categorize(self, indices: List[int]) -> List[Dict[str, Any]]:
+        categories = []
+        for start in range(0, len(indices), _MAX_ARTICLES_PER_CATEGORY):
+            categories.append({
+                "category_name": f"카테고리 {len(categories) + 1}",
+                "articles": indices[start:start + _MAX_ARTICLES_PER_CATEGORY]
+            })
+        return categories
+
+    def get_stats(self) -> Dict[str, int]:
+        """호출 통계를 반환합니다."""
+        with self._lock:
+            return asdict(self.stats)
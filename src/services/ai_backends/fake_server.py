@@ -0,0 +1,85 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from .fake_backend import FakeBackend
+from ...utils.exceptions import AIBackendError
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class FakeModelServer:
+    """FakeBackend를 HTTP로 제공하는 로컬 모델 서버
+
+    LocalHTTPBackend와 함께 사용하여 실제 네트워크 왕복, 커넥션, 429 응답의 Retry-After 헤더까지
+    포함한 부하 시험을 오프라인에서 할 수 있습니다.
+    """
+
+    def __init__(self, backend: Optional[FakeBackend] = None, host: str = "127.0.0.1", port: int = 0):
+        self.backend = backend or FakeBackend()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _make_handler(self):
+        backend = self.backend
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != '/generate':
+                    self._send(404, {"error": "not found"})
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    prompt = json.loads(self.rfile.read(length)).get('prompt', '')
+                except (ValueError, AttributeError):
+                    self._send(400, {"error": "invalid request"})
+                    return
+
+                try:
+                    self._send(200, {"text": backend.generate(prompt)})
+                except AIBackendError as e:
+                    headers = {}
+                    if e.retry_after:
+                        headers['Retry-After'] = f"{e.retry_after:.2f}"
+                    self._send(e.status_code or 500, {"error": str(e)}, headers)
+
+            def _send(self, status: int, body: dict, headers: Optional[dict] = None):
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> 'FakeModelServer':
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-model-server", daemon=True)
+        self._thread.start()
+        logger.info(f"가짜 모델 서버 시작: {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """서버를 종료합니다."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeModelServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,52 @@
+import re
+from typing import Optional
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from .base import AIBackend
+from ...utils.exceptions import AIBackendError
+
+# RetryInfo가 없을 때 오류 메시지의 "Please retry in 38.2s." 문구에서 대기 시간을 읽음
+_RETRY_IN_RE = re.compile(r'retry in ([\d.]+)\s*s', re.IGNORECASE)
+
+def get_retry_delay(error: google_exceptions.GoogleAPICallError) -> Optional[float]:
+    """Gemini 오류의 RetryInfo 상세 정보나 메시지에서 서버가 알려준 재시도 대기 시간(초)을 꺼냅니다."""
+    for detail in error.details or []:
+        if isinstance(detail, dict):
+            # REST 전송: {'@type': '...RetryInfo', 'retryDelay': '38s'}
+            delay = detail.get('retryDelay')
+            if isinstance(delay, str) and delay.endswith('s'):
+                try:
+                    return float(delay[:-1])
+                except ValueError:
+                    continue
+        else:
+            # gRPC 전송: retry_delay가 protobuf Duration인 RetryInfo 메시지
+            delay = getattr(detail, 'retry_delay', None)
+            if delay is not None:
+                seconds = getattr(delay, 'seconds', 0) + getattr(delay, 'nanos', 0) / 1e9
+                if seconds > 0:
+                    return seconds
+    match = _RETRY_IN_RE.search(error.message or '')
+    return float(match.group(1)) if match else None
+
+class GeminiBackend(AIBackend):
+    """Google Gemini API 백엔드
+
+    google.api_core 오류는 상태 코드와 재시도 대기 시간을 담은 AIBackendError로 바꿔 AIExecutor가 백오프와
+    동시 처리 수 조절에 쓸 수 있게 합니다. DeadlineExceeded는 상태 코드 504로 전달되어 타임아웃으로 처리됩니다.
+    """
+
+    def __init__(self, api_key: str, model_name: str = 'gemini-2.0-flash-lite'):
+        genai.configure(api_key=api_key)
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+
+    def generate(self, prompt: str) -> str:
+        try:
+            return self.model.generate_content(prompt).text
+        except google_exceptions.GoogleAPICallError as e:
+            raise AIBackendError(
+                f"Gemini API 오류 (상태 코드: {e.code}): {e.message}",
+                status_code=e.code,
+                retry_after=get_retry_delay(e)
+            ) from e
@@ -0,0 +1,32 @@
+import requests
+from .base import AIBackend
+from ...utils.exceptions import AIBackendError
+
+class LocalHTTPBackend(AIBackend):
+    """로컬 모델 서버(FakeModelServer 등)에 HTTP로 요청하는 백엔드
+
+    POST {url}/generate 에 {"prompt": ...}를 보내고 {"text": ...} 응답을 받습니다.
+    """
+
+    def __init__(self, url: str, model_name: str = "local-model", timeout: float = 60.0):
+        self.url = url.rstrip('/')
+        self.model_name = model_name
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def generate(self, prompt: str) -> str:
+        try:
+            response = self.session.post(f"{self.url}/generate", json={"prompt": prompt}, timeout=self.timeout)
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(f"로컬 모델 서버 응답 시간 초과: {e}") from e
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError(f"로컬 모델 서버에 연결할 수 없습니다: {e}") from e
+
+        if response.status_code != 200:
+            retry_after = response.headers.get('Retry-After')
+            raise AIBackendError(
+                f"로컬 모델 서버 오류 (상태 코드: {response.status_code})",
+                status_code=response.status_code,
+                retry_after=float(retry_after) if retry_after else None
+            )
+        return response.json().get('text', '')
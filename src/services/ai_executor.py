@@ -0,0 +1,118 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+from ..utils.logger import get_logger
+from ..utils.rate_limiter import RateLimiter
+from ..utils.exceptions import DeadlineExceededError
+from .concurrency_controller import AdaptiveConcurrencyController
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# 게이트웨이/서버 쪽 응답 시간 초과 (Gemini DeadlineExceeded 포함)
+TIMEOUT_STATUS_CODES = {504}
+
+def get_status_code(exc: BaseException) -> Optional[int]:
+    """예외에서 HTTP 상태 코드를 추출합니다. (google.api_core 예외의 code 속성 등)"""
+    for attr in ('status_code', 'code'):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """예외에 서버가 알려준 재시도 대기 시간(초)이 있으면 반환합니다."""
+    value = getattr(exc, 'retry_after', None)
+    if isinstance(value, (int, float)) and value > 0:
+        return float(value)
+    return None
+
+def is_timeout(exc: BaseException) -> bool:
+    """클라이언트 타임아웃이나 504처럼 응답 시간 초과로 실패했는지 확인합니다."""
+    return isinstance(exc, TimeoutError) or get_status_code(exc) in TIMEOUT_STATUS_CODES
+
+def is_retryable(exc: BaseException) -> bool:
+    """재시도할 수 있는 오류(429, 5xx, 타임아웃)인지 확인합니다."""
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return get_status_code(exc) in RETRYABLE_STATUS_CODES
+
+class AIExecutor:
+    """AI 모델 호출을 요청/토큰 한도 안에서 병렬로 실행하는 엔진
+
+    모든 호출은 RPM/TPM 토큰 버킷을 통과해야 하며, 429/5xx 오류는 지수 백오프로 재시도합니다.
+    map은 제한된 워커 풀로 실행하되 입력 순서대로 결과를 돌려줍니다.
+    controller가 주어지면 동시 호출 수를 컨트롤러가 조절하며, 워커 풀은 컨트롤러의 최대 한도만큼 만듭니다.
+    """
+
+    def __init__(self, requests_per_minute: float = 15, tokens_per_minute: Optional[float] = 1_000_000,
+                 max_workers: int = 4, max_retries: int = 4, base_delay: float = 2.0, max_delay: float = 60.0,
+                 controller: Optional[AdaptiveConcurrencyController] = None):
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.controller = controller
+        self.max_workers = controller.max_limit if controller else max_workers
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def _backoff(self, attempt: int, exc: BaseException) -> float:
+        retry_after = get_retry_after(exc)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    def call(self, fn: Callable[..., R], *args: Any, tokens: int = 0, deadline: Optional[float] = None,
+             **kwargs: Any) -> R:
+        """레이트 리미트를 지키며 fn을 호출하고, 재시도 가능한 오류는 백오프 후 다시 시도합니다.
+
+        deadline(time.monotonic 기준)이 주어지면 레이트 리미트나 백오프 대기가 그 시각을 넘길 때
+        기다리지 않고 DeadlineExceededError를 발생시킵니다.
+        """
+        attempt = 0
+        while True:
+            generation = self.controller.acquire() if self.controller else 0
+            wait = self.rate_limiter.reserve(tokens)
+            if deadline is not None and time.monotonic() + wait > deadline:
+                if self.controller:
+                    self.controller.record_failure(generation)
+                raise DeadlineExceededError("레이트 리미트 대기가 실행 마감 시각을 넘습니다.")
+            if wait > 0:
+                time.sleep(wait)
+            started = time.monotonic()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if self.controller:
+                    self.controller.record_failure(generation, get_status_code(e),
+                                                   timed_out=is_timeout(e), retry_after=get_retry_after(e))
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = self._backoff(attempt, e)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    raise DeadlineExceededError(f"재시도 대기가 실행 마감 시각을 넘습니다: {e}") from e
+                attempt += 1
+                logger.warning(f"AI 호출 실패 (상태 코드: {get_status_code(e)}), "
+                               f"{delay:.1f}초 후 재시도합니다 ({attempt}/{self.max_retries}): {e}")
+                time.sleep(delay)
+            else:
+                if self.controller:
+                    self.controller.record_success(generation, time.monotonic() - started)
+                return result
+
+    def get_stats(self) -> Optional[Dict[str, Any]]:
+        """동시 처리 컨트롤러의 현재 한도와 관측 RPM을 반환합니다."""
+        return self.controller.get_stats() if self.controller else None
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """items 각각에 fn을 병렬로 적용하고 입력 순서대로 결과를 반환합니다."""
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(items))),
+                                thread_name_prefix="ai-worker") as executor:
+            return list(executor.map(fn, items))
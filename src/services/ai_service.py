@@ -1,24 +1,318 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
-import google.generativeai as genai
+import re
+import time
+from .ai_backends import AIBackend, GeminiBackend
+from .ai_executor import AIExecutor
+from .llm_cache import LLMResponseCache
+from .local_categorizer import LocalCategorizer
+from .translation_memory import TranslationMemory
 from ..models.article import Article
 from ..utils.logger import get_logger
-from ..utils.exceptions import AIProcessingError
+from ..utils.exceptions import AIProcessingError, AIBackendError, DeadlineExceededError
+from ..utils.run_budget import RunBudget
+from ..utils.token_budget import TokenUsageTracker, estimate_tokens, strip_html, truncate_to_tokens
 
 logger = get_logger(__name__)
 
+# 프롬프트나 응답 형식을 바꾸면 버전을 올려 이전 캐시를 무효화합니다.
+ARTICLE_PROMPT_VERSION = 'article-v2'
+CATEGORIZE_PROMPT_VERSION = 'categorize-v1'
+CATEGORY_NAMING_PROMPT_VERSION = 'category-naming-v1'
+
+# 레이트 리미터에 예약할 응답 토큰 여유분
+RESPONSE_TOKEN_ALLOWANCE = 256
+
+_HANGUL_RE = re.compile(r'[가-힣]')
+_WORD_LETTERS_RE = re.compile(r'[^\W\d_]+')
+
+def is_korean_text(text: str) -> bool:
+    """단어(숫자 제외) 중 한글이 들어간 단어가 절반 이상이면 한국어 문장으로 봅니다.
+
+    한국어 제목에도 OpenAI 같은 영문 고유명사가 자주 섞이므로 글자 수가 아니라 단어 수로 판단합니다.
+    """
+    words = _WORD_LETTERS_RE.findall(text)
+    korean_words = sum(1 for word in words if _HANGUL_RE.search(word))
+    return bool(words) and korean_words * 2 >= len(words)
+
 class AIService:
     """AI 처리를 담당하는 서비스 클래스"""
 
-    def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-lite')
+    def __init__(self, api_key: str = "", executor: Optional[AIExecutor] = None,
+                 batch_token_budget: int = 0, batch_max_articles: int = 8,
+                 cache: Optional[LLMResponseCache] = None, backend: Optional[AIBackend] = None,
+                 categorizer: Optional[LocalCategorizer] = None, categorizer_mode: str = 'local',
+                 llm_category_naming: bool = False, translation_memory: Optional[TranslationMemory] = None,
+                 input_token_budget: int = 400, usage: Optional[TokenUsageTracker] = None,
+                 budget: Optional[RunBudget] = None):
+        self.backend = backend or GeminiBackend(api_key)
+        self.model_name = self.backend.get_model_name()
+        self.executor = executor or AIExecutor()
+        self.batch_token_budget = batch_token_budget
+        self.batch_max_articles = batch_max_articles
+        self.cache = cache
+        self.categorizer = categorizer or LocalCategorizer()
+        self.categorizer_mode = categorizer_mode
+        self.llm_category_naming = llm_category_naming
+        self.translation_memory = translation_memory
+        self.input_token_budget = input_token_budget
+        self.usage = usage or TokenUsageTracker()
+        self.budget = budget
+
+    def _generate(self, prompt: str, kind: str = 'article') -> str:
+        """레이트 리미트와 재시도를 적용하여 모델을 호출하고 응답 텍스트를 반환합니다.
+
+        재시도를 포함한 호출마다 입력/출력 토큰 수(추정)와 지연 시간을 usage에 기록합니다.
+        """
+        prompt_tokens = estimate_tokens(prompt)
+
+        def call() -> str:
+            # 재시도 대기 중에 마감이 지났을 수도 있으므로 시도할 때마다 확인
+            if self._out_of_time():
+                raise DeadlineExceededError("실행 시간 예산이 소진되어 AI 호출을 중단합니다.")
+            started = time.monotonic()
+            try:
+                response_text = self.backend.generate(prompt)
+            except Exception:
+                self.usage.record(kind, prompt_tokens, 0, time.monotonic() - started, failed=True)
+                raise
+            self.usage.record(kind, prompt_tokens, estimate_tokens(response_text), time.monotonic() - started)
+            return response_text
+
+        deadline = self.budget.work_deadline if self.budget else None
+        return self.executor.call(call, tokens=prompt_tokens + RESPONSE_TOKEN_ALLOWANCE, deadline=deadline)
+
+    def _out_of_time(self) -> bool:
+        return bool(self.budget and self.budget.work_expired())
+
+    def _apply_raw_fallback(self, articles: List[Article]) -> None:
+        """시간 예산이 소진되어 처리하지 못한 기사는 원문 제목과 (HTML을 제거하고 자른) 설명을 그대로 씁니다."""
+        for article in articles:
+            article.korean_title = article.title
+            article.summary = self._prompt_description(article) or article.title
+            article.tags = []
+        if self.budget and articles:
+            self.budget.degrade("AI 처리", "시간 예산 소진으로 원문 제목/설명 사용", len(articles))
+
+    @staticmethod
+    def _apply_failure_defaults(articles: List[Article]) -> None:
+        """AI 처리에 실패한 기사는 원문 제목과 실패 안내 문구로 채웁니다."""
+        for article in articles:
+            article.korean_title = article.title
+            article.summary = "요약 생성에 실패했습니다."
+            article.tags = []
+
+    def _prompt_description(self, article: Article) -> str:
+        """프롬프트에 넣을 기사 본문: 소스 안내 문구와 HTML을 제거하고 input_token_budget에 맞게 문장 단위로 자릅니다."""
+        return truncate_to_tokens(strip_html(article.content_description()), self.input_token_budget)
+
+    def _article_cache_key(self, article: Article) -> str:
+        # 실제로 모델에 보내는 입력 기준이므로 예산을 바꾸면 새로 처리됨
+        return LLMResponseCache.make_key(self.model_name, ARTICLE_PROMPT_VERSION,
+                                         f"{article.title}\n{self._prompt_description(article)}")
+
+    def _apply_result(self, article: Article, result: Dict[str, Any]) -> None:
+        article.korean_title = result['korean_title']
+        article.summary = result['summary']
+        article.tags = result['tags']
+
+    def _load_cached_article(self, article: Article) -> bool:
+        """모델 호출 없이 얻을 수 있는 결과가 있으면 기사에 반영하고 True를 반환합니다. (LLM 캐시, 번역 메모리 순서)"""
+        result = self.cache.get(self._article_cache_key(article)) if self.cache else None
+        if result is None and self.translation_memory:
+            result = self.translation_memory.lookup(article.title, article.description or '')
+        if result is None:
+            return False
+        self._apply_result(article, result)
+        return True
+
+    def _store_article_result(self, article: Article, result: Dict[str, Any]) -> None:
+        if self.cache:
+            self.cache.set(self._article_cache_key(article), result)
+        if self.translation_memory:
+            self.translation_memory.add(article.title, article.description or '', result)
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """LLM 응답 캐시의 적중 통계를 반환합니다."""
+        return self.cache.get_stats() if self.cache else None
+
+    def process_articles(self, articles: List[Article]) -> List[Article]:
+        """여러 기사를 병렬로 처리하고 입력 순서대로 반환합니다. 처리에 실패한 기사는 원문 그대로 둡니다.
+
+        캐시에 결과가 있는 기사는 모델을 호출하지 않으며, batch_token_budget이 설정되어 있으면
+        나머지 기사를 하나의 요청으로 묶어 처리합니다.
+        """
+        logger.info(f"{len(articles)}개 뉴스의 AI 처리를 시작합니다 (동시 처리 {self.executor.max_workers}개)...")
+
+        pending = [article for article in articles if not self._load_cached_article(article)]
+        if len(pending) < len(articles):
+            logger.info(f"LLM 캐시, 번역 메모리로 {len(articles) - len(pending)}개 뉴스를 모델 호출 없이 처리했습니다.")
+
+        if pending and self._out_of_time():
+            self._apply_raw_fallback(pending)
+        elif self.batch_token_budget > 0:
+            batches = self._make_batches(pending)
+            logger.info(f"{len(pending)}개 뉴스를 {len(batches)}개의 배치 요청으로 묶었습니다.")
+            self.executor.map(self._process_batch, batches)
+        else:
+            def process(article: Article) -> Article:
+                try:
+                    return self._process_article_uncached(article)
+                except AIProcessingError as e:
+                    logger.error(f"뉴스 처리 중 오류: {e}")
+                    return article
+
+            self.executor.map(process, pending)
+
+        if self.cache:
+            stats = self.cache.get_stats()
+            logger.info(f"LLM 캐시 적중률: {stats['hit_rate']:.0%} (적중 {stats['hits']}, 누락 {stats['misses']})")
+        if self.translation_memory:
+            stats = self.translation_memory.get_stats()
+            logger.info(f"번역 메모리 적중률: {stats['hit_rate']:.0%} "
+                        f"(정확 {stats['exact_hits']}, 유사 {stats['fuzzy_hits']}, 누락 {stats['misses']})")
+        return articles
+
+    def _make_batches(self, articles: List[Article]) -> List[List[Article]]:
+        """토큰 예산과 최대 기사 수를 넘지 않도록 기사를 순서대로 묶습니다."""
+        batches: List[List[Article]] = []
+        current: List[Article] = []
+        current_tokens = 0
+        for article in articles:
+            tokens = estimate_tokens(f"{article.title}\n{self._prompt_description(article)}")
+            if current and (current_tokens + tokens > self.batch_token_budget
+                            or len(current) >= self.batch_max_articles):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(article)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _process_batch(self, batch: List[Article]) -> List[Article]:
+        """기사 묶음을 한 번의 요청으로 처리합니다.
+
+        항목별로 응답을 검증하여 유효한 결과만 반영하고, 응답 전체가 잘못되었으면 묶음을 반으로
+        나누어 다시 시도합니다. 기사 하나만 남으면 단건 처리로 넘어갑니다.
+        재시도 후에도 남은 호출 오류(429/5xx, 연결 오류 등)는 나누어도 요청만 늘어나므로
+        묶음 전체를 실패 기본값으로 처리합니다.
+        """
+        if len(batch) == 1:
+            return [self._process_article_uncached(batch[0])]
+
+        try:
+            results = self._request_batch(batch)
+        except DeadlineExceededError:
+            self._apply_raw_fallback(batch)
+            return batch
+        except AIBackendError as e:
+            logger.error(f"배치 처리 중 AI 모델 호출 오류 발생 ({len(batch)}개): {e}")
+            self._apply_failure_defaults(batch)
+            return batch
+        except (json.JSONDecodeError, AIProcessingError) as e:
+            logger.warning(f"배치 처리 응답이 올바르지 않습니다 ({len(batch)}개): {e}")
+            results = {}
+        except Exception as e:
+            logger.error(f"배치 처리 중 AI 모델 호출 오류 발생 ({len(batch)}개): {e}")
+            self._apply_failure_defaults(batch)
+            return batch
+
+        failed = []
+        for index, article in enumerate(batch):
+            result = results.get(index)
+            if result is None:
+                failed.append(article)
+                continue
+            self._apply_result(article, result)
+            self._store_article_result(article, result)
+
+        if not failed:
+            logger.info(f"배치 처리 완료 ({len(batch)}개).")
+        elif len(failed) == len(batch):
+            middle = len(batch) // 2
+            logger.info(f"배치를 {middle}개와 {len(batch) - middle}개로 나누어 다시 시도합니다.")
+            self._process_batch(batch[:middle])
+            self._process_batch(batch[middle:])
+        else:
+            logger.info(f"배치 중 {len(failed)}개 항목이 누락되어 다시 요청합니다.")
+            self._process_batch(failed)
+        return batch
+
+    def _request_batch(self, batch: List[Article]) -> Dict[int, Dict[str, Any]]:
+        """배치 프롬프트를 보내고 항목별로 검증된 결과를 {기사 번호: 결과} 형태로 반환합니다."""
+        articles_text = "\n\n".join(
+            f"[id: {index}]\nOriginal Title: {article.title}\nArticle Content: {self._prompt_description(article)}"
+            for index, article in enumerate(batch)
+        )
+        prompt = f"""
+        Analyze each of the following news articles and respond with a JSON array only.
+        The array must contain exactly one object per article, and each object must contain four fields: 'id', 'korean_title', 'summary', and 'tags'.
+        1.  'id': The id number of the article as given below.
+        2.  'korean_title': Translate the original English title into natural Korean. If the original title is already in Korean, copy it unchanged.
+        3.  'summary': Summarize the article's content in Korean. The summary should be concise and easy for a general audience to understand.
+            If the article content is empty, write one sentence based only on the title without adding facts.
+        4.  'tags': Extract 2-3 most relevant keywords (tags) from the article in Korean. The tags should be provided as a list of strings.
+
+        {articles_text}
+        """
+
+        response_text = self._generate(prompt, kind='batch')
+        json_text = response_text.strip().replace("```json", "").replace("```", "")
+        items = json.loads(json_text)
+        if isinstance(items, dict):
+            items = items.get('articles', [])
+        if not isinstance(items, list):
+            raise AIProcessingError("배치 응답이 JSON 배열이 아닙니다.")
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get('id'))
+            except (TypeError, ValueError):
+                continue
+            korean_title, summary, tags = item.get('korean_title'), item.get('summary'), item.get('tags')
+            if not (0 <= index < len(batch)) or index in results:
+                continue
+            if is_korean_text(batch[index].title):
+                # 한국어 제목은 번역하지 않고 원문 그대로 둠
+                korean_title = batch[index].title
+            if not isinstance(korean_title, str) or not korean_title.strip():
+                continue
+            if not isinstance(summary, str) or not summary.strip():
+                continue
+            if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+                continue
+            results[index] = {'korean_title': korean_title, 'summary': summary, 'tags': tags}
+        return results
 
     def process_article(self, article: Article) -> Article:
         """뉴스 기사를 AI로 처리합니다: 제목 번역, 요약, 태그 추출."""
+        if self._load_cached_article(article):
+            logger.info(f"'{article.title}' 뉴스를 저장된 결과로 처리했습니다.")
+            return article
+        return self._process_article_uncached(article)
+
+    def _process_article_uncached(self, article: Article) -> Article:
         logger.info(f"'{article.title}' 뉴스 처리 시작...")
 
-        prompt = f"""
+        korean = is_korean_text(article.title)
+        if korean:
+            # 이미 한국어인 기사는 번역 없이 요약과 태그만 요청하고 제목은 원문 그대로 씀
+            prompt = f"""
+        Analyze the following Korean news article and provide a response in JSON format.
+        The JSON object must contain two fields: 'summary' and 'tags'.
+        1.  'summary': Summarize the article's content in Korean. The summary should be concise and easy for a general audience to understand.
+            If the article content is empty, write one sentence based only on the title without adding facts.
+        2.  'tags': Extract 2-3 most relevant keywords (tags) from the article in Korean. The tags should be provided as a list of strings.
+
+        Original Title: {article.title}
+        Article Content: {self._prompt_description(article)}
+        """
+        else:
+            prompt = f"""
         Analyze the following news article and provide a response in JSON format.
         The JSON object must contain three fields: 'korean_title', 'summary', and 'tags'.
         1.  'korean_title': Translate the original English title into natural Korean.
@@ -26,32 +320,82 @@ class AIService:
         3.  'tags': Extract 2-3 most relevant keywords (tags) from the article in Korean. The tags should be provided as a list of strings.
 
         Original Title: {article.title}
-        Article Content: {article.description}
+        Article Content: {self._prompt_description(article)}
         """
 
         try:
-            response = self.model.generate_content(prompt)
-            json_text = response.text.strip().replace("```json", "").replace("```", "")
+            response_text = self._generate(prompt)
+            json_text = response_text.strip().replace("```json", "").replace("```", "")
             result = json.loads(json_text)
+            if korean:
+                result['korean_title'] = article.title
 
             # Article 객체 업데이트
             article.korean_title = result.get('korean_title', article.title)
             article.summary = result.get('summary', '요약 생성에 실패했습니다.')
             article.tags = result.get('tags', [])
+            if 'korean_title' in result and 'summary' in result:
+                self._store_article_result(article, {
+                    'korean_title': article.korean_title,
+                    'summary': article.summary,
+                    'tags': article.tags
+                })
 
             logger.info("뉴스 처리 완료.")
             return article
 
+        except DeadlineExceededError:
+            self._apply_raw_fallback([article])
+            return article
         except (Exception, json.JSONDecodeError) as e:
-            logger.error(f"Gemini API 호출 또는 JSON 파싱 중 오류 발생: {e}")
-            # 기본값으로 설정
-            article.korean_title = article.title
-            article.summary = "요약 생성에 실패했습니다."
-            article.tags = []
+            logger.error(f"AI 모델 호출 또는 JSON 파싱 중 오류 발생: {e}")
+            self._apply_failure_defaults([article])
             return article
 
+    def name_categories(self, term_groups: List[List[str]]) -> List[str]:
+        """카테고리별 대표 단어 목록을 받아 모델로 짧은 한국어 카테고리 이름을 만듭니다."""
+        groups_text = "\n".join(f"{i}: {', '.join(terms)}" for i, terms in enumerate(term_groups))
+        cache_key = LLMResponseCache.make_key(self.model_name, CATEGORY_NAMING_PROMPT_VERSION, groups_text)
+        if self.cache:
+            cached_names = self.cache.get(cache_key)
+            if cached_names is not None:
+                return cached_names
+
+        prompt = f"""
+        You are an expert AI news editor. Each line below lists the key terms of one news category.
+        Create a short, natural category name in Korean (2-6 words) for each line.
+        Respond with a JSON array of strings only, in the same order as the lines.
+
+        {groups_text}
+        """
+
+        response_text = self._generate(prompt, kind='category_naming')
+        json_text = response_text.strip().replace("```json", "").replace("```", "")
+        names = json.loads(json_text)
+        if (not isinstance(names, list) or len(names) != len(term_groups)
+                or not all(isinstance(name, str) and name.strip() for name in names)):
+            raise AIProcessingError("카테고리 이름 응답 형식이 올바르지 않습니다.")
+        names = [name.strip() for name in names]
+        if self.cache:
+            self.cache.set(cache_key, names)
+        return names
+
+    def _categorize_locally(self, articles: List[Article]) -> List[Dict[str, Any]]:
+        namer = self.name_categories if self.llm_category_naming and not self._out_of_time() else None
+        return self.categorizer.categorize(articles, namer=namer)
+
     def categorize_articles(self, articles: List[Article]) -> List[Dict[str, Any]]:
-        """뉴스 기사들을 카테고리별로 분류합니다."""
+        """뉴스 기사들을 카테고리별로 분류합니다.
+
+        categorizer_mode가 'local'이면 로컬 TF-IDF/k-means 분류기를 사용하고, 'llm'이면 모델에 분류를
+        맡기되 실패하면 로컬 분류기로 대신합니다.
+        """
+        if self.categorizer_mode == 'local':
+            return self._categorize_locally(articles)
+        if self._out_of_time():
+            self.budget.degrade("카테고리 분류", "시간 예산 소진으로 LLM 대신 로컬 분류 사용")
+            return self._categorize_locally(articles)
+
         logger.info("전체 뉴스를 기반으로 동적 카테고리 생성을 시작합니다...")
 
         # Gemini에 전달할 뉴스 목록 생성
@@ -60,6 +404,14 @@ class AIService:
             tags_str = ', '.join(article.tags) if article.tags else '태그 없음'
             news_list_for_prompt.append(f"{i}: {article.korean_title} (Tags: {tags_str})")
 
+        cache_key = LLMResponseCache.make_key(self.model_name, CATEGORIZE_PROMPT_VERSION,
+                                              "\n".join(news_list_for_prompt))
+        if self.cache:
+            cached_categories = self.cache.get(cache_key)
+            if cached_categories is not None:
+                logger.info(f"카테고리 분류 결과를 캐시에서 불러왔습니다: {[cat['category_name'] for cat in cached_categories]}")
+                return cached_categories
+
         prompt = f"""
         You are an expert AI news editor. Based on the following list of news articles, please group them into 3-7 relevant categories.
 
@@ -77,8 +429,8 @@ class AIService:
         """
 
         try:
-            response = self.model.generate_content(prompt)
-            json_text = response.text.strip().replace("```json", "").replace("```", "")
+            response_text = self._generate(prompt, kind='categorize')
+            json_text = response_text.strip().replace("```json", "").replace("```", "")
             categorization_result = json.loads(json_text)
             categories = categorization_result.get('categories', [])
 
@@ -99,9 +451,13 @@ class AIService:
 
             category_names = [cat['category_name'] for cat in categories]
             logger.info(f"동적 카테고리 생성 완료: {category_names}")
+            if self.cache and categories:
+                self.cache.set(cache_key, categories)
             return categories
 
+        except DeadlineExceededError:
+            self.budget.degrade("카테고리 분류", "시간 예산 소진으로 LLM 대신 로컬 분류 사용")
+            return self._categorize_locally(articles)
         except (Exception, json.JSONDecodeError) as e:
-            logger.error(f"카테고리 생성 중 오류 발생: {e}")
-            # 오류 발생 시, 모든 기사를 '주요 뉴스'라는 단일 카테고리로 묶음
-            return [{"category_name": "주요 뉴스", "articles": list(range(len(articles)))}]
\ No newline at end of file
+            logger.error(f"카테고리 생성 중 오류 발생, 로컬 분류기로 대신합니다: {e}")
+            return self._categorize_locally(articles)
\ No newline at end of file
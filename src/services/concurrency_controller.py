@@ -0,0 +1,198 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 서버가 과부하를 알리는 상태 코드: 이 응답을 받으면 동시 처리 수를 줄입니다.
+OVERLOAD_STATUS_CODES = {429, 503}
+
+class AdaptiveConcurrencyController:
+    """AIMD(가산 증가, 승산 감소) 방식으로 모델 호출의 동시 처리 수를 조절하는 컨트롤러
+
+    지연 시간이 기준치 안에 있고 오류가 없으면 동시 처리 수만큼의 호출이 성공할 때마다 한도를 1씩 늘리고,
+    429/503/타임아웃을 받거나 최근 지연 시간이 기준 지연 시간의 latency_tolerance배를 넘으면 한도를
+    decrease_factor배로 줄입니다. 배치 요청과 단건 요청의 지연 차이로 오판하지 않도록 기본 허용 배수는 넉넉하게 둡니다.
+    같은 혼잡에 대해 여러 번 줄이지 않도록 마지막으로 줄인 뒤에 시작된 호출의 신호만 반영하며,
+    Retry-After를 받으면 그 시간 동안 새 호출을 보내지 않습니다.
+
+    학습한 한도는 state_path(JSON)에 state_key별로 저장하여 다음 실행의 시작값으로 사용합니다.
+    """
+
+    # 지연 시간 지수 이동 평균의 가중치 (최근 지연, 기준 지연)
+    RECENT_ALPHA = 0.2
+    BASELINE_ALPHA = 0.01
+    # 지연 시간으로 판단하기 전에 필요한 최소 표본 수
+    MIN_LATENCY_SAMPLES = 5
+    # 처리량(RPM) 계산 구간(초)
+    RPM_WINDOW = 60.0
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 16,
+                 decrease_factor: float = 0.5, latency_tolerance: float = 3.0,
+                 state_path: Optional[str] = None, state_key: str = "default"):
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.state_path = state_path
+        self.state_key = state_key
+
+        saved_limit = self._load_state()
+        self._limit = float(self._clamp(saved_limit if saved_limit is not None else initial_limit))
+        self._in_flight = 0
+        self._generation = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._recent_latency: Optional[float] = None
+        self._baseline_latency: Optional[float] = None
+        self._latency_samples = 0
+        self._completions: Deque[float] = deque()
+        self._started_at = time.monotonic()
+        self._condition = threading.Condition()
+        if saved_limit is not None:
+            logger.info(f"저장된 AI 동시 처리 한도 {self.limit}개로 시작합니다.")
+
+    def _clamp(self, value: float) -> float:
+        return min(self.max_limit, max(self.min_limit, value))
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 처리 한도"""
+        return int(self._limit)
+
+    def acquire(self) -> int:
+        """동시 처리 한도에 여유가 생기고 Retry-After 대기가 끝날 때까지 기다린 뒤 호출 세대 번호를 반환합니다."""
+        with self._condition:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._in_flight < self.limit:
+                    break
+                self._condition.wait(timeout=wait if wait > 0 else None)
+            self._in_flight += 1
+            return self._generation
+
+    def record_success(self, generation: int, latency: float) -> None:
+        """성공한 호출의 지연 시간을 반영합니다."""
+        with self._condition:
+            self._in_flight -= 1
+            self._completions.append(time.monotonic())
+            self._observe_latency(latency)
+            if self._latency_rising():
+                self._decrease(generation, f"지연 시간 증가 ({self._recent_latency:.2f}초)")
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self._in_flight + 1 >= self.limit:
+                    # 한도를 모두 사용하는 중에 한 바퀴(한도만큼의 호출)가 성공하면 1 늘림
+                    self._set_limit(self._limit + 1)
+                    self._successes = 0
+            self._condition.notify_all()
+
+    def record_failure(self, generation: int, status_code: Optional[int] = None, timed_out: bool = False,
+                       retry_after: Optional[float] = None) -> None:
+        """실패한 호출을 반영합니다. 과부하 응답과 타임아웃만 한도를 줄이고, Retry-After 동안은 호출을 멈춥니다."""
+        with self._condition:
+            self._in_flight -= 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            if timed_out:
+                self._decrease(generation, "타임아웃")
+            elif status_code in OVERLOAD_STATUS_CODES:
+                self._decrease(generation, f"과부하 응답 ({status_code})")
+            self._condition.notify_all()
+
+    def _observe_latency(self, latency: float) -> None:
+        self._latency_samples += 1
+        if self._recent_latency is None:
+            self._recent_latency = self._baseline_latency = latency
+            return
+        self._recent_latency += self.RECENT_ALPHA * (latency - self._recent_latency)
+        # 기준 지연은 더 빠른 응답에는 바로 따라가고, 느려지는 쪽으로는 천천히 따라감
+        if latency < self._baseline_latency:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency += self.BASELINE_ALPHA * (latency - self._baseline_latency)
+
+    def _latency_rising(self) -> bool:
+        return (self._latency_samples >= self.MIN_LATENCY_SAMPLES
+                and self._recent_latency > self._baseline_latency * self.latency_tolerance)
+
+    def _decrease(self, generation: int, reason: str) -> None:
+        if generation != self._generation:
+            return  # 이미 줄인 뒤에 끝난 이전 세대 호출의 신호는 무시
+        self._generation += 1
+        self._successes = 0
+        # 지연 판단은 줄인 한도에서 새로 측정한 값으로 다시 시작
+        self._recent_latency = self._baseline_latency
+        self._latency_samples = 0
+        self._set_limit(self._limit * self.decrease_factor)
+        logger.warning(f"AI 동시 처리 한도를 {self.limit}개로 줄입니다: {reason}")
+
+    def _set_limit(self, value: float) -> None:
+        previous = self.limit
+        self._limit = self._clamp(value)
+        if self.limit != previous:
+            self._save_state()
+
+    def observed_rpm(self) -> float:
+        """최근 RPM_WINDOW초 동안 성공한 호출로 계산한 분당 처리량"""
+        with self._condition:
+            now = time.monotonic()
+            while self._completions and self._completions[0] < now - self.RPM_WINDOW:
+                self._completions.popleft()
+            window = min(self.RPM_WINDOW, max(now - self._started_at, 1.0))
+            return len(self._completions) * 60.0 / window
+
+    def get_stats(self) -> Dict[str, Any]:
+        """현재 동시 처리 한도, 진행 중인 호출 수, 관측 RPM, 최근/기준 지연 시간을 반환합니다."""
+        rpm = self.observed_rpm()
+        with self._condition:
+            return {
+                'concurrency': self.limit,
+                'in_flight': self._in_flight,
+                'observed_rpm': rpm,
+                'recent_latency': self._recent_latency,
+                'baseline_latency': self._baseline_latency
+            }
+
+    def _load_state(self) -> Optional[float]:
+        if not self.state_path:
+            return None
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f).get(self.state_key)
+            return float(entry['limit']) if entry else None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"AI 동시 처리 한도 기록을 읽지 못했습니다: {e}")
+            return None
+
+    def _save_state(self) -> None:
+        """학습한 한도를 저장합니다. 저장에 실패해도 호출에는 영향을 주지 않습니다."""
+        if not self.state_path:
+            return
+        try:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (FileNotFoundError, ValueError):
+                state = {}
+            state[self.state_key] = {'limit': self._limit, 'updated_at': time.time()}
+            tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"AI 동시 처리 한도 기록을 저장하지 못했습니다: {e}")
+
+    def save(self) -> None:
+        """현재 한도를 저장합니다."""
+        with self._condition:
+            self._save_state()
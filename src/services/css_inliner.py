@@ -0,0 +1,592 @@
+import html
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from premailer import Premailer
+from premailer.merge_style import csstext_to_pairs
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+# 내용을 태그로 해석하지 않는 요소: 닫는 태그까지 그대로 통과시킴
+_RAW_TEXT_ELEMENTS = frozenset(['script', 'style', 'title', 'textarea'])
+# 열린 <p>를 자동으로 닫는 블록 요소 (lxml HTML 파서와 같은 트리를 만들기 위함)
+_P_CLOSERS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'div', 'dl', 'fieldset', 'footer', 'form',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'menu', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul'
+])
+
+_TOKEN_RE = re.compile(
+    r'<(?:!--.*?-->|![^>]*>|\?[^>]*>|(/?)([A-Za-z][A-Za-z0-9:-]*)((?:[^>"\']+|"[^"]*"|\'[^\']*\')*)>)',
+    re.DOTALL
+)
+_ATTR_RE = re.compile(r'([^\s/>"\'=]+)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s>]+))?')
+_SHEET_RE = re.compile(
+    r'<!--.*?-->|<(style)\b((?:[^>"\']+|"[^"]*"|\'[^\']*\')*)>(.*?)</style\s*>|<(link)\b((?:[^>"\']+|"[^"]*"|\'[^\']*\')*)>',
+    re.IGNORECASE | re.DOTALL
+)
+_COMBINATOR_RE = re.compile(r'\s*>\s*')
+_COMPOUND_RE = re.compile(r'^([A-Za-z][\w-]*)?((?:[.#][\w-]+)*)((?::(?:first|last)-child)*)$')
+# 문서 안에서 미리 만든 HTML 조각이 들어갈 자리를 표시하는 주석
+FRAGMENT_MARKER = '<!--css-inliner-fragment:{}-->'
+_FRAGMENT_MARKER_PREFIX = FRAGMENT_MARKER.split('{}')[0]
+
+_IMPORTANT_RE = re.compile(r'\s*!important')
+_SHORT_COLOR_RE = re.compile(r'^#([0-9a-f])([0-9a-f])([0-9a-f])$', re.IGNORECASE)
+
+class _Compound:
+    """공백이나 >로 나뉜 선택자 한 덩어리 (태그, 클래스, 아이디, :first-child/:last-child)"""
+    __slots__ = ('tag', 'classes', 'id', 'first_child', 'last_child')
+
+    def __init__(self, tag, classes, element_id, first_child, last_child):
+        self.tag = tag
+        self.classes = classes
+        self.id = element_id
+        self.first_child = first_child
+        self.last_child = last_child
+
+    def matches(self, node: '_Node') -> bool:
+        return ((self.tag is None or self.tag == node.tag)
+                and (self.id is None or self.id == node.id)
+                and self.classes <= node.classes
+                and (not self.first_child or node.is_first))
+
+class _Rule:
+    """인라인할 규칙 하나: premailer와 같은 우선순위, 오른쪽부터의 선택자 사슬, 선언 목록"""
+    __slots__ = ('specificity', 'subject', 'chain', 'pairs')
+
+    def __init__(self, specificity, subject, chain, pairs):
+        self.specificity = specificity
+        self.subject = subject
+        self.chain = chain
+        self.pairs = pairs
+
+    def matches_ancestors(self, node: '_Node') -> bool:
+        return _match_chain(self.chain, 0, node)
+
+def _match_chain(chain: List[Tuple[str, _Compound]], index: int, node: '_Node') -> bool:
+    if index == len(chain):
+        return True
+    combinator, compound = chain[index]
+    ancestor = node.parent
+    while ancestor is not None and ancestor.tag is not None:
+        if compound.matches(ancestor) and _match_chain(chain, index + 1, ancestor):
+            return True
+        if combinator == '>':
+            return False
+        ancestor = ancestor.parent
+    return False
+
+def _parse_compound(text: str) -> Optional[_Compound]:
+    match = _COMPOUND_RE.match(text)
+    if not match or not text:
+        return None
+    tag, simple, pseudo = match.groups()
+    classes = frozenset(part[1:] for part in re.findall(r'[.#][\w-]+', simple) if part[0] == '.')
+    ids = [part[1:] for part in re.findall(r'[.#][\w-]+', simple) if part[0] == '#']
+    if len(ids) > 1:
+        return None
+    return _Compound(tag.lower() if tag else None, classes, ids[0] if ids else None,
+                     ':first-child' in pseudo, ':last-child' in pseudo)
+
+def _compile_selector(selector: str) -> Optional[Tuple[_Compound, List[Tuple[str, _Compound]]]]:
+    """선택자를 (대상 덩어리, 조상 사슬)로 컴파일합니다. 지원하지 않는 문법이면 None을 반환합니다."""
+    tokens = _COMBINATOR_RE.sub(' > ', selector.strip()).split()
+    compounds: List[_Compound] = []
+    combinators: List[str] = []
+    expect_compound = True
+    for token in tokens:
+        if token == '>':
+            if expect_compound:
+                return None
+            combinators[-1] = '>'
+            expect_compound = True
+            continue
+        compound = _parse_compound(token)
+        if compound is None:
+            return None
+        compounds.append(compound)
+        combinators.append(' ')
+        expect_compound = False
+    if not compounds or expect_compound:
+        return None
+    # :last-child는 대상 요소에서만 지원 (조상의 마지막 자식 여부는 스트리밍 중 알 수 없음)
+    if any(compound.last_child for compound in compounds[:-1]):
+        return None
+    # combinators[i]는 compounds[i]와 그 오른쪽 덩어리 사이의 결합자
+    chain = [(combinators[i], compounds[i]) for i in range(len(compounds) - 2, -1, -1)]
+    return compounds[-1], chain
+
+class _Node:
+    __slots__ = ('tag', 'classes', 'id', 'parent', 'is_first', 'context', 'child_count', 'pending', 'piece', 'start',
+                 'fragment')
+
+    def __init__(self, tag, classes, element_id, parent, is_first, context):
+        self.tag = tag
+        self.classes = classes
+        self.id = element_id
+        self.parent = parent
+        self.is_first = is_first
+        # 조상 사슬(태그, 클래스, 아이디, 첫 자식 여부)이 같은 요소는 같은 규칙에 맞으므로 번호로 묶음
+        self.context = context
+        self.child_count = 0
+        # :last-child 규칙 적용 여부가 아직 정해지지 않은 마지막 자식
+        self.pending: Optional['_Node'] = None
+        self.piece = -1
+        self.start: Optional['_StartTag'] = None
+        # 조각 자리이면 인라인하기 전의 조각 HTML
+        self.fragment: Optional[str] = None
+
+class _StartTag:
+    """조상 사슬 안에서 시작 태그 하나를 해석한 결과: 인라인한 태그와, 마지막 자식일 때 달라지면 그 태그"""
+    __slots__ = ('classes', 'id', 'context', 'text', 'last_child_text')
+
+    def __init__(self, classes, element_id, context, text, last_child_text):
+        self.classes = classes
+        self.id = element_id
+        self.context = context
+        self.text = text
+        self.last_child_text = last_child_text
+
+class _CompiledSheets:
+    """한 문서의 스타일시트들을 컴파일한 결과: 대상 덩어리별 규칙 색인과 스타일시트별 남는 CSS
+
+    조상 사슬별로 맞는 규칙과 (조상 사슬, 첫 자식 여부, 시작 태그)별로 인라인한 시작 태그를 기억하므로
+    같은 구조가 반복되는 기사 목록은 처음 한 번만 선택자를 맞추고 스타일을 합칩니다.
+    """
+
+    # 시작 태그와 조각 캐시의 최대 항목 수 (기사 링크처럼 매번 다른 태그가 쌓이지 않도록 넘으면 비움)
+    MAX_CACHED_TAGS = 20000
+    MAX_CACHED_FRAGMENTS = 5000
+
+    def __init__(self, rules: List[_Rule], leftovers: List[str]):
+        self.leftovers = leftovers
+        self.by_id: Dict[str, List[_Rule]] = {}
+        self.by_class: Dict[str, List[_Rule]] = {}
+        self.by_tag: Dict[str, List[_Rule]] = {}
+        self.universal: List[_Rule] = []
+        for rule in rules:
+            subject = rule.subject
+            if subject.id is not None:
+                self.by_id.setdefault(subject.id, []).append(rule)
+            elif subject.classes:
+                self.by_class.setdefault(min(subject.classes), []).append(rule)
+            elif subject.tag is not None:
+                self.by_tag.setdefault(subject.tag, []).append(rule)
+            else:
+                self.universal.append(rule)
+        self._contexts: Dict[tuple, Tuple[int, List[_Rule], List[_Rule]]] = {}
+        self._start_tags: Dict[Tuple[int, bool, str], _StartTag] = {}
+        self._fragments: Dict[Tuple[str, int, bool, bool], str] = {}
+        self._lock = threading.Lock()
+
+    def inline_fragment(self, fragment: str, parent: _Node, is_first: bool, is_last: bool) -> str:
+        """parent 아래 자리에 들어갈 조각을 인라인합니다. 같은 조각, 같은 조상 사슬과 위치이면 캐시에서 돌려줍니다."""
+        key = (fragment, parent.context, is_first, is_last)
+        inlined = self._fragments.get(key)
+        if inlined is None:
+            root = _Node(parent.tag, parent.classes, parent.id, parent.parent, parent.is_first, parent.context)
+            root.child_count = 0 if is_first else 1
+            inlined = _InlinePass(self, fragment, root=root, root_is_last=is_last).run()
+            if len(self._fragments) >= self.MAX_CACHED_FRAGMENTS:
+                self._fragments.clear()
+            self._fragments[key] = inlined
+        return inlined
+
+    def start_tag(self, tag: str, text: str, attrs_text: str, parent: _Node, is_first: bool) -> _StartTag:
+        """부모 아래에 열린 시작 태그를 해석하고 맞는 규칙을 인라인한 태그를 만듭니다."""
+        key = (parent.context, is_first, text)
+        start = self._start_tags.get(key)
+        if start is not None:
+            return start
+        with self._lock:
+            return self._new_start_tag(key, tag, text, attrs_text, parent, is_first)
+
+    def _new_start_tag(self, key: Tuple[int, bool, str], tag: str, text: str, attrs_text: str,
+                       parent: _Node, is_first: bool) -> _StartTag:
+        attrs = _parse_attrs(attrs_text)
+        classes = frozenset()
+        element_id = None
+        for name, raw in attrs:
+            if name == 'class':
+                classes = frozenset(_attr_value(raw).split())
+            elif name == 'id':
+                element_id = _attr_value(raw)
+        node = _Node(tag, classes, element_id, parent, is_first, 0)
+        context, rules, last_child_rules = self._match(node)
+        inlined = self._rewrite(tag, text, attrs, rules) if rules else text
+        last_child_text = None
+        if len(last_child_rules) != len(rules):
+            last_child_text = self._rewrite(tag, text, attrs, last_child_rules)
+        start = _StartTag(classes, element_id, context, inlined, last_child_text)
+
+        if len(self._start_tags) >= self.MAX_CACHED_TAGS:
+            self._start_tags.clear()
+        self._start_tags[key] = start
+        return start
+
+    def _match(self, node: _Node) -> Tuple[int, List[_Rule], List[_Rule]]:
+        """요소의 (조상 사슬 번호, 맞는 규칙, 마지막 자식일 때 맞는 규칙)을 우선순위 순으로 반환합니다."""
+        key = (node.parent.context, node.tag, node.classes, node.id, node.is_first)
+        context = self._contexts.get(key)
+        if context is not None:
+            return context
+        rules = list(self.universal)
+        rules.extend(self.by_tag.get(node.tag, ()))
+        if node.id is not None:
+            rules.extend(self.by_id.get(node.id, ()))
+        for class_name in node.classes:
+            rules.extend(self.by_class.get(class_name, ()))
+        rules = [rule for rule in rules if rule.subject.matches(node) and rule.matches_ancestors(node)]
+        rules.sort(key=lambda rule: rule.specificity)
+        context = (len(self._contexts) + 1, [rule for rule in rules if not rule.subject.last_child], rules)
+        self._contexts[key] = context
+        return context
+
+    @staticmethod
+    def _rewrite(tag: str, text: str, attrs: List[Tuple[str, Optional[str]]], rules: List[_Rule]) -> str:
+        """premailer처럼 규칙의 선언을 우선순위 순으로 합친 뒤 기존 style을 덮어써 시작 태그를 다시 씁니다."""
+        merged: Dict[str, str] = {}
+        for rule in rules:
+            for name, value in rule.pairs:
+                merged[name] = value
+        inline_style = _attr_value(next((raw for name, raw in attrs if name == 'style'), None))
+        if inline_style:
+            for name, value in csstext_to_pairs(inline_style):
+                merged[name] = value
+        final_style = '; '.join(f'{name}:{value}' for name, value in merged.items())
+
+        new_values = {'style': final_style}
+        new_values.update(_basic_html_attributes(final_style))
+        parts = []
+        for name, raw in attrs:
+            if name in new_values:
+                parts.append(f' {name}={_quote(new_values.pop(name))}')
+            else:
+                parts.append(f' {name}' if raw is None else f' {name}={raw}')
+        parts.extend(f' {name}={_quote(value)}' for name, value in new_values.items())
+        return f'<{tag}{"".join(parts)}>'
+
+def _parse_attrs(text: str) -> List[Tuple[str, Optional[str]]]:
+    if not text.strip(' \t\n\r/'):
+        return []
+    return [(name.lower(), raw or None) for name, raw in _ATTR_RE.findall(text)]
+
+def _attr_value(raw: Optional[str]) -> str:
+    if not raw:
+        return ''
+    if raw[0] in '"\'' and raw[-1] == raw[0] and len(raw) >= 2:
+        raw = raw[1:-1]
+    return html.unescape(raw)
+
+def _quote(value: str) -> str:
+    value = value.replace('&', '&amp;')
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    return '"' + value.replace('"', '&quot;') + '"'
+
+def _basic_html_attributes(style: str) -> Dict[str, str]:
+    """premailer처럼 최종 style에서 align, valign, bgcolor, width, height 속성을 만듭니다."""
+    attributes: Dict[str, str] = {}
+    for declaration in style.split(';'):
+        parts = declaration.split(':')
+        if len(parts) != 2:
+            continue
+        key, value = parts[0].strip(), parts[1].strip()
+        if key == 'text-align':
+            attributes['align'] = value
+        elif key == 'vertical-align':
+            attributes['valign'] = value
+        elif key == 'background-color' and 'transparent' not in value.lower():
+            attributes['bgcolor'] = _SHORT_COLOR_RE.sub(r'#\1\1\2\2\3\3', value)
+        elif key in ('width', 'height'):
+            attributes[key] = value[:-2] if value.endswith('px') else value
+    return attributes
+
+class CSSInliner:
+    """스타일시트를 한 번만 파싱해 두고 이메일 HTML에 CSS를 한 번의 스트리밍 패스로 인라인하는 클래스
+
+    규칙의 우선순위, 선언 값, 남는 CSS(:hover, @media)는 premailer의 파서로 만들어 premailer.transform과
+    같은 결과를 내되, 렌더링마다 문서 전체를 lxml 트리로 파싱하고 선택자마다 트리를 다시 검색하는 대신
+    태그를 앞에서부터 한 번 훑으면서 조상 스택으로 선택자를 맞춥니다. 컴파일한 스타일시트는 CSS 내용별로 캐시합니다.
+
+    태그, 클래스, 아이디, 자손/자식 결합자, :first-child, 대상 요소의 :last-child만 지원하며,
+    그 밖의 선택자(속성 선택자, 형제 결합자, :nth-child 등)가 있거나 외부 스타일시트를 읽을 수 없으면
+    inline()이 None을 반환하므로 호출하는 쪽에서 premailer로 처리합니다.
+
+    premailer의 내부 메서드를 쓰므로 requirements.txt에서 검증한 버전으로 고정하며,
+    설치된 premailer에 그 메서드가 없으면 경고를 한 번 남기고 항상 premailer로 처리합니다.
+    """
+
+    # 결과가 premailer.transform과 같도록 빌려 쓰는 premailer 내부 메서드/속성
+    PREMAILER_INTERNALS = ('_load_external', '_parse_style_rules', '_css_rules_to_string', 'strip_important')
+
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+        self._premailer = Premailer(base_path=base_path, allow_loading_external_files=True)
+        missing = [name for name in self.PREMAILER_INTERNALS if not hasattr(self._premailer, name)]
+        self.available = not missing
+        if missing:
+            logger.warning(f"설치된 premailer에 {', '.join(missing)}이(가) 없어 컴파일한 CSS 인라이닝을 끄고 "
+                           f"premailer로 처리합니다. requirements.txt의 premailer 버전을 확인하세요.")
+        self._cache: Dict[Tuple[str, ...], Optional[_CompiledSheets]] = {}
+        self._lock = threading.Lock()
+
+    def _collect_sheets(self, document: str) -> Optional[List[Tuple[str, Any]]]:
+        """문서의 <style>과 <link rel="stylesheet">를 순서대로 찾아 (종류, CSS 내용)을 반환합니다."""
+        sheets = []
+        for match in _SHEET_RE.finditer(document):
+            if match.group(1):
+                attrs = dict(_parse_attrs(match.group(2)))
+                css_body = match.group(3)
+            elif match.group(4):
+                attrs = dict(_parse_attrs(match.group(5)))
+                if 'stylesheet' not in _attr_value(attrs.get('rel')).lower().split():
+                    continue
+                css_body = None
+            else:
+                continue
+            media = _attr_value(attrs.get('media'))
+            if media and media not in ('all', 'screen'):
+                continue
+            if 'data-premailer' in attrs:
+                return None
+            if css_body is None:
+                href = _attr_value(attrs.get('href'))
+                if href.startswith(('http:', 'https:', '//')):
+                    return None
+                css_body = self._premailer._load_external(href)
+            sheets.append(css_body)
+        return sheets
+
+    def _compile(self, sheets: List[str]) -> Optional[_CompiledSheets]:
+        rules: List[_Rule] = []
+        leftovers: List[str] = []
+        for index, css_body in enumerate(sheets):
+            these_rules, these_leftover = self._premailer._parse_style_rules(css_body, index)
+            for specificity, selector, bulk in these_rules:
+                compiled = _compile_selector(selector)
+                if compiled is None:
+                    logger.info(f"CSS 선택자 '{selector}'는 인라인 컴파일을 지원하지 않아 premailer로 처리합니다.")
+                    return None
+                subject, chain = compiled
+                rules.append(_Rule(specificity, subject, chain, csstext_to_pairs(bulk)))
+            leftover = self._premailer._css_rules_to_string(these_leftover) if these_leftover else ''
+            if self._premailer.strip_important:
+                leftover = _IMPORTANT_RE.sub('', leftover)
+            leftovers.append(leftover)
+        rules.sort(key=lambda rule: rule.specificity)
+        return _CompiledSheets(rules, leftovers)
+
+    def _get_compiled(self, sheets: List[str]) -> Optional[_CompiledSheets]:
+        key = tuple(sheets)
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = self._compile(sheets)
+            return self._cache[key]
+
+    def inline(self, document: str, fragments: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """CSS를 인라인한 HTML을 반환합니다. 컴파일로 처리할 수 없는 문서이면 None을 반환합니다.
+
+        fragments에 {키: 조각 HTML}을 넘기면 문서의 FRAGMENT_MARKER 자리에 조각을 인라인해 넣습니다.
+        조각은 그 자리의 조상 사슬과 형제 위치(:first-child/:last-child)를 기준으로 인라인하며,
+        같은 조각이 같은 자리 조건으로 다시 오면 인라인 결과를 재사용하므로 문서 조립은 문자열 이어 붙이기에 가깝습니다.
+        """
+        if not self.available:
+            return None
+        sheets = self._collect_sheets(document)
+        if sheets is None:
+            return None
+        compiled = self._get_compiled(sheets)
+        if compiled is None:
+            return None
+        return _InlinePass(compiled, document, fragments=fragments).run()
+
+class _InlinePass:
+    """문서 하나를 앞에서부터 한 번 훑으며 바뀌는 태그만 갈아 끼운 출력을 만드는 패스
+
+    바뀌지 않는 부분(텍스트, 닫는 태그, 스타일이 없는 태그)은 원문을 구간 단위로 그대로 복사합니다.
+    """
+
+    def __init__(self, compiled: _CompiledSheets, document: str, fragments: Optional[Dict[str, str]] = None,
+                 root: Optional[_Node] = None, root_is_last: bool = True):
+        self.compiled = compiled
+        self.document = document
+        self.fragments = fragments or {}
+        self.out: List[str] = []
+        # 원문에서 아직 출력으로 복사하지 않은 구간의 시작 위치
+        self.copied = 0
+        # 조각을 인라인할 때는 조각이 들어갈 자리의 부모에서 시작
+        self.is_fragment = root is not None
+        self.root_is_last = root_is_last
+        self.stack: List[_Node] = [root or _Node(None, frozenset(), None, None, False, 0)]
+        self.sheet_index = 0
+
+    def _replace(self, start: int, end: int, text: str) -> None:
+        """원문의 [start, end) 구간을 text로 바꿔 출력합니다."""
+        if self.copied < start:
+            self.out.append(self.document[self.copied:start])
+        self.out.append(text)
+        self.copied = end
+
+    def run(self) -> Optional[str]:
+        document = self.document
+        skip_until = 0
+        drop_tail = False
+        for match in _TOKEN_RE.finditer(document):
+            start = match.start()
+            if start < skip_until:
+                continue  # <title>, <script> 등의 내용
+            if drop_tail:
+                # 지운 <link>/<style> 뒤의 텍스트는 lxml의 remove()처럼 함께 지움
+                self.copied = start
+                drop_tail = False
+            tag_name = match.group(2)
+            if tag_name is None:
+                if self.fragments and match.group(0).startswith(_FRAGMENT_MARKER_PREFIX):
+                    self._fragment_slot(match)
+                continue  # 주석, doctype
+            tag = tag_name.lower()
+            if match.group(1):
+                self._end_tag(tag, start)
+                continue
+
+            attrs_text = match.group(3)
+            if tag in _RAW_TEXT_ELEMENTS:
+                close = re.compile(rf'</{tag}\s*>', re.IGNORECASE).search(document, match.end())
+                skip_until = close.end() if close else len(document)
+                if tag == 'style':
+                    drop_tail = self._style_element(match, skip_until)
+                else:
+                    self._start_tag(tag, match, attrs_text)
+                    self._close(self.stack.pop())
+                continue
+            if tag == 'link' and self._is_stylesheet_link(attrs_text):
+                drop_tail = self._link_element(match)
+                continue
+            self._start_tag(tag, match, attrs_text)
+            if tag in _VOID_ELEMENTS:
+                self._close(self.stack.pop())
+
+        while len(self.stack) > 1:
+            self._close(self.stack.pop())
+        root = self.stack.pop()
+        if root.pending is not None:
+            self._finalize(root.pending, self.root_is_last)
+        if not self.is_fragment and self.sheet_index != len(self.compiled.leftovers):
+            return None  # 미리 찾은 스타일시트와 어긋나면 premailer로 처리
+        if drop_tail:
+            self.copied = len(document)
+        self.out.append(document[self.copied:])
+        return ''.join(self.out)
+
+    @staticmethod
+    def _is_stylesheet_link(attrs_text: str) -> bool:
+        attrs = dict(_parse_attrs(attrs_text))
+        if 'stylesheet' not in _attr_value(attrs.get('rel')).lower().split():
+            return False
+        media = _attr_value(attrs.get('media'))
+        return not media or media in ('all', 'screen')
+
+    def _link_element(self, match: 're.Match') -> bool:
+        """<link rel="stylesheet">를 남는 CSS의 <style>로 바꾸거나 지웁니다. 뒤따르는 텍스트를 지울지 반환합니다."""
+        leftover = self._next_leftover()
+        self._replace(match.start(), match.end(), f'<style type="text/css">{leftover}</style>' if leftover else '')
+        if leftover:
+            self.stack[-1].child_count += 1
+        return True
+
+    def _style_element(self, match: 're.Match', end: int) -> bool:
+        """<style>의 내용을 남는 CSS로 바꾸고, 남는 CSS가 없으면 요소를 지웁니다. 뒤따르는 텍스트를 지울지 반환합니다."""
+        media = _attr_value(dict(_parse_attrs(match.group(3))).get('media'))
+        if media and media not in ('all', 'screen'):
+            self.stack[-1].child_count += 1
+            return False
+        leftover = self._next_leftover()
+        if not leftover:
+            self._replace(match.start(), end, '')
+            return True
+        self._replace(match.end(), end, f'{leftover}</style>')
+        self.stack[-1].child_count += 1
+        return False
+
+    def _next_leftover(self) -> str:
+        leftovers = self.compiled.leftovers
+        leftover = leftovers[self.sheet_index] if self.sheet_index < len(leftovers) else ''
+        self.sheet_index += 1
+        return leftover
+
+    def _start_tag(self, tag: str, match: 're.Match', attrs_text: str) -> None:
+        stack = self.stack
+        parent = stack[-1]
+        if parent.tag == 'p' and tag in _P_CLOSERS:
+            self._replace(match.start(), match.start(), '</p>')
+            self._close(stack.pop())
+            parent = stack[-1]
+        if parent.pending is not None:
+            self._finalize(parent.pending, False)
+            parent.pending = None
+
+        is_first = parent.child_count == 0
+        parent.child_count += 1
+        text = match.group(0)
+        start = self.compiled.start_tag(tag, text, attrs_text, parent, is_first)
+        node = _Node(tag, start.classes, start.id, parent, is_first, start.context)
+        stack.append(node)
+        if start.last_child_text is not None:
+            # 마지막 자식인지는 다음 형제가 열리거나 부모가 닫힐 때 정해지므로 자리만 잡아 둠
+            self._replace(match.start(), match.end(), text)
+            node.piece = len(self.out) - 1
+            node.start = start
+            parent.pending = node
+        elif start.text != text:
+            self._replace(match.start(), match.end(), start.text)
+
+    def _fragment_slot(self, match: 're.Match') -> None:
+        """조각 자리를 잡아 둡니다. 조각은 마지막 자식인지 정해진 뒤 인라인합니다."""
+        fragment = self.fragments.get(match.group(0)[len(_FRAGMENT_MARKER_PREFIX):-3])
+        if fragment is None:
+            return
+        parent = self.stack[-1]
+        if parent.pending is not None:
+            self._finalize(parent.pending, False)
+        slot = _Node(None, frozenset(), None, parent, parent.child_count == 0, 0)
+        slot.fragment = fragment
+        parent.child_count += 1
+        self._replace(match.start(), match.end(), fragment)
+        slot.piece = len(self.out) - 1
+        parent.pending = slot
+
+    def _end_tag(self, tag: str, position: int) -> None:
+        stack = self.stack
+        if stack[-1].tag != tag:
+            for depth in range(len(stack) - 2, 0, -1):
+                if stack[depth].tag == tag:
+                    break
+            else:
+                # 열리지 않은 요소의 닫는 태그는 lxml처럼 버림
+                self._replace(position, self.document.index('>', position) + 1, '')
+                return
+            while len(stack) - 1 > depth:
+                node = stack.pop()
+                if node.tag not in _VOID_ELEMENTS:
+                    self._replace(position, position, f'</{node.tag}>')
+                self._close(node)
+        self._close(stack.pop())
+
+    def _close(self, node: _Node) -> None:
+        """닫히는 요소의 마지막 자식에 :last-child 규칙을 적용합니다."""
+        if node.pending is not None:
+            self._finalize(node.pending, True)
+            node.pending = None
+
+    def _finalize(self, node: _Node, is_last: bool) -> None:
+        if node.fragment is not None:
+            self.out[node.piece] = self.compiled.inline_fragment(node.fragment, node.parent, node.is_first, is_last)
+        else:
+            self.out[node.piece] = node.start.last_child_text if is_last else node.start.text
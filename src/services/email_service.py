@@ -1,17 +1,14 @@
-import smtplib
-import time
-import hashlib
-import hmac
-import base64
-import requests
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from email.utils import formataddr
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 from .template_service import TemplateService
+from .smtp_pool import SMTPDeliveryPool, OutgoingEmail
+from .ncloud_mailer import NcloudBatchMailer, MailBatch
 from ..models.article import Article
+from ..models.delivery_result import DeliveryResult
 from ..config.settings import Settings, Recipient
 from ..utils.logger import get_logger
 from ..utils.exceptions import EmailSendError
@@ -25,65 +22,143 @@ class EmailService:
         self.settings = settings
         self.template_service = template_service
 
-    def send_news_email(self, articles: List[Article], categories: List[Dict[str, Any]]) -> None:
-        """생성된 HTML을 모든 수신자에게 이메일로 발송합니다."""
+    def group_recipients_by_template(self, recipients: Optional[List[Recipient]] = None) -> Dict[str, List[Recipient]]:
+        """수신자(기본값: 설정된 모든 수신자)를 사용하는 템플릿별로 묶습니다. (처음 등장한 템플릿 순서 유지)"""
+        groups: Dict[str, List[Recipient]] = {}
+        for recipient in self.settings.recipients if recipients is None else recipients:
+            template_name = recipient.template or self.settings.default_email_template
+            groups.setdefault(template_name, []).append(recipient)
+        return groups
+
+    def get_template_names(self) -> List[str]:
+        """수신자들이 사용하는 템플릿 이름 목록을 반환합니다."""
+        return list(self.group_recipients_by_template())
+
+    def render_emails(self, articles: List[Article], categories: List[Dict[str, Any]],
+                      article_fragments: Optional[Dict[str, Dict[int, str]]] = None) -> Dict[str, Tuple[str, str]]:
+        """수신자들이 사용하는 템플릿별로 이메일을 한 번씩 렌더링하여 {템플릿 이름: (HTML, 제목)}을 반환합니다.
+
+        article_fragments에는 템플릿별로 {기사 번호: 미리 렌더링한 기사 조각}을 넘길 수 있습니다.
+        """
+        article_fragments = article_fragments or {}
+        return {
+            template_name: self.template_service.generate_email_html(
+                articles, categories, template_name, article_fragments.get(template_name))
+            for template_name in self.get_template_names()
+        }
+
+    def send_news_email(self, articles: List[Article], categories: List[Dict[str, Any]],
+                        rendered: Optional[Dict[str, Tuple[str, str]]] = None,
+                        skip_recipients: Optional[Set[str]] = None) -> List[DeliveryResult]:
+        """생성된 HTML을 수신자들에게 이메일로 발송하고 수신자별 발송 결과를 반환합니다.
+
+        rendered에 템플릿별로 미리 렌더링한 (HTML, 제목)이 있으면 다시 렌더링하지 않고 사용합니다.
+        skip_recipients의 주소(이전 실행에서 이미 받은 수신자)에게는 다시 보내지 않습니다.
+        한 명이라도 실패하면 수신자별 결과를 담은 EmailSendError를 발생시켜, 실패한 수신자에게만 다시 보낼 수 있게 합니다.
+        """
         if not self.settings.recipients:
             logger.warning("수신자가 설정되지 않아 이메일을 발송하지 않습니다.")
-            return
+            return []
+        recipients = [recipient for recipient in self.settings.recipients
+                      if not skip_recipients or recipient.email not in skip_recipients]
+        if not recipients:
+            logger.info("모든 수신자가 이전 실행에서 이미 이메일을 받았습니다.")
+            return []
+        if len(recipients) < len(self.settings.recipients):
+            logger.info(f"이전 실행에서 이미 받은 수신자 {len(self.settings.recipients) - len(recipients)}명은 건너뜁니다.")
 
         logger.info(f"'{self.settings.email_sender_type}' 방법을 사용하여 이메일 발송을 시작합니다...")
 
         try:
+            groups = self.group_recipients_by_template(recipients)
+            logger.info(f"수신자 {len(recipients)}명을 템플릿 {len(groups)}개로 묶어 템플릿별로 한 번씩 렌더링합니다.")
+            rendered = dict(rendered or {})
+            for template_name in groups:
+                if template_name not in rendered:
+                    rendered[template_name] = self.template_service.generate_email_html(articles, categories, template_name)
+
             if self.settings.email_sender_type == 'smtp':
-                self._send_emails_smtp(articles, categories)
+                results = self._send_emails_smtp(rendered, groups)
             elif self.settings.email_sender_type == 'ncloud':
-                self._send_emails_ncloud(articles, categories)
+                results = self._send_emails_ncloud(rendered, groups)
             else:
                 raise EmailSendError(f"지원하지 않는 이메일 발송 타입입니다: {self.settings.email_sender_type}")
         except Exception as e:
             logger.error(f"이메일 발송 중 오류 발생: {e}")
             raise EmailSendError(f"이메일 발송 실패: {e}")
 
-    def _send_emails_smtp(self, articles: List[Article], categories: List[Dict[str, Any]]):
-        """SMTP를 사용하여 모든 수신자에게 이메일을 발송합니다."""
-        with smtplib.SMTP(self.settings.smtp_host, self.settings.smtp_port) as server:
-            server.starttls()
-            server.login(self.settings.smtp_user, self.settings.smtp_password)
-
-            for recipient in self.settings.recipients:
-                template_name = recipient.template or self.settings.default_email_template
-                html_content, subject = self.template_service.generate_email_html(articles, categories, template_name)
-                
-                msg = self._create_smtp_message(html_content, subject, recipient.email)
-                server.sendmail(self.settings.smtp_user, recipient.email, msg.as_string())
-                logger.info(f"SMTP 이메일이 성공적으로 {recipient.email} 주소로 발송되었습니다 (템플릿: {template_name}).")
-
-    def _send_emails_ncloud(self, articles: List[Article], categories: List[Dict[str, Any]]):
-        """Naver Cloud Mailer를 사용하여 모든 수신자에게 이메일을 발송합니다."""
-        for recipient in self.settings.recipients:
-            template_name = recipient.template or self.settings.default_email_template
-            html_content, subject = self.template_service.generate_email_html(articles, categories, template_name)
-            
-            self._send_single_ncloud_email(html_content, subject, recipient)
-            logger.info(f"Ncloud 이메일이 성공적으로 {recipient.email} 주소로 발송 요청되었습니다 (템플릿: {template_name}).")
-
-    def _send_single_ncloud_email(self, html_content: str, subject: str, recipient: Recipient):
-        """Naver Cloud Outbound Mailer를 사용하여 단일 수신자에게 이메일을 발송합니다."""
-        url = "https://mail.apigw.ntruss.com/api/v1/mails"
-        headers = self._get_ncloud_headers()
-        
-        payload = {
-            "senderAddress": self.settings.ncloud_sender_address,
-            "title": subject,
-            "body": html_content,
-            "recipients": [{"address": recipient.email, "type": "R"}],
-            "individual": True,
-        }
+        failed = self._report_delivery(results)
+        if failed:
+            raise EmailSendError(f"이메일 발송 실패: 수신자 {len(results)}명 중 {len(failed)}명에게 발송하지 못했습니다 "
+                                 f"({failed[0].recipient}: {failed[0].error})", results=results)
+        return results
+
+    def _report_delivery(self, results: List[DeliveryResult]) -> List[DeliveryResult]:
+        """수신자별 발송 결과를 요약해 기록하고 실패한 결과 목록을 반환합니다."""
+        failed = [result for result in results if not result.success]
+        retried = sum(1 for result in results if result.attempts > 1)
+        logger.info(f"이메일 발송 결과: 성공 {len(results) - len(failed)}명, 실패 {len(failed)}명 (재시도 {retried}명)")
+        for result in failed:
+            logger.warning(f"이메일 발송 실패 ({result.recipient}, 템플릿: {result.template}, "
+                           f"시도 {result.attempts}회): {result.error}")
+        return failed
+
+    def _create_smtp_pool(self) -> SMTPDeliveryPool:
+        """설정값으로 SMTP 발송 엔진을 생성합니다."""
+        return SMTPDeliveryPool(
+            host=self.settings.smtp_host,
+            port=self.settings.smtp_port,
+            user=self.settings.smtp_user,
+            password=self.settings.smtp_password,
+            pool_size=self.settings.smtp_pool_size,
+            max_retries=self.settings.smtp_max_retries,
+            messages_per_minute=self.settings.smtp_max_per_minute,
+            use_tls=self.settings.smtp_starttls
+        )
 
-        response = requests.post(url, json=payload, headers=headers)
-        
-        if response.status_code != 201:
-            logger.error(f"Ncloud 이메일 발송 실패 ({recipient.email}): {response.status_code} {response.text}")
+    def _send_emails_smtp(self, rendered: Dict[str, Tuple[str, str]],
+                          groups: Dict[str, List[Recipient]]) -> List[DeliveryResult]:
+        """SMTP 세션 풀로 템플릿별 수신자들에게 이메일을 병렬 발송합니다."""
+        emails = []
+        for template_name, recipients in groups.items():
+            html_content, subject = rendered[template_name]
+            for recipient in recipients:
+                emails.append(OutgoingEmail(
+                    recipient=recipient.email,
+                    template=template_name,
+                    render=lambda html=html_content, title=subject, address=recipient.email:
+                        self._create_smtp_message(html, title, address).as_string()
+                ))
+
+        pool = self._create_smtp_pool()
+        logger.info(f"SMTP 세션 {min(pool.pool_size, len(emails))}개로 {len(emails)}통을 발송합니다.")
+        results = pool.send(self.settings.smtp_user, emails)
+        for result in results:
+            if result.success:
+                logger.info(f"SMTP 이메일이 성공적으로 {result.recipient} 주소로 발송되었습니다 (템플릿: {result.template}).")
+        return results
+
+    def _send_emails_ncloud(self, rendered: Dict[str, Tuple[str, str]],
+                            groups: Dict[str, List[Recipient]]) -> List[DeliveryResult]:
+        """Naver Cloud Mailer로 같은 템플릿의 수신자를 묶어 배치로 발송합니다."""
+        batches = [
+            MailBatch(template_name, rendered[template_name][1], rendered[template_name][0],
+                      [recipient.email for recipient in recipients])
+            for template_name, recipients in groups.items()
+        ]
+        mailer = NcloudBatchMailer(
+            access_key=self.settings.ncloud_access_key,
+            secret_key=self.settings.ncloud_secret_key,
+            sender_address=self.settings.ncloud_sender_address,
+            batch_size=self.settings.ncloud_batch_size,
+            max_workers=self.settings.ncloud_max_workers,
+            max_retries=self.settings.ncloud_max_retries
+        )
+        results = mailer.send(batches)
+        for result in results:
+            if result.success:
+                logger.info(f"Ncloud 이메일이 성공적으로 {result.recipient} 주소로 발송 요청되었습니다 (템플릿: {result.template}).")
+        return results
 
     def _create_smtp_message(self, html_content: str, subject: str, recipient_email: str) -> MIMEMultipart:
         """SMTP 이메일 메시지를 생성합니다."""
@@ -93,20 +168,3 @@ class EmailService:
         msg['Subject'] = Header(subject, 'utf-8')
         msg.attach(MIMEText(html_content, 'html', 'utf-8'))
         return msg
-
-    def _get_ncloud_headers(self) -> dict:
-        """Naver Cloud API 요청에 필요한 헤더를 생성합니다."""
-        timestamp = str(int(time.time() * 1000))
-        access_key = self.settings.ncloud_access_key
-        secret_key = self.settings.ncloud_secret_key
-        method = "POST"
-        uri = "/api/v1/mails"
-        message = f"{method} {uri}\n{timestamp}\n{access_key}"
-        signature = hmac.new(secret_key.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).digest()
-        signature_b64 = base64.b64encode(signature).decode('utf-8')
-        return {
-            "Content-Type": "application/json",
-            "x-ncp-apigw-timestamp": timestamp,
-            "x-ncp-iam-access-key": access_key,
-            "x-ncp-apigw-signature-v2": signature_b64
-        }
\ No newline at end of file
@@ -0,0 +1,217 @@
+import base64
+import random
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@dataclass
+class FakeSMTPStats:
+    """가짜 SMTP 서버 통계"""
+    connections: int = 0
+    delivered: int = 0
+    temporary_failures: int = 0
+    disconnects: int = 0
+    rejected: int = 0
+    auth_failures: int = 0
+    max_concurrent_sessions: int = 0
+    accepted_at: List[float] = field(default_factory=list)
+
+class FakeSMTPServer:
+    """SMTP 발송 엔진을 오프라인에서 시험하기 위한 로컬 SMTP 서버
+
+    EHLO/HELO, AUTH PLAIN/LOGIN, MAIL, RCPT, DATA, RSET, NOOP, QUIT만 처리하며 STARTTLS는 지원하지 않습니다.
+    받은 메일마다 응답 지연을 주고, 일정 비율로 451 임시 오류를 돌려주거나 응답 없이 연결을 끊을 수 있습니다.
+    reject_addresses의 수신자는 550으로 거부하고, credentials를 주면 다른 계정의 로그인은 535로 거부합니다.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0,
+                 disconnect_rate: float = 0.0, reject_addresses: Sequence[str] = (),
+                 credentials: Optional[Tuple[str, str]] = None, seed: Optional[int] = None,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.disconnect_rate = disconnect_rate
+        self.reject_addresses = {address.lower() for address in reject_addresses}
+        self.credentials = credentials
+        self.stats = FakeSMTPStats()
+        # 받은 메일: (보낸 사람, 수신자 목록, 본문)
+        self.messages: List[Tuple[str, List[str], str]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sessions = 0
+        self._server = socketserver.ThreadingTCPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def _roll(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def _check_login(self, user: str, password: str) -> bool:
+        ok = self.credentials is None or (user, password) == self.credentials
+        if not ok:
+            with self._lock:
+                self.stats.auth_failures += 1
+        return ok
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str) -> None:
+                self.wfile.write(f"{line}\r\n".encode('utf-8'))
+
+            def read_line(self) -> Optional[str]:
+                line = self.rfile.readline()
+                return line.decode('utf-8', 'replace').rstrip('\r\n') if line else None
+
+            def handle(self):
+                with server._lock:
+                    server.stats.connections += 1
+                    server._sessions += 1
+                    server.stats.max_concurrent_sessions = max(server.stats.max_concurrent_sessions, server._sessions)
+                try:
+                    self.session()
+                except (ConnectionError, OSError):
+                    pass
+                finally:
+                    with server._lock:
+                        server._sessions -= 1
+
+            def session(self):
+                self.reply("220 fake-smtp ESMTP ready")
+                sender = None
+                recipients: List[str] = []
+                while True:
+                    line = self.read_line()
+                    if line is None:
+                        return
+                    command, _, argument = line.partition(' ')
+                    command = command.upper()
+                    if command == 'EHLO':
+                        self.reply("250-fake-smtp")
+                        self.reply("250-AUTH PLAIN LOGIN")
+                        self.reply("250 8BITMIME")
+                    elif command == 'HELO':
+                        self.reply("250 fake-smtp")
+                    elif command == 'AUTH':
+                        self.auth(argument)
+                    elif command == 'MAIL':
+                        sender = argument.partition(':')[2].strip().strip('<>')
+                        recipients = []
+                        self.reply("250 2.1.0 OK")
+                    elif command == 'RCPT':
+                        address = argument.partition(':')[2].strip().strip('<>')
+                        if address.lower() in server.reject_addresses:
+                            with server._lock:
+                                server.stats.rejected += 1
+                            self.reply("550 5.1.1 No such user")
+                        else:
+                            recipients.append(address)
+                            self.reply("250 2.1.5 OK")
+                    elif command == 'DATA':
+                        if not self.data(sender, recipients):
+                            return
+                        sender, recipients = None, []
+                    elif command == 'RSET':
+                        sender, recipients = None, []
+                        self.reply("250 2.0.0 OK")
+                    elif command == 'NOOP':
+                        self.reply("250 2.0.0 OK")
+                    elif command == 'QUIT':
+                        self.reply("221 2.0.0 Bye")
+                        return
+                    else:
+                        self.reply("502 5.5.2 Command not implemented")
+
+            def auth(self, argument: str) -> None:
+                mechanism, _, initial = argument.partition(' ')
+                if mechanism.upper() == 'PLAIN':
+                    if not initial:
+                        self.reply("334 ")
+                        initial = self.read_line() or ''
+                    parts = base64.b64decode(initial).decode('utf-8', 'replace').split('\0')
+                    user, password = (parts[1], parts[2]) if len(parts) == 3 else ('', '')
+                elif mechanism.upper() == 'LOGIN':
+                    self.reply("334 VXNlcm5hbWU6")
+                    user = base64.b64decode(self.read_line() or '').decode('utf-8', 'replace')
+                    self.reply("334 UGFzc3dvcmQ6")
+                    password = base64.b64decode(self.read_line() or '').decode('utf-8', 'replace')
+                else:
+                    self.reply("504 5.5.4 Unrecognized authentication type")
+                    return
+                if server._check_login(user, password):
+                    self.reply("235 2.7.0 Authentication successful")
+                else:
+                    self.reply("535 5.7.8 Authentication credentials invalid")
+
+            def data(self, sender: Optional[str], recipients: List[str]) -> bool:
+                """본문을 받고 응답합니다. 연결을 끊었으면 False를 반환합니다."""
+                if not recipients:
+                    self.reply("503 5.5.1 Need RCPT command")
+                    return True
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return False
+                    if line in (b".\r\n", b".\n"):
+                        break
+                    lines.append(line[1:] if line.startswith(b"..") else line)
+
+                delay = server.latency + (server._roll() * server.jitter if server.jitter else 0.0)
+                if delay > 0:
+                    time.sleep(delay)
+                roll = server._roll()
+                if roll < server.disconnect_rate:
+                    with server._lock:
+                        server.stats.disconnects += 1
+                    return False
+                if roll < server.disconnect_rate + server.failure_rate:
+                    with server._lock:
+                        server.stats.temporary_failures += 1
+                    self.reply("451 4.3.0 Temporary failure, try again later")
+                    return True
+                with server._lock:
+                    server.messages.append((sender or '', list(recipients), b"".join(lines).decode('utf-8', 'replace')))
+                    server.stats.delivered += 1
+                    server.stats.accepted_at.append(time.monotonic())
+                self.reply("250 2.0.0 Message accepted")
+                return True
+
+        return Handler
+
+    def start(self) -> 'FakeSMTPServer':
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-smtp-server", daemon=True)
+        self._thread.start()
+        logger.info(f"가짜 SMTP 서버 시작: {self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """서버를 종료합니다."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakeSMTPServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
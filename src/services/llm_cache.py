@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, Optional
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class LLMResponseCache:
+    """모델 이름, 프롬프트 템플릿 버전, 입력 텍스트의 해시를 키로 하는 디스크 기반 LLM 응답 캐시
+
+    SQLite(WAL)를 사용하므로 여러 스레드와 프로세스에서 동시에 사용할 수 있습니다.
+    ttl_days가 지난 항목은 만료되며, 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    # 쓰기 몇 번마다 용량을 점검할지
+    EVICT_INTERVAL = 32
+
+    def __init__(self, db_path: str, ttl_days: float = 3, max_bytes: int = 50 * 1024 * 1024):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_db()
+        self.evict()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_db(self) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed_at ON llm_cache (accessed_at)")
+        except sqlite3.Error as e:
+            # 캐시를 쓸 수 없어도 실행은 계속되도록 경고만 남김 (조회/저장도 실패하면 캐시 없이 동작)
+            logger.warning(f"LLM 캐시 초기화 실패: {e}")
+
+    @staticmethod
+    def make_key(model_name: str, template_version: str, text: str) -> str:
+        """캐시 키를 계산합니다."""
+        digest = hashlib.sha256()
+        for part in (model_name, template_version, text):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT value FROM llm_cache WHERE cache_key = ? AND created_at >= ?",
+                    (key, now - self.ttl_seconds)
+                ).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE cache_key = ?", (now, key))
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 조회 실패: {e}")
+            row = None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """값을 캐시에 저장합니다."""
+        now = time.time()
+        data = json.dumps(value, ensure_ascii=False)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (cache_key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data.encode('utf-8')), now, now)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            should_evict = self._writes % self.EVICT_INTERVAL == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> None:
+        """만료된 항목을 지우고, 용량을 넘으면 오래 사용하지 않은 항목부터 삭제합니다."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                expired = conn.execute(
+                    "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                ).rowcount
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+                evicted = 0
+                if total > self.max_bytes:
+                    rows = conn.execute("SELECT cache_key, size FROM llm_cache ORDER BY accessed_at").fetchall()
+                    for cache_key, size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (cache_key,))
+                        total -= size
+                        evicted += 1
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 정리 실패: {e}")
+            return
+
+        if expired or evicted:
+            logger.info(f"LLM 캐시 정리: 만료 {expired}개, 용량 초과 {evicted}개 삭제")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
@@ -0,0 +1,222 @@
+import json
+import math
+import os
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Any, Tuple
+import numpy as np
+from ..models.article import Article
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+_JOSA_RE = re.compile(r'(으로|에서|에게|까지|부터|이나|처럼|보다|은|는|이|가|을|를|의|에|와|과|도|로|만)$')
+_STOPWORDS = {
+    'the', 'and', 'for', 'with', 'from', 'that', 'this', 'into', 'its', 'are', 'new',
+    '및', '등', '위해', '대한', '관련', '통해', '위한', '있는', '있다', '한다', '했다', '이번', '지난', '것으로'
+}
+
+# 태그는 제목 단어보다 주제를 더 잘 나타내므로 가중치를 높게 줍니다.
+_TAG_WEIGHT = 2.0
+
+# 카테고리 이름 생성기: 카테고리별 대표 단어 목록을 받아 같은 순서의 이름 목록을 돌려줍니다.
+CategoryNamer = Callable[[List[List[str]]], List[str]]
+
+def tokenize(text: str) -> List[str]:
+    """소문자화한 단어에서 한국어 조사를 떼고 불용어와 한 글자 단어를 제외합니다."""
+    tokens = []
+    for word in _WORD_RE.findall(text.lower()):
+        if len(word) > 2:
+            word = _JOSA_RE.sub('', word)
+        if len(word) >= 2 and word not in _STOPWORDS and not word.isdigit():
+            tokens.append(word)
+    return tokens
+
+class LocalCategorizer:
+    """TF-IDF 벡터와 용량 제한 k-means로 기사를 카테고리로 묶는 로컬 분류기
+
+    korean_title과 태그를 TF-IDF로 벡터화하고, 코사인 유사도 기반 k-means에서 각 카테고리가
+    max_per_category개를 넘지 않도록 유사도가 높은 순서로 배정합니다. 카테고리 이름은 대표 단어로
+    만들거나, 같은 대표 단어 조합에 대해 이전에 정한 이름(name_map_path)을 재사용합니다.
+    """
+
+    def __init__(self, max_per_category: int = 6, min_categories: int = 3, max_categories: int = 7,
+                 name_map_path: Optional[str] = None, max_iterations: int = 20, restarts: int = 8, seed: int = 0):
+        self.max_per_category = max_per_category
+        self.min_categories = min_categories
+        self.max_categories = max_categories
+        self.name_map_path = name_map_path
+        self.max_iterations = max_iterations
+        self.restarts = restarts
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._name_map = self._load_name_map()
+
+    def _load_name_map(self) -> Dict[str, str]:
+        if not self.name_map_path:
+            return {}
+        try:
+            with open(self.name_map_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"카테고리 이름 캐시를 읽지 못했습니다: {e}")
+            return {}
+
+    def _save_name_map(self) -> None:
+        if not self.name_map_path:
+            return
+        directory = os.path.dirname(self.name_map_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.name_map_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._name_map, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.name_map_path)
+
+    def _vectorize(self, articles: List[Article]) -> Tuple[np.ndarray, List[str]]:
+        """기사별 TF-IDF 행렬(행 단위 L2 정규화)과 단어 목록을 만듭니다."""
+        documents: List[Dict[str, float]] = []
+        for article in articles:
+            weights: Dict[str, float] = {}
+            for token in tokenize(article.korean_title or article.title):
+                weights[token] = weights.get(token, 0.0) + 1.0
+            for tag in article.tags or []:
+                for token in tokenize(tag):
+                    weights[token] = weights.get(token, 0.0) + _TAG_WEIGHT
+            documents.append(weights)
+
+        vocabulary = sorted({token for weights in documents for token in weights})
+        index = {token: i for i, token in enumerate(vocabulary)}
+        tf = np.zeros((len(articles), len(vocabulary)))
+        for row, weights in enumerate(documents):
+            for token, weight in weights.items():
+                tf[row, index[token]] = weight
+
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log((1 + len(articles)) / (1 + df)) + 1.0
+        matrix = tf * idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms, vocabulary
+
+    def _num_categories(self, count: int) -> int:
+        by_capacity = math.ceil(count / self.max_per_category)
+        preferred = min(self.max_categories, max(min(self.min_categories, count // 2), round(count / 3)))
+        return min(count, max(by_capacity, preferred))
+
+    def _assign(self, similarity: np.ndarray, k: int) -> np.ndarray:
+        """유사도가 높은 (기사, 카테고리) 쌍부터 정원이 남은 카테고리에 배정합니다."""
+        labels = np.full(similarity.shape[0], -1)
+        sizes = np.zeros(k, dtype=int)
+        for flat in np.argsort(-similarity, axis=None, kind='stable'):
+            doc, cluster = divmod(int(flat), k)
+            if labels[doc] >= 0 or sizes[cluster] >= self.max_per_category:
+                continue
+            labels[doc] = cluster
+            sizes[cluster] += 1
+        return labels
+
+    def _cluster(self, matrix: np.ndarray, k: int) -> np.ndarray:
+        """초기 중심을 바꿔 여러 번 군집화하고, 기사와 중심의 유사도 합이 가장 큰 결과를 반환합니다."""
+        rng = np.random.RandomState(self.seed)
+        best_labels, best_score = None, -np.inf
+        for _ in range(max(1, self.restarts)):
+            labels, centers = self._cluster_once(matrix, k, rng)
+            score = float(np.sum(matrix * centers[labels]))
+            if score > best_score:
+                best_labels, best_score = labels, score
+        return best_labels
+
+    def _cluster_once(self, matrix: np.ndarray, k: int, rng: np.random.RandomState) -> Tuple[np.ndarray, np.ndarray]:
+        """정원 제한이 있는 구면(코사인) k-means로 기사별 카테고리 번호와 중심을 반환합니다."""
+        # k-means++ 방식으로 서로 멀리 떨어진 초기 중심을 고릅니다.
+        centers = [matrix[rng.randint(len(matrix))]]
+        for _ in range(1, k):
+            distance = 1.0 - np.max(matrix @ np.array(centers).T, axis=1)
+            distance = np.clip(distance, 0, None)
+            total = distance.sum()
+            choice = rng.choice(len(matrix), p=distance / total) if total > 0 else rng.randint(len(matrix))
+            centers.append(matrix[choice])
+        centers = np.array(centers)
+
+        labels = None
+        for _ in range(self.max_iterations):
+            new_labels = self._assign(matrix @ centers.T, k)
+            if labels is not None and np.array_equal(labels, new_labels):
+                break
+            labels = new_labels
+            for cluster in range(k):
+                members = matrix[labels == cluster]
+                if len(members):
+                    center = members.sum(axis=0)
+                    norm = np.linalg.norm(center)
+                    centers[cluster] = center / norm if norm else center
+        return labels, centers
+
+    def _top_terms(self, matrix: np.ndarray, vocabulary: List[str], members: List[int], limit: int = 3) -> List[str]:
+        weights = matrix[members].sum(axis=0)
+        terms = []
+        for i in np.argsort(-weights, kind='stable'):
+            if weights[i] <= 0 or len(terms) >= limit:
+                break
+            term = vocabulary[i]
+            if any(term in chosen or chosen in term for chosen in terms):
+                continue
+            terms.append(term)
+        return terms
+
+    def categorize(self, articles: List[Article], namer: Optional[CategoryNamer] = None) -> List[Dict[str, Any]]:
+        """기사들을 카테고리로 묶어 [{'category_name': ..., 'articles': [기사 번호, ...]}] 형태로 반환합니다.
+
+        namer가 주어지면 이름 캐시에 없는 카테고리의 이름만 namer로 정합니다.
+        """
+        if not articles:
+            return []
+
+        matrix, vocabulary = self._vectorize(articles)
+        k = self._num_categories(len(articles))
+        labels = self._cluster(matrix, k) if k > 1 else np.zeros(len(articles), dtype=int)
+
+        groups = [[i for i in range(len(articles)) if labels[i] == cluster] for cluster in range(k)]
+        groups = sorted((group for group in groups if group), key=lambda group: group[0])
+        term_groups = [self._top_terms(matrix, vocabulary, group) for group in groups]
+        names = self._name_categories(term_groups, namer)
+
+        # 같은 이름이 겹치면 번호를 붙여 구분합니다.
+        seen: Dict[str, int] = {}
+        categories = []
+        for name, group in zip(names, groups):
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                name = f"{name} {seen[name]}"
+            categories.append({"category_name": name, "articles": group})
+
+        logger.info(f"로컬 카테고리 분류 완료: {[category['category_name'] for category in categories]}")
+        return categories
+
+    def _name_categories(self, term_groups: List[List[str]], namer: Optional[CategoryNamer]) -> List[str]:
+        keys = ['|'.join(sorted(terms)) for terms in term_groups]
+        with self._lock:
+            names = [self._name_map.get(key) for key in keys]
+
+        missing = [i for i, name in enumerate(names) if name is None and term_groups[i]]
+        if namer and missing:
+            try:
+                generated = namer([term_groups[i] for i in missing])
+                if len(generated) != len(missing):
+                    raise ValueError(f"이름 {len(generated)}개가 반환되었습니다 (기대값: {len(missing)}개).")
+                with self._lock:
+                    for i, name in zip(missing, generated):
+                        names[i] = name
+                        self._name_map[keys[i]] = name
+                    self._save_name_map()
+            except Exception as e:
+                logger.warning(f"카테고리 이름 생성에 실패하여 대표 단어로 이름을 정합니다: {e}")
+
+        return [
+            name or (' · '.join(terms[:2]) if terms else "주요 뉴스")
+            for name, terms in zip(names, term_groups)
+        ]
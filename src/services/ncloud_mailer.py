@@ -0,0 +1,168 @@
+import base64
+import hashlib
+import hmac
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..models.delivery_result import DeliveryResult
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+NCLOUD_MAIL_URL = "https://mail.apigw.ntruss.com"
+MAIL_URI = "/api/v1/mails"
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+# 키나 서명이 거부되면 어떤 배치도 성공할 수 없음
+AUTH_STATUS_CODES = {401, 403}
+# 요청 내용(수신자 주소 등) 검증 실패: 배치를 나눠 보내면 문제가 있는 수신자를 골라낼 수 있음
+SPLITTABLE_STATUS_CODES = {400}
+
+@dataclass
+class MailBatch:
+    """같은 템플릿으로 렌더링한 메일 한 종류와 그 수신자 목록"""
+    template: str
+    subject: str
+    html: str
+    recipients: List[str]
+
+class NcloudBatchMailer:
+    """Naver Cloud Outbound Mailer로 수신자를 묶어 발송하는 배치 발송기
+
+    같은 본문을 받는 수신자를 batch_size명씩 묶어 `individual: true` 요청 한 번으로 보내므로
+    API 호출 수가 수신자 수 N에서 약 N/batch_size로 줄어듭니다. 배치들은 커넥션 풀을 공유하는 세션으로 병렬 전송하고,
+    429/5xx/연결 오류는 지수 백오프로 같은 배치를 재시도합니다. 400 검증 오류는 배치를 반으로 나눠 다시 보내
+    문제가 있는 수신자만 실패로 남기고, 401/403 인증 오류가 나면 남은 배치는 보내지 않고 실패로 기록합니다.
+    그 밖의 4xx는 요청 전체의 문제이므로 나누지 않고 그 배치를 실패로 기록합니다.
+    """
+
+    def __init__(self, access_key: str, secret_key: str, sender_address: str, batch_size: int = 50,
+                 max_workers: int = 4, max_retries: int = 2, base_delay: float = 1.0, max_delay: float = 30.0,
+                 timeout: float = 30.0, base_url: str = NCLOUD_MAIL_URL):
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.sender_address = sender_address
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.url = base_url.rstrip('/') + MAIL_URI
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.requests_sent = 0
+        self._fatal_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _get_headers(self) -> Dict[str, str]:
+        """요청마다 현재 시각으로 서명한 헤더를 만듭니다. (게이트웨이가 타임스탬프를 서버 시각과 비교함)"""
+        timestamp = str(int(time.time() * 1000))
+        message = f"POST {MAIL_URI}\n{timestamp}\n{self.access_key}"
+        signature = hmac.new(self.secret_key.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).digest()
+        return {
+            "Content-Type": "application/json",
+            "x-ncp-apigw-timestamp": timestamp,
+            "x-ncp-iam-access-key": self.access_key,
+            "x-ncp-apigw-signature-v2": base64.b64encode(signature).decode('utf-8')
+        }
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def send(self, batches: List[MailBatch]) -> List[DeliveryResult]:
+        """모든 배치를 병렬로 발송하고, 입력한 배치와 수신자 순서대로 수신자별 결과를 반환합니다."""
+        chunks = [(batch, batch.recipients[start:start + self.batch_size])
+                  for batch in batches
+                  for start in range(0, len(batch.recipients), self.batch_size)]
+        if not chunks:
+            return []
+
+        self._fatal_error = None
+        requests_before = self.requests_sent
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks)), thread_name_prefix="ncloud") as executor:
+            futures = [executor.submit(self._send_chunk, batch, recipients, 0, time.monotonic())
+                       for batch, recipients in chunks]
+            results = [result for future in futures for result in future.result()]
+
+        recipient_count = sum(len(recipients) for _, recipients in chunks)
+        logger.info(f"Ncloud API 요청 {self.requests_sent - requests_before}회로 수신자 {recipient_count}명에게 발송했습니다.")
+        return results
+
+    def _post(self, batch: MailBatch, recipients: List[str]) -> Tuple[Optional[str], Optional[int]]:
+        """배치 하나를 한 번 요청하고 (오류 내용, 상태 코드)를 반환합니다.
+
+        성공하면 오류 내용은 None이고, 연결 오류처럼 응답을 받지 못하면 상태 코드는 None입니다.
+        """
+        payload = {
+            "senderAddress": self.sender_address,
+            "title": batch.subject,
+            "body": batch.html,
+            "recipients": [{"address": address, "type": "R"} for address in recipients],
+            "individual": True,
+        }
+        with self._lock:
+            self.requests_sent += 1
+        try:
+            response = self.session.post(self.url, json=payload, headers=self._get_headers(), timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            return f"Ncloud API 요청 실패: {e}", None
+        if response.status_code == 201:
+            return None, response.status_code
+        return f"{response.status_code} {response.text}", response.status_code
+
+    @staticmethod
+    def _results(batch: MailBatch, recipients: List[str], success: bool, attempts: int, error: Optional[str],
+                 started: float) -> List[DeliveryResult]:
+        elapsed = time.monotonic() - started
+        return [DeliveryResult(address, batch.template, success, attempts, error, elapsed) for address in recipients]
+
+    def _send_chunk(self, batch: MailBatch, recipients: List[str], previous_attempts: int,
+                    started: float) -> List[DeliveryResult]:
+        """배치를 재시도하며 발송하고, 수신자 때문일 수 있는 400 오류로 실패하면 반으로 나눠 다시 보냅니다."""
+        attempts = 0
+        while True:
+            if self._fatal_error:
+                return self._results(batch, recipients, False, previous_attempts + attempts, self._fatal_error, started)
+            attempts += 1
+            error, status = self._post(batch, recipients)
+            if error is None:
+                return self._results(batch, recipients, True, previous_attempts + attempts, None, started)
+            if status in AUTH_STATUS_CODES:
+                with self._lock:
+                    if not self._fatal_error:
+                        self._fatal_error = f"Ncloud API 인증에 실패했습니다: {error}"
+                        logger.error(self._fatal_error)
+                return self._results(batch, recipients, False, previous_attempts + attempts, self._fatal_error, started)
+            transient = status is None or status in TRANSIENT_STATUS_CODES
+            if not transient or attempts > self.max_retries:
+                break
+            delay = self._backoff(attempts)
+            logger.warning(f"Ncloud 일시적 오류로 {delay:.1f}초 후 수신자 {len(recipients)}명 배치를 재시도합니다 "
+                           f"({attempts}/{self.max_retries}): {error}")
+            time.sleep(delay)
+
+        attempts += previous_attempts
+        if status in SPLITTABLE_STATUS_CODES and len(recipients) > 1:
+            middle = len(recipients) // 2
+            logger.warning(f"Ncloud 배치 발송 실패로 수신자 {len(recipients)}명을 둘로 나눠 다시 보냅니다: {error}")
+            first = self._send_chunk(batch, recipients[:middle], attempts, started)
+            if middle > 1 and all(not result.success and result.error == error for result in first):
+                # 여러 명인 앞쪽 절반이 모두 같은 오류로 거부되면 특정 수신자가 아니라 요청 내용의 문제로 보고 나머지는 보내지 않음
+                logger.error(f"Ncloud 배치가 수신자와 무관한 오류로 거부되어 나머지 {len(recipients) - middle}명은 보내지 않습니다: {error}")
+                return first + self._results(batch, recipients[middle:], False, attempts, error, started)
+            return first + self._send_chunk(batch, recipients[middle:], attempts, started)
+
+        logger.error(f"Ncloud 이메일 발송 실패 ({', '.join(recipients[:3])}{' 외' if len(recipients) > 3 else ''}): {error}")
+        return self._results(batch, recipients, False, attempts, error, started)
@@ -0,0 +1,179 @@
+import re
+import hashlib
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+from ..models.article import Article
+from ..utils.logger import get_logger
+from ..utils.url_utils import canonicalize_url
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+_MERSENNE_PRIME = (1 << 31) - 1
+
+@lru_cache(maxsize=200000)
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=4).digest(), 'little')
+
+def shingle_hashes(text: str) -> FrozenSet[int]:
+    """소문자화한 단어와 인접 단어쌍(bigram)을 32비트 해시 집합으로 변환합니다."""
+    words = _WORD_RE.findall(text.lower())
+    features = set(words)
+    features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return frozenset(_feature_hash(feature) for feature in features)
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class MinHashLSHIndex:
+    """MinHash 서명을 밴드로 나누어 유사 문서 후보를 찾는 LSH 인덱스
+
+    서명 길이 bands * rows에서 자카드 유사도가 대략 (1 / bands) ** (1 / rows) 이상인 문서 쌍이
+    같은 버킷에 들어갈 확률이 높아지므로, 전체 비교 없이 버킷 안의 후보만 검증합니다.
+    """
+
+    def __init__(self, threshold: float = 0.5, bands: int = 16, rows: int = 4, seed: int = 7):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.RandomState(seed)
+        num_perm = bands * rows
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._shingles: Dict[int, FrozenSet[int]] = {}
+
+    def signature(self, shingles: FrozenSet[int]) -> np.ndarray:
+        """특징 해시 집합의 MinHash 서명을 계산합니다."""
+        if not shingles:
+            return np.full(self.bands * self.rows, _MERSENNE_PRIME, dtype=np.uint64)
+        values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(values, self._a) + self._b) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: int, shingles: FrozenSet[int], signature: np.ndarray) -> None:
+        """문서를 인덱스에 추가합니다."""
+        self._shingles[key] = shingles
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, []).append(key)
+
+    def query(self, shingles: FrozenSet[int], signature: np.ndarray) -> List[int]:
+        """자카드 유사도가 threshold 이상인 문서의 키 목록을 반환합니다."""
+        candidates = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(band_key, ()))
+        return [key for key in candidates if jaccard(self._shingles[key], shingles) >= self.threshold]
+
+def _representative_key(article: Article) -> Tuple[float, int]:
+    return article.weight, len(article.content_description())
+
+def _fingerprint_text(article: Article) -> str:
+    """지문을 만들 텍스트: 제목과 실제 본문 설명
+
+    네이버 기사처럼 설명이 제목과 고정 안내 문구뿐이면 제목만 쓰므로,
+    짧은 제목끼리 같은 안내 문구 때문에 유사해 보이지 않습니다.
+    """
+    return f"{article.title} {article.content_description()}"
+
+def _absorb(representative: Article, member: Article) -> None:
+    """member와 그 대체 URL을 대표 기사의 alternate_urls에 중복 없이 추가합니다."""
+    known = {canonicalize_url(url) for url in [representative.url] + representative.alternate_urls}
+    for url in [member.url] + member.alternate_urls:
+        key = canonicalize_url(url)
+        if key not in known:
+            known.add(key)
+            representative.alternate_urls.append(url)
+
+class NearDuplicateDetector:
+    """제목과 설명이 거의 같은 기사를 하나로 묶는 서비스"""
+
+    def __init__(self, threshold: float = 0.5):
+        self.threshold = threshold
+
+    def merge(self, articles: List[Article]) -> List[Article]:
+        """근사 중복 기사를 클러스터로 묶고, 각 클러스터를 대표 기사 하나로 합칩니다.
+
+        대표 기사는 가중치가 가장 높고 설명이 가장 긴 기사이며, 나머지 기사의 URL은
+        대표 기사의 alternate_urls에 보관됩니다.
+        """
+        if len(articles) < 2:
+            return articles
+
+        index = MinHashLSHIndex(self.threshold)
+        parent = list(range(len(articles)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, article in enumerate(articles):
+            shingles = shingle_hashes(_fingerprint_text(article))
+            signature = index.signature(shingles)
+            for j in index.query(shingles, signature):
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+            index.add(i, shingles, signature)
+
+        clusters: Dict[int, List[int]] = {}
+        for i in range(len(articles)):
+            clusters.setdefault(find(i), []).append(i)
+
+        merged = []
+        for root in sorted(clusters):
+            members = [articles[i] for i in clusters[root]]
+            representative = max(members, key=_representative_key)
+            for member in members:
+                if member is not representative:
+                    _absorb(representative, member)
+            merged.append(representative)
+
+        logger.info(f"근사 중복 제거: {len(articles)}개 → {len(merged)}개")
+        return merged
+
+class StreamingNearDuplicateMerger:
+    """기사를 도착하는 순서대로 하나씩 받아 근사 중복 클러스터를 유지하는 병합기
+
+    파이프라인처럼 모든 기사가 모이기 전에 대표 기사를 정해야 할 때 사용합니다.
+    이미 다음 단계로 넘긴 대표 기사는 can_replace로 교체를 막아 두면, 나중에 들어온 중복 기사가
+    그 기사의 alternate_urls로만 합쳐집니다.
+    """
+
+    def __init__(self, threshold: float = 0.5):
+        self.index = MinHashLSHIndex(threshold)
+        self._cluster_of: Dict[int, int] = {}
+        self._representatives: Dict[int, Article] = {}
+
+    def add(self, article: Article,
+            can_replace: Optional[Callable[[Article], bool]] = None) -> Tuple[Article, Optional[Article]]:
+        """기사를 추가하고 (클러스터의 대표 기사, 대표 자리에서 밀려난 기사 또는 None)을 반환합니다."""
+        key = len(self._cluster_of)
+        shingles = shingle_hashes(_fingerprint_text(article))
+        signature = self.index.signature(shingles)
+        matches = self.index.query(shingles, signature)
+        self.index.add(key, shingles, signature)
+
+        if not matches:
+            self._cluster_of[key] = key
+            self._representatives[key] = article
+            return article, None
+
+        cluster = self._cluster_of[min(matches)]
+        self._cluster_of[key] = cluster
+        representative = self._representatives[cluster]
+        replaceable = can_replace is None or can_replace(representative)
+        if replaceable and _representative_key(article) > _representative_key(representative):
+            _absorb(article, representative)
+            self._representatives[cluster] = article
+            return article, representative
+
+        _absorb(representative, article)
+        return representative, None
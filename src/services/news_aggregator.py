@@ -1,17 +1,59 @@
-from typing import List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from datetime import datetime, timedelta, timezone
 from ..models.article import Article
 from ..services.news_sources.base import NewsSource
+from ..services.near_duplicate import NearDuplicateDetector
+from ..services.relevance_ranker import RelevanceRanker
+from ..services.seen_store import SeenArticleStore
+from ..utils.keyword_matcher import get_keyword_matcher
+from ..utils.url_utils import canonicalize_url
 from ..utils.logger import get_logger
 from ..utils.exceptions import NewsFetchError
 
 logger = get_logger(__name__)
 
+# 관련도 확률(0~1)을 품질 점수에 더할 때의 가중치
+RELEVANCE_WEIGHT = 1.0
+
+# _calculate_quality_scores가 출처 가중치 외에 더할 수 있는 최대 점수
+# (제목 0.3 + 요약 0.2 + 키워드 0.3 + 최신성 0.5). 점수 규칙을 바꾸면 함께 수정해야 합니다.
+MAX_QUALITY_BONUS = 1.3
+
+@dataclass
+class FetchReport:
+    """소스별 수집 결과 요약"""
+    completed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    # 필요한 기사가 모두 확정되어 결과를 기다리지 않은 소스
+    skipped: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
 class NewsAggregator:
     """여러 뉴스 소스를 통합하고 집계하는 서비스"""
 
-    def __init__(self, sources: List[NewsSource]):
+    def __init__(self, sources: List[NewsSource], max_workers: int = 8,
+                 source_timeout: float = 20.0, fetch_deadline: float = 60.0,
+                 seen_store: Optional[SeenArticleStore] = None,
+                 relevance_ranker: Optional[RelevanceRanker] = None, min_relevance: float = 0.3):
         self.sources = sources
+        self.seen_store = seen_store
+        self.relevance_ranker = relevance_ranker
+        self.min_relevance = min_relevance
+        self.last_candidates: List[Article] = []
+        self.max_workers = max_workers
+        self.source_timeout = source_timeout
+        self.fetch_deadline = fetch_deadline
+        self.last_fetch_report = FetchReport()
+        self.near_duplicate_detector = NearDuplicateDetector()
+
+        # 소스별 HTTP 요청도 같은 타임아웃 안에서 끝나도록 맞춤
+        for source in self.sources:
+            source.set_timeout(source_timeout)
+
         self.keywords = [
             'Artificial Intelligence', 'Machine Learning', 'Deep Learning', 'Neural Networks',
             'Generative AI', 'GAI', 'Computer Vision', 'Natural Language Processing', 'NLP',
@@ -24,58 +66,182 @@ class NewsAggregator:
             'ChatGPT', 'GPT', 'OpenAI', 'Google DeepMind', 'TensorFlow', 'PyTorch', 'Midjourney', 'Stable Diffusion',
             'Gemini', 'Anthropic', 'Claude',
         ]
+        self.keyword_matcher = get_keyword_matcher(self.keywords)
 
     def aggregate_news(self, max_articles: int = 10) -> List[Article]:
         """모든 활성화된 소스에서 뉴스를 수집하고 집계합니다."""
         logger.info("뉴스 집계를 시작합니다...")
 
+        all_articles = self._fetch_all_sources()
+
+        if not all_articles:
+            logger.warning("수집된 뉴스가 없습니다.")
+            return []
+
+        # 중복 제거 및 품질 점수 계산
+        unique_articles = self._remove_duplicates(all_articles)
+        unique_articles = self.near_duplicate_detector.merge(unique_articles)
+
+        # 이전 실행에서 이미 발송한 기사는 AI 처리 전에 제외
+        if self.seen_store:
+            unique_articles = self.seen_store.filter_unseen(unique_articles)
+        self.last_candidates = []
+        scored_articles = self.score_candidates(unique_articles)
+
+        # 상위 기사 선택
+        top_articles = sorted(scored_articles, key=lambda x: x.quality_score, reverse=True)[:max_articles]
+
+        logger.info(f"총 {len(top_articles)}개의 뉴스를 최종 선택했습니다.")
+        return top_articles
+
+    def score_candidates(self, articles: List[Article]) -> List[Article]:
+        """품질 점수와 관련도를 계산하고, 관련도 기준을 넘은 기사만 반환합니다.
+
+        점수를 매긴 모든 후보는 관련도 학습 아카이브용으로 last_candidates에 쌓입니다.
+        """
+        scored_articles = self._calculate_quality_scores(articles)
+        self.last_candidates.extend(scored_articles)
+
+        # 로컬 관련도 모델로 AI와 무관한 기사를 AI 처리 전에 걸러냄
+        if self.relevance_ranker and self.relevance_ranker.trained and scored_articles:
+            scored_articles = self._apply_relevance_scores(scored_articles)
+        return scored_articles
+
+    def max_possible_score(self, source: NewsSource) -> float:
+        """source에서 나올 수 있는 기사의 최대 점수 (아직 응답하지 않은 소스의 상한 계산용)"""
+        score = source.get_weight() + MAX_QUALITY_BONUS
+        if self.relevance_ranker and self.relevance_ranker.trained:
+            score += RELEVANCE_WEIGHT
+        return score
+
+    def get_enabled_sources(self) -> List[NewsSource]:
+        """활성화된 소스 목록을 반환합니다."""
+        return [source for source in self.sources if source.is_enabled()]
+
+    def _fetch_all_sources(self) -> List[Article]:
+        """활성화된 모든 소스에서 동시에 뉴스를 수집합니다."""
         all_articles = []
+        for _, articles in self.iter_source_results():
+            all_articles.extend(articles)
+        return all_articles
+
+    def iter_source_results(self, fetch_deadline: Optional[float] = None) -> Iterator[Tuple[NewsSource, List[Article]]]:
+        """활성화된 모든 소스에서 동시에 뉴스를 수집하며, 소스가 끝나는 순서대로 (소스, 기사 목록)을 내보냅니다.
 
-        # 각 소스에서 뉴스 수집
+        소스별 타임아웃과 전체 수집 마감 시간을 적용하며, 실패하거나 시간 안에 끝나지 않은 소스는
+        빈 목록으로 내보냅니다. fetch_deadline을 주면 이번 수집에만 설정값 대신 그 마감 시간(초)을 씁니다.
+        """
+        if fetch_deadline is None:
+            fetch_deadline = self.fetch_deadline
+        enabled_sources = []
         for source in self.sources:
             if not source.is_enabled():
                 logger.info(f"{source.get_source_name()} 소스가 비활성화되어 있습니다.")
                 continue
+            enabled_sources.append(source)
 
-            try:
-                date_from = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-                articles = source.fetch_news(self.keywords, date_from)
+        report = FetchReport()
+        self.last_fetch_report = report
+        if not enabled_sources:
+            return
 
-                # 가중치 적용
-                for article in articles:
-                    article.weight = source.get_weight()
+        date_from = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        started_at: Dict[NewsSource, float] = {}
 
-                all_articles.extend(articles)
-                logger.info(f"{source.get_source_name()}에서 {len(articles)}개 뉴스 수집 완료")
+        fetch_start = time.monotonic()
+        deadline = fetch_start + fetch_deadline
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(enabled_sources))),
+                                      thread_name_prefix="news-fetch")
+        futures = {
+            executor.submit(self._fetch_from_source, source, date_from, started_at): source
+            for source in enabled_sources
+        }
+        pending = set(futures)
 
-            except NewsFetchError as e:
-                logger.error(f"{source.get_source_name()}에서 뉴스 수집 실패: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"{source.get_source_name()}에서 예상치 못한 오류: {e}")
-                continue
+        try:
+            while pending:
+                now = time.monotonic()
 
-        if not all_articles:
-            logger.warning("수집된 뉴스가 없습니다.")
-            return []
+                # 소스별 타임아웃 초과 여부 확인
+                for future in list(pending):
+                    source = futures[future]
+                    source_start = started_at.get(source)
+                    if source_start is not None and now - source_start >= self.source_timeout:
+                        pending.discard(future)
+                        future.cancel()
+                        report.timed_out.append(source.get_source_name())
+                        logger.warning(f"{source.get_source_name()} 소스가 {self.source_timeout:.0f}초 타임아웃을 초과했습니다.")
+                        yield source, []
 
-        # 중복 제거 및 품질 점수 계산
-        unique_articles = self._remove_duplicates(all_articles)
-        scored_articles = self._calculate_quality_scores(unique_articles)
+                if now >= deadline:
+                    logger.warning(f"전체 수집 마감 시간({fetch_deadline:.0f}초)을 초과했습니다.")
+                    for future in pending:
+                        future.cancel()
+                        report.timed_out.append(futures[future].get_source_name())
+                        yield futures[future], []
+                    pending = set()
+                    break
 
-        # 상위 기사 선택
-        top_articles = sorted(scored_articles, key=lambda x: x.quality_score, reverse=True)[:max_articles]
+                if not pending:
+                    break
 
-        logger.info(f"총 {len(top_articles)}개의 뉴스를 최종 선택했습니다.")
-        return top_articles
+                # 가장 먼저 다가오는 타임아웃까지만 대기
+                next_check = deadline
+                for future in pending:
+                    source_start = started_at.get(futures[future])
+                    if source_start is not None:
+                        next_check = min(next_check, source_start + self.source_timeout)
+                done, pending = wait(pending, timeout=max(0.0, next_check - now), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    source = futures[future]
+                    try:
+                        articles = future.result()
+                    except NewsFetchError as e:
+                        report.failed.append(source.get_source_name())
+                        logger.error(f"{source.get_source_name()}에서 뉴스 수집 실패: {e}")
+                        yield source, []
+                        continue
+                    except Exception as e:
+                        report.failed.append(source.get_source_name())
+                        logger.error(f"{source.get_source_name()}에서 예상치 못한 오류: {e}")
+                        yield source, []
+                        continue
+
+                    report.completed.append(source.get_source_name())
+                    logger.info(f"{source.get_source_name()}에서 {len(articles)}개 뉴스 수집 완료")
+                    yield source, articles
+        finally:
+            # 응답하지 않는 소스의 스레드는 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+            # 호출한 쪽이 중간에 close()해도 (GeneratorExit) 수집 보고는 남김
+            report.skipped = [futures[future].get_source_name() for future in pending]
+            report.elapsed = time.monotonic() - fetch_start
+            if report.timed_out:
+                logger.warning(f"시간 내에 응답하지 않은 소스: {', '.join(report.timed_out)}")
+            logger.info(f"소스 수집 완료 ({report.elapsed:.1f}초): 성공 {len(report.completed)}개, "
+                        f"실패 {len(report.failed)}개, 타임아웃 {len(report.timed_out)}개"
+                        + (f", 기다리지 않음 {len(report.skipped)}개" if report.skipped else ""))
+
+    def _fetch_from_source(self, source: NewsSource, date_from: str, started_at: Dict[NewsSource, float]) -> List[Article]:
+        """단일 소스에서 뉴스를 수집하고 가중치를 적용합니다."""
+        # 실제로 실행이 시작된 시점부터 소스별 타임아웃을 계산
+        started_at[source] = time.monotonic()
+        articles = source.fetch_news(self.keywords, date_from)
+
+        # 가중치 적용
+        for article in articles:
+            article.weight = source.get_weight()
+
+        return articles
 
     def _remove_duplicates(self, articles: List[Article]) -> List[Article]:
-        """URL 기반 중복 제거"""
+        """정규화된 URL 기반 중복 제거"""
         seen_urls = set()
         unique_articles = []
 
         for article in articles:
-            url = article.url
+            url = canonicalize_url(article.url)
             if url and url not in seen_urls:
                 seen_urls.add(url)
                 unique_articles.append(article)
@@ -83,6 +249,19 @@ class NewsAggregator:
         logger.info(f"중복 제거: {len(articles)}개 → {len(unique_articles)}개")
         return unique_articles
 
+    def _apply_relevance_scores(self, articles: List[Article]) -> List[Article]:
+        """모든 후보의 관련도를 한 번에 계산하여 품질 점수에 반영하고, min_relevance 미만인 기사는 제외합니다."""
+        scores = self.relevance_ranker.score(articles)
+        relevant = []
+        for article, relevance in zip(articles, scores):
+            article.relevance_score = float(relevance)
+            article.quality_score += RELEVANCE_WEIGHT * article.relevance_score
+            if article.relevance_score >= self.min_relevance:
+                relevant.append(article)
+
+        logger.info(f"관련도 필터: {len(articles)}개 → {len(relevant)}개 (기준 {self.min_relevance:.2f})")
+        return relevant
+
     def _calculate_quality_scores(self, articles: List[Article]) -> List[Article]:
         """뉴스 품질 점수 계산"""
         now = datetime.now(timezone.utc)  # UTC 시간으로 통일
@@ -103,6 +282,10 @@ class NewsAggregator:
             if 100 <= summary_length <= 500:
                 score += 0.2
 
+            # 키워드 점수: 서로 다른 AI 키워드가 많이 등장할수록 가산 (최대 0.3)
+            keyword_counts = self.keyword_matcher.count(article.title + " " + (article.description or ""))
+            score += min(len(keyword_counts), 3) * 0.1
+
             # 최신성 점수
             if article.published_at:
                 try:
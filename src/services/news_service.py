@@ -1,10 +1,14 @@
+import os
 from typing import List
 from ..models.article import Article
 from ..config.settings import Settings
 from ..services.news_sources.news_api_source import NewsAPISource
 from ..services.news_sources.rss_source import RSSSource
+from ..services.news_sources.feed_cache import FeedCache
 from ..services.news_sources.naver_news_source import NaverNewsSource
 from ..services.news_aggregator import NewsAggregator
+from ..services.seen_store import SeenArticleStore
+from ..services.relevance_ranker import RelevanceRanker, RelevanceArchive
 from ..utils.logger import get_logger
 from ..utils.exceptions import NewsFetchError
 
@@ -16,6 +20,15 @@ class NewsService:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.article_count = settings.article_count
+        self.feed_cache = FeedCache(os.path.join(settings.cache_dir, 'feeds'))
+        self.seen_store = None
+        if settings.seen_ttl_days > 0:
+            self.seen_store = SeenArticleStore(os.path.join(settings.cache_dir, 'seen_articles.db'),
+                                               ttl_days=settings.seen_ttl_days)
+        self.relevance_archive = RelevanceArchive(os.path.join(settings.cache_dir, 'relevance_archive.jsonl'))
+        self.relevance_ranker = RelevanceRanker.load(os.path.join(settings.cache_dir, 'relevance_model.npz'))
+        if self.relevance_ranker:
+            logger.info("학습된 관련도 모델을 불러왔습니다.")
         self.aggregator = self._create_aggregator(settings)
 
     def _create_aggregator(self, settings: Settings) -> NewsAggregator:
@@ -38,7 +51,9 @@ class NewsService:
                 source = RSSSource(
                     name=source_config.name,
                     url=source_config.config["url"],
-                    weight=source_config.weight
+                    weight=source_config.weight,
+                    feed_cache=self.feed_cache,
+                    streaming=source_config.config.get("streaming", False)
                 )
                 sources.append(source)
 
@@ -51,7 +66,15 @@ class NewsService:
                 sources.append(source)
 
         logger.info(f"총 {len(sources)}개의 뉴스 소스가 활성화되었습니다.")
-        return NewsAggregator(sources)
+        return NewsAggregator(
+            sources,
+            max_workers=settings.fetch_max_workers,
+            source_timeout=settings.source_timeout,
+            fetch_deadline=settings.fetch_deadline,
+            seen_store=self.seen_store,
+            relevance_ranker=self.relevance_ranker,
+            min_relevance=settings.relevance_min_score
+        )
 
     def fetch_ai_news(self) -> List[Article]:
         """AI 관련 최신 뉴스를 가져옵니다."""
@@ -66,11 +89,29 @@ class NewsService:
             logger.error(f"뉴스 수집 중 오류 발생: {e}")
             raise NewsFetchError(f"뉴스 수집 실패: {e}")
 
+    def mark_delivered(self, articles: List[Article]) -> None:
+        """발송이 끝난 기사를 기록하여 다음 실행에서 다시 선택되지 않도록 합니다.
+
+        이번 실행의 후보 기사와 발송 여부는 관련도 모델 학습용 아카이브에도 기록합니다.
+        """
+        if self.seen_store:
+            self.seen_store.mark_delivered(articles)
+        try:
+            self.relevance_archive.record(self.aggregator.last_candidates, articles)
+        except OSError as e:
+            logger.warning(f"관련도 학습 아카이브 기록 실패: {e}")
+
     def get_source_statistics(self) -> dict:
         """뉴스 소스별 통계를 반환합니다."""
         stats = {
             "total_sources": len(self.aggregator.sources),
             "enabled_sources": len([s for s in self.aggregator.sources if s.is_enabled()]),
-            "source_names": [s.get_source_name() for s in self.aggregator.sources if s.is_enabled()]
+            "source_names": [s.get_source_name() for s in self.aggregator.sources if s.is_enabled()],
+            "timed_out_sources": list(self.aggregator.last_fetch_report.timed_out),
+            "failed_sources": list(self.aggregator.last_fetch_report.failed),
+            "feed_cache": {
+                url: {"hits": st.hits, "misses": st.misses, "bytes_saved": st.bytes_saved, "hit_rate": st.hit_rate}
+                for url, st in self.feed_cache.get_stats().items()
+            }
         }
         return stats
\ No newline at end of file
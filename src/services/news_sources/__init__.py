@@ -1,5 +1,11 @@
 from .base import NewsSource
+from .async_base import AsyncNewsSource
+from .http_client import AsyncHttpPool, get_http_pool
+from .feed_cache import FeedCache
+from .feed_stream import StreamingFeedParser
 from .news_api_source import NewsAPISource
 from .rss_source import RSSSource
+from .naver_news_source import NaverNewsSource
 
-__all__ = ['NewsSource', 'NewsAPISource', 'RSSSource']
+__all__ = ['NewsSource', 'AsyncNewsSource', 'AsyncHttpPool', 'get_http_pool', 'FeedCache', 'StreamingFeedParser',
+           'NewsAPISource', 'RSSSource', 'NaverNewsSource']
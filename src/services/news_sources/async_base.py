@@ -0,0 +1,34 @@
+import concurrent.futures
+from abc import abstractmethod
+from typing import List, Optional
+from .base import NewsSource
+from .http_client import AsyncHttpPool, get_http_pool
+from ...models.article import Article
+from ...utils.logger import get_logger
+from ...utils.exceptions import NewsFetchError
+
+logger = get_logger(__name__)
+
+class AsyncNewsSource(NewsSource):
+    """공유 HTTP 풀을 사용하는 비동기 뉴스 소스 추상 클래스"""
+
+    def __init__(self, name: str, weight: float = 1.0, http_pool: Optional[AsyncHttpPool] = None):
+        super().__init__(name, weight)
+        self.http_pool = http_pool
+
+    def get_http_pool(self) -> AsyncHttpPool:
+        """소스가 사용할 HTTP 풀 반환 (지정하지 않으면 전역 공유 풀)"""
+        return self.http_pool or get_http_pool()
+
+    @abstractmethod
+    async def fetch_news_async(self, keywords: List[str], date_from: str) -> List[Article]:
+        """뉴스를 비동기로 가져오는 메서드"""
+        pass
+
+    def fetch_news(self, keywords: List[str], date_from: str) -> List[Article]:
+        """fetch_news_async를 동기적으로 실행하는 래퍼"""
+        try:
+            return self.get_http_pool().run(self.fetch_news_async(keywords, date_from), timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            logger.error(f"{self.name} 뉴스 수집이 {self.timeout:.0f}초 안에 끝나지 않았습니다.")
+            raise NewsFetchError(f"{self.name} 뉴스 수집 시간 초과")
@@ -13,6 +13,7 @@ class NewsSource(ABC):
         self.name = name
         self.weight = weight
         self.enabled = True
+        self.timeout = 20.0
 
     @abstractmethod
     def fetch_news(self, keywords: List[str], date_from: str) -> List[Article]:
@@ -38,4 +39,12 @@ class NewsSource(ABC):
 
     def set_weight(self, weight: float) -> None:
         """소스 가중치 설정"""
-        self.weight = weight
\ No newline at end of file
+        self.weight = weight
+
+    def get_timeout(self) -> float:
+        """소스 요청 타임아웃(초) 반환"""
+        return self.timeout
+
+    def set_timeout(self, timeout: float) -> None:
+        """소스 요청 타임아웃(초) 설정"""
+        self.timeout = timeout
\ No newline at end of file
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Any, Optional
+from ...utils.logger import get_logger
+from ...utils.url_utils import canonicalize_url
+
+logger = get_logger(__name__)
+
+@dataclass
+class FeedCacheStats:
+    """피드별 캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+@dataclass
+class FeedCacheEntry:
+    """피드 URL별 HTTP 검증자와 파싱된 엔트리"""
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    content_length: int = 0
+    fetched_at: float = 0.0
+    stats: FeedCacheStats = field(default_factory=FeedCacheStats)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """조건부 GET 요청 헤더를 생성합니다."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FeedCacheEntry':
+        stats = FeedCacheStats(**data.get('stats', {}))
+        return cls(
+            url=data.get('url', ''),
+            etag=data.get('etag'),
+            last_modified=data.get('last_modified'),
+            entries=data.get('entries', []),
+            content_length=data.get('content_length', 0),
+            fetched_at=data.get('fetched_at', 0.0),
+            stats=stats
+        )
+
+class FeedCache:
+    """정규화된 피드 URL을 키로 하는 디스크 기반 조건부 GET(ETag / Last-Modified) 캐시"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha1(canonicalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, url: str) -> Optional[FeedCacheEntry]:
+        """캐시된 피드 정보를 불러옵니다."""
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return FeedCacheEntry.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"피드 캐시를 읽지 못했습니다 ({url}): {e}")
+            return None
+
+    def _save(self, entry: FeedCacheEntry) -> None:
+        path = self._path(entry.url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(entry), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def record_hit(self, entry: FeedCacheEntry) -> None:
+        """304 응답으로 캐시를 재사용한 경우를 기록합니다."""
+        entry.stats.hits += 1
+        entry.stats.bytes_saved += entry.content_length
+        entry.fetched_at = time.time()
+        self._save(entry)
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              entries: List[Dict[str, Any]], content_length: int,
+              previous: Optional[FeedCacheEntry] = None) -> FeedCacheEntry:
+        """새로 내려받은 피드의 검증자와 엔트리를 저장합니다."""
+        stats = previous.stats if previous else FeedCacheStats()
+        stats.misses += 1
+        entry = FeedCacheEntry(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            entries=entries,
+            content_length=content_length,
+            fetched_at=time.time(),
+            stats=stats
+        )
+        if etag or last_modified:
+            self._save(entry)
+        return entry
+
+    def get_stats(self) -> Dict[str, FeedCacheStats]:
+        """캐시된 모든 피드의 통계를 반환합니다."""
+        stats = {}
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, file_name), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                stats[data['url']] = FeedCacheStats(**data.get('stats', {}))
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return stats
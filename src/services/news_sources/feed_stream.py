@@ -0,0 +1,120 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# RSS 2.0 / RSS 1.0(RDF)의 item과 Atom의 entry를 모두 엔트리로 취급
+ENTRY_TAGS = {'item', 'entry'}
+SUMMARY_TAGS = ('description', 'summary', 'encoded', 'content')
+DATE_TAGS = ('pubDate', 'published', 'date', 'updated', 'issued', 'modified')
+
+def _local_name(tag: str) -> str:
+    """'{namespace}name' 형태의 태그에서 이름만 반환합니다."""
+    return tag.rsplit('}', 1)[-1] if '}' in tag else tag
+
+def parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """RFC 822(RSS) 또는 ISO 8601(Atom) 날짜 문자열을 UTC datetime으로 변환합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+class StreamingFeedParser:
+    """RSS/Atom 문서를 조각 단위로 받아 엔트리를 하나씩 내보내는 증분 파서
+
+    전체 DOM을 만들지 않고 엔트리 하나를 읽을 때마다 해당 요소를 트리에서 떼어 냅니다.
+    최신순으로 정렬된 피드를 가정하여, date_from보다 오래된 엔트리가 연속으로
+    cutoff_tolerance개 나오면 더 이상 읽지 않습니다.
+    """
+
+    def __init__(self, date_from: Optional[datetime] = None, cutoff_tolerance: int = 3):
+        self.date_from = date_from
+        self.cutoff_tolerance = cutoff_tolerance
+        self.finished = False
+        self.entries_seen = 0
+        self._old_streak = 0
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._stack: List[ET.Element] = []
+
+    def feed(self, chunk: bytes) -> Iterator[Dict[str, Any]]:
+        """바이트 조각을 파서에 넣고 완성된 엔트리를 내보냅니다."""
+        if self.finished:
+            return
+        self._parser.feed(chunk)
+        yield from self._drain()
+
+    def close(self) -> Iterator[Dict[str, Any]]:
+        """남은 데이터를 마무리합니다."""
+        if self.finished:
+            return
+        self._parser.close()
+        yield from self._drain()
+        self.finished = True
+
+    def _drain(self) -> Iterator[Dict[str, Any]]:
+        for event, elem in self._parser.read_events():
+            if event == 'start':
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            if _local_name(elem.tag) not in ENTRY_TAGS:
+                continue
+
+            entry, published = self._extract_entry(elem)
+
+            # 처리한 엔트리는 부모에서 떼어 내어 메모리를 반환
+            elem.clear()
+            if self._stack:
+                self._stack[-1].remove(elem)
+
+            self.entries_seen += 1
+            if self.date_from and published and published < self.date_from:
+                self._old_streak += 1
+                if self._old_streak >= self.cutoff_tolerance:
+                    self.finished = True
+                    return
+                continue
+
+            self._old_streak = 0
+            yield entry
+
+    def _extract_entry(self, elem: ET.Element) -> Tuple[Dict[str, Any], Optional[datetime]]:
+        """엔트리 요소에서 제목, 요약, 링크, 발행 시각을 추출합니다."""
+        fields: Dict[str, str] = {}
+        link = ''
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == 'link':
+                # Atom은 href 속성, RSS는 텍스트로 링크를 제공
+                href = child.get('href')
+                if href and child.get('rel', 'alternate') == 'alternate':
+                    link = link or href
+                elif child.text and child.text.strip():
+                    link = link or child.text.strip()
+                continue
+            if name not in fields:
+                fields[name] = (child.text or '').strip()
+
+        summary = next((fields[tag] for tag in SUMMARY_TAGS if fields.get(tag)), '')
+        published_dt = next((parse_feed_date(fields[tag]) for tag in DATE_TAGS if fields.get(tag)), None)
+
+        entry = {
+            'title': fields.get('title', ''),
+            'summary': summary,
+            'link': link or elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about', ''),
+            'published': published_dt.isoformat() if published_dt else None
+        }
+        return entry, published_dt
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+class AsyncHttpPool:
+    """모든 뉴스 소스가 공유하는 커넥션 풀 기반 비동기 HTTP 클라이언트
+
+    전용 이벤트 루프 스레드에서 하나의 httpx.AsyncClient를 유지하므로
+    동기 호출과 다른 이벤트 루프에서의 호출 모두 같은 연결(keep-alive, HTTP/2)을 재사용합니다.
+    """
+
+    def __init__(self, max_connections: int = 20, max_per_host: int = 4, keepalive_expiry: float = 30.0):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.keepalive_expiry = keepalive_expiry
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """풀 전용 이벤트 루프 스레드를 시작합니다."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="http-pool", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """풀 루프에 바인딩된 클라이언트를 반환합니다. 반드시 풀 루프 안에서 호출해야 합니다."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                headers={
+                    'User-Agent': DEFAULT_USER_AGENT,
+                    'Accept-Encoding': ACCEPT_ENCODING
+                },
+                follow_redirects=True
+            )
+            logger.info(f"공유 HTTP 클라이언트를 생성했습니다 (HTTP/2: {HTTP2_AVAILABLE}, 인코딩: {ACCEPT_ENCODING})")
+        return self._client
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 연결 수를 제한하는 세마포어를 반환합니다."""
+        host = urlsplit(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.max_per_host)
+            self._host_slots[host] = slot
+        return slot
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._host_slot(url):
+            return await self._get_client().request(method, url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """공유 클라이언트로 요청을 보냅니다. 어느 이벤트 루프에서든 호출할 수 있습니다."""
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._request(method, url, **kwargs)
+        future = asyncio.run_coroutine_threadsafe(self._request(method, url, **kwargs), loop)
+        return await asyncio.wrap_future(future)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET 요청을 보냅니다."""
+        return await self.request("GET", url, **kwargs)
+
+    async def _stream(self, method: str, url: str, consumer: Callable[[httpx.Response], Awaitable[Any]],
+                      **kwargs) -> Any:
+        async with self._host_slot(url):
+            async with self._get_client().stream(method, url, **kwargs) as response:
+                return await consumer(response)
+
+    async def stream(self, method: str, url: str, consumer: Callable[[httpx.Response], Awaitable[Any]],
+                     **kwargs) -> Any:
+        """응답 본문을 내려받지 않은 채로 consumer(response)에 넘겨 스트리밍으로 처리합니다.
+
+        consumer는 풀 루프에서 실행되며, 반환값이 그대로 결과가 됩니다.
+        """
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._stream(method, url, consumer, **kwargs)
+        future = asyncio.run_coroutine_threadsafe(self._stream(method, url, consumer, **kwargs), loop)
+        return await asyncio.wrap_future(future)
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """동기 코드에서 코루틴을 풀 루프에서 실행하고 결과를 기다립니다."""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        """클라이언트와 이벤트 루프를 정리합니다."""
+        with self._lock:
+            loop, client = self._loop, self._client
+            self._loop, self._thread, self._client = None, None, None
+            self._host_slots = {}
+        if loop is None:
+            return
+        if client is not None:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+_shared_pool: Optional[AsyncHttpPool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_http_pool() -> AsyncHttpPool:
+    """프로세스 전역에서 공유하는 HTTP 풀을 반환합니다."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = AsyncHttpPool()
+        return _shared_pool
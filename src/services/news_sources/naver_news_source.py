@@ -1,20 +1,21 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 import re
-from .base import NewsSource
-from ...models.article import Article
+from .async_base import AsyncNewsSource
+from .http_client import AsyncHttpPool
+from ...models.article import Article, NAVER_DESCRIPTION_SUFFIX
+from ...utils.keyword_matcher import get_keyword_matcher
 from ...utils.logger import get_logger
 from ...utils.exceptions import NewsFetchError
 
 logger = get_logger(__name__)
 
-class NaverNewsSource(NewsSource):
+class NaverNewsSource(AsyncNewsSource):
     """네이버 뉴스를 사용하는 뉴스 소스"""
 
-    def __init__(self, name: str, category: str, weight: float = 1.0):
-        super().__init__(name, weight)
+    def __init__(self, name: str, category: str, weight: float = 1.0, http_pool: Optional[AsyncHttpPool] = None):
+        super().__init__(name, weight, http_pool)
         self.category = category
         self.base_url = "https://news.naver.com"
 
@@ -34,19 +35,18 @@ class NaverNewsSource(NewsSource):
             "로봇", "자율주행", "빅데이터", "블록체인",
             "4차 산업혁명", "디지털 전환", "스마트팩토리", "메타버스"
         ]
+        self.ai_keyword_matcher = get_keyword_matcher(self.ai_keywords)
 
     def get_source_name(self) -> str:
         return f"네이버 뉴스"
 
-    def fetch_news(self, keywords: List[str], date_from: str) -> List[Article]:
+    async def fetch_news_async(self, keywords: List[str], date_from: str) -> List[Article]:
         """네이버 뉴스에서 AI 관련 뉴스를 가져옵니다."""
         logger.info(f"{self.name}에서 뉴스 수집을 시작합니다...")
 
         try:
             url = self.category_urls.get(self.category, self.category_urls["it"])
-            response = requests.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+            response = await self.get_http_pool().get(url, timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -110,7 +110,7 @@ class NaverNewsSource(NewsSource):
             url = self.base_url + '/' + href
 
         # 간단한 설명 생성
-        description = f"{title} - 네이버 뉴스에서 제공하는 최신 정보입니다."
+        description = f"{title}{NAVER_DESCRIPTION_SUFFIX}"
 
         # timezone-aware datetime 생성
         published_at = datetime.now(timezone.utc)
@@ -126,8 +126,4 @@ class NaverNewsSource(NewsSource):
 
     def _contains_ai_keywords(self, text: str) -> bool:
         """텍스트에 AI 관련 키워드가 포함되어 있는지 확인합니다."""
-        text_lower = text.lower()
-        for keyword in self.ai_keywords:
-            if keyword.lower() in text_lower:
-                return True
-        return False
\ No newline at end of file
+        return self.ai_keyword_matcher.contains(text)
\ No newline at end of file
@@ -1,18 +1,19 @@
-import requests
+import httpx
 from datetime import datetime, timedelta, timezone
-from typing import List
-from .base import NewsSource
+from typing import List, Optional
+from .async_base import AsyncNewsSource
+from .http_client import AsyncHttpPool
 from ...models.article import Article
 from ...utils.logger import get_logger
 from ...utils.exceptions import NewsFetchError
 
 logger = get_logger(__name__)
 
-class NewsAPISource(NewsSource):
+class NewsAPISource(AsyncNewsSource):
     """News API를 사용하는 뉴스 소스"""
 
-    def __init__(self, api_key: str, weight: float = 1.0):
-        super().__init__("News API", weight)
+    def __init__(self, api_key: str, weight: float = 1.0, http_pool: Optional[AsyncHttpPool] = None):
+        super().__init__("News API", weight, http_pool)
         self.api_key = api_key
         self.base_url = "https://newsapi.org/v2/everything"
 
@@ -25,7 +26,7 @@ class NewsAPISource(NewsSource):
     def get_source_name(self) -> str:
         return self.name
 
-    def fetch_news(self, keywords: List[str], date_from: str) -> List[Article]:
+    async def fetch_news_async(self, keywords: List[str], date_from: str) -> List[Article]:
         """News API를 통해 AI 관련 최신 뉴스를 가져옵니다."""
         logger.info(f"{self.name}에서 뉴스 수집을 시작합니다...")
 
@@ -42,7 +43,7 @@ class NewsAPISource(NewsSource):
         logger.info(f"뉴스 검색어: {query}")
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = await self.get_http_pool().get(self.base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -57,7 +58,7 @@ class NewsAPISource(NewsSource):
 
             return articles
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"{self.name} API 요청 중 오류 발생: {e}")
             raise NewsFetchError(f"{self.name} 뉴스 수집 실패: {e}")
         except Exception as e:
@@ -1,38 +1,52 @@
 import feedparser
+import httpx
+import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from typing import List
-from .base import NewsSource
+from typing import List, Dict, Any, Optional
+from .async_base import AsyncNewsSource
+from .feed_cache import FeedCache
+from .feed_stream import StreamingFeedParser, parse_feed_date
+from .http_client import AsyncHttpPool
 from ...models.article import Article
+from ...utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
 from ...utils.logger import get_logger
 from ...utils.exceptions import NewsFetchError
+from ...utils.token_budget import strip_html
 
 logger = get_logger(__name__)
 
-class RSSSource(NewsSource):
+class RSSSource(AsyncNewsSource):
     """RSS 피드를 사용하는 뉴스 소스"""
 
-    def __init__(self, name: str, url: str, weight: float = 1.0, keywords: List[str] = None):
-        super().__init__(name, weight)
+    def __init__(self, name: str, url: str, weight: float = 1.0, keywords: List[str] = None,
+                 http_pool: Optional[AsyncHttpPool] = None, feed_cache: Optional[FeedCache] = None,
+                 streaming: bool = False):
+        super().__init__(name, weight, http_pool)
         self.url = url
         self.keywords = keywords or []
+        self.feed_cache = feed_cache
+        self.streaming = streaming
 
     def get_source_name(self) -> str:
         return self.name
 
-    def fetch_news(self, keywords: List[str], date_from: str) -> List[Article]:
+    async def fetch_news_async(self, keywords: List[str], date_from: str) -> List[Article]:
         """RSS 피드에서 뉴스를 가져옵니다."""
         logger.info(f"{self.name}에서 뉴스 수집을 시작합니다...")
 
         try:
-            feed = feedparser.parse(self.url)
-
-            if feed.bozo:
-                logger.warning(f"{self.name} RSS 피드 파싱 오류: {feed.bozo_exception}")
+            if self.streaming:
+                entries = await self._fetch_entries_streaming(date_from)
+            else:
+                entries = await self._fetch_entries()
 
+            matcher = get_keyword_matcher(keywords) if keywords else None
             articles = []
-            for entry in feed.entries:
+            for entry in entries:
+                # 일부 피드는 요약 대신 HTML 본문 전체를 주므로 일반 텍스트로 변환
+                entry = {**entry, 'summary': strip_html(entry['summary'])}
                 # 키워드 필터링
-                if self._contains_keywords(entry.title + " " + entry.summary, keywords):
+                if self._contains_keywords(entry['title'] + " " + entry['summary'], matcher):
                     article = self._create_article_from_entry(entry)
                     articles.append(article)
 
@@ -43,36 +57,148 @@ class RSSSource(NewsSource):
             logger.error(f"{self.name} RSS 피드 처리 중 오류: {e}")
             raise NewsFetchError(f"{self.name} 뉴스 수집 실패: {e}")
 
-    def _contains_keywords(self, text: str, keywords: List[str]) -> bool:
-        """텍스트에 키워드가 포함되어 있는지 확인합니다."""
-        if not keywords:
+    async def _fetch_entries(self) -> List[Dict[str, Any]]:
+        """피드를 내려받아 정규화된 엔트리 목록을 반환합니다. 변경이 없으면(304) 캐시된 엔트리를 재사용합니다."""
+        cached = self.feed_cache.load(self.url) if self.feed_cache else None
+        headers = cached.conditional_headers() if cached else {}
+
+        # feedparser는 타임아웃과 커넥션 재사용을 지원하지 않으므로 공유 풀로 내려받아 파싱
+        response = await self.get_http_pool().get(self.url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and cached:
+            self.feed_cache.record_hit(cached)
+            logger.info(f"{self.name} 피드가 변경되지 않아 캐시를 사용합니다 "
+                        f"(적중 {cached.stats.hits}회, 절약 {cached.stats.bytes_saved:,}바이트)")
+            return cached.entries
+
+        response.raise_for_status()
+        feed = feedparser.parse(response.content, response_headers=dict(response.headers))
+
+        if feed.bozo:
+            logger.warning(f"{self.name} RSS 피드 파싱 오류: {feed.bozo_exception}")
+
+        entries = [self._normalize_entry(entry) for entry in feed.entries]
+
+        if self.feed_cache:
+            self.feed_cache.store(
+                self.url,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                entries=entries,
+                content_length=response.num_bytes_downloaded,
+                previous=cached
+            )
+        return entries
+
+    async def _fetch_entries_streaming(self, date_from: str) -> List[Dict[str, Any]]:
+        """피드를 스트리밍으로 파싱하며 date_from보다 오래된 엔트리에 도달하면 읽기를 중단합니다.
+
+        XML이 엄격하지 않아 증분 파싱에 실패하면 feedparser 기반 전체 파싱으로 대체합니다.
+        """
+        cutoff = self._parse_date_from(date_from)
+        cached = self.feed_cache.load(self.url) if self.feed_cache else None
+        headers = cached.conditional_headers() if cached else {}
+
+        async def consume(response: httpx.Response):
+            if response.status_code == 304:
+                return None, response.headers, 0
+            response.raise_for_status()
+
+            parser = StreamingFeedParser(date_from=cutoff)
+            entries = []
+            async for chunk in response.aiter_bytes():
+                entries.extend(parser.feed(chunk))
+                if parser.finished:
+                    break
+            entries.extend(parser.close())
+            logger.info(f"{self.name} 스트리밍 파싱: {parser.entries_seen}개 엔트리를 읽고 {len(entries)}개를 사용합니다.")
+            return entries, response.headers, response.num_bytes_downloaded
+
+        try:
+            entries, response_headers, downloaded = await self.get_http_pool().stream(
+                "GET", self.url, consume, headers=headers, timeout=self.timeout
+            )
+        except ET.ParseError as e:
+            logger.warning(f"{self.name} 피드를 스트리밍으로 파싱하지 못해 전체 파싱으로 대체합니다: {e}")
+            return await self._fetch_entries()
+
+        if entries is None and cached:
+            self.feed_cache.record_hit(cached)
+            logger.info(f"{self.name} 피드가 변경되지 않아 캐시를 사용합니다 "
+                        f"(적중 {cached.stats.hits}회, 절약 {cached.stats.bytes_saved:,}바이트)")
+            return [entry for entry in cached.entries if self._is_newer_than(entry, cutoff)]
+        if entries is None:
+            return await self._fetch_entries()
+
+        if self.feed_cache:
+            self.feed_cache.store(
+                self.url,
+                etag=response_headers.get('ETag'),
+                last_modified=response_headers.get('Last-Modified'),
+                entries=entries,
+                content_length=downloaded,
+                previous=cached
+            )
+        return entries
+
+    def _parse_date_from(self, date_from: str) -> Optional[datetime]:
+        """'YYYY-MM-DD' 형식의 date_from을 UTC datetime으로 변환합니다."""
+        if not date_from:
+            return None
+        try:
+            return datetime.strptime(date_from, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        except ValueError:
+            return parse_feed_date(date_from)
+
+    def _is_newer_than(self, entry: Dict[str, Any], cutoff: Optional[datetime]) -> bool:
+        """발행 시각이 없거나 cutoff 이후인 엔트리인지 확인합니다."""
+        if not cutoff or not entry.get('published'):
+            return True
+        try:
+            return datetime.fromisoformat(entry['published']) >= cutoff
+        except ValueError:
             return True
 
-        text_lower = text.lower()
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return True
-        return False
+    def _normalize_entry(self, entry) -> Dict[str, Any]:
+        """feedparser 엔트리를 캐시 가능한 딕셔너리로 변환합니다."""
+        published = None
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            try:
+                published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc).isoformat()
+            except (ValueError, TypeError):
+                published = None
+
+        return {
+            'title': entry.get('title', ''),
+            'summary': entry.get('summary', ''),
+            'link': entry.get('link', ''),
+            'published': published
+        }
 
-    def _create_article_from_entry(self, entry) -> Article:
-        """RSS 엔트리에서 Article 객체를 생성합니다."""
+    def _contains_keywords(self, text: str, matcher: Optional[KeywordMatcher]) -> bool:
+        """텍스트에 키워드가 포함되어 있는지 확인합니다."""
+        if not matcher:
+            return True
+        return matcher.contains(text)
+
+    def _create_article_from_entry(self, entry: Dict[str, Any]) -> Article:
+        """정규화된 RSS 엔트리에서 Article 객체를 생성합니다."""
         # published_at 파싱
         published_at = None
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+        if entry.get('published'):
             try:
-                # timezone-naive datetime 생성 후 UTC로 설정
-                published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            except (ValueError, TypeError):
+                published_at = datetime.fromisoformat(entry['published'])
+            except ValueError:
                 # 파싱 실패 시 현재 시간 사용
                 published_at = datetime.now(timezone.utc)
         else:
-            # published_parsed가 없으면 현재 시간 사용
+            # 발행 시각이 없으면 현재 시간 사용
             published_at = datetime.now(timezone.utc)
 
         return Article(
-            title=entry.title,
-            description=entry.summary,
-            url=entry.link,
+            title=entry['title'],
+            description=entry['summary'],
+            url=entry['link'],
             source_name=self.name,
             source_id=self.name.lower().replace(' ', '_'),
             published_at=published_at
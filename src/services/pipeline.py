@@ -0,0 +1,339 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+from ..models.article import Article
+from ..utils.logger import get_logger
+from ..utils.url_utils import canonicalize_url
+from ..utils.exceptions import NewsFetchError, TemplateError, AIProcessingError
+from ..utils.run_budget import RunBudget
+from .ai_service import AIService
+from .email_service import EmailService
+from .near_duplicate import StreamingNearDuplicateMerger
+from .news_aggregator import NewsAggregator
+from .run_checkpoint import RunCheckpoint
+
+logger = get_logger(__name__)
+
+# 단계 사이 대기열에서 입력이 끝났음을 알리는 표식
+_END = object()
+
+# 시간 예산이 빠듯할 때 남은 작업 시간 중 수집에 쓸 비율
+FETCH_BUDGET_SHARE = 0.5
+
+# AI 단계가 묶음을 채우기 위해 다음 기사를 기다리는 최대 시간(초)
+AI_COLLECT_WAIT = 0.5
+
+@dataclass
+class StageStats:
+    """파이프라인 단계별 처리 통계"""
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    max_queue_depth: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def start(self) -> None:
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+
+    def record(self, items: int, busy_seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self.started_at is None:
+                self.started_at = now - busy_seconds
+            self.finished_at = now
+            self.items += items
+            self.busy_seconds += busy_seconds
+
+    def observe_queue(self, depth: int) -> None:
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """단계가 일한 구간 동안의 초당 처리량"""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"[{self.name}] {self.items}개, {self.throughput:.1f}개/초, 구간 {self.elapsed:.1f}초, "
+                f"작업 {self.busy_seconds:.1f}초, 최대 대기열 {self.max_queue_depth}")
+
+@dataclass
+class PipelineResult:
+    """파이프라인 실행 결과"""
+    articles: List[Article]
+    categories: List[Dict[str, Any]]
+    rendered: Dict[str, Tuple[str, str]]
+    stats: List[StageStats]
+    elapsed: float = 0.0
+
+class StreamingTopKSelector:
+    """소스가 끝나는 순서대로 후보를 받아, 최종 상위 k개에 들어갈 것이 확실해진 기사부터 내보내는 선택기
+
+    아직 응답하지 않은 소스가 낼 수 있는 최대 점수(상한)보다 점수가 높은 후보는 이후에 어떤 기사가
+    들어와도 밀려나지 않으므로 바로 확정합니다. 모든 소스가 끝나면 남은 자리를 점수 순으로 채웁니다.
+    """
+
+    def __init__(self, aggregator: NewsAggregator, max_articles: int):
+        self.aggregator = aggregator
+        self.max_articles = max_articles
+        self.committed: List[Article] = []
+        self._committed_ids: Set[int] = set()
+        self._candidates: Dict[int, Article] = {}
+        self._seen_urls: Set[str] = set()
+        self._merger = StreamingNearDuplicateMerger()
+
+    def add(self, articles: List[Article]) -> None:
+        """한 소스의 기사를 중복 제거, 발송 이력 필터, 근사 중복 병합, 점수 계산을 거쳐 후보에 추가합니다."""
+        unique = []
+        for article in articles:
+            url = canonicalize_url(article.url)
+            if url and url not in self._seen_urls:
+                self._seen_urls.add(url)
+                unique.append(article)
+        if self.aggregator.seen_store:
+            unique = self.aggregator.seen_store.filter_unseen(unique)
+
+        fresh = []
+        for article in unique:
+            representative, displaced = self._merger.add(
+                article, can_replace=lambda rep: id(rep) not in self._committed_ids)
+            if displaced is not None:
+                self._candidates.pop(id(displaced), None)
+            if representative is article:
+                fresh.append(article)
+
+        for article in self.aggregator.score_candidates(fresh):
+            self._candidates[id(article)] = article
+
+    def commit_stable(self, upper_bound: float) -> List[Article]:
+        """upper_bound보다 점수가 높아 순위가 확정된 후보를 점수 순으로 확정하고 반환합니다."""
+        released = []
+        for article in sorted(self._candidates.values(), key=lambda a: a.quality_score, reverse=True):
+            if len(self.committed) >= self.max_articles or article.quality_score <= upper_bound:
+                break
+            del self._candidates[id(article)]
+            self._committed_ids.add(id(article))
+            self.committed.append(article)
+            released.append(article)
+        return released
+
+class PipelineRunner:
+    """수집, AI 처리, 기사 조각 렌더링을 대기열로 연결해 겹쳐 실행하는 파이프라인
+
+    수집 단계는 순위가 확정된 기사부터 AI 단계로 넘기고, AI 단계는 요약이 끝난 기사를 렌더링 단계로 넘깁니다.
+    AI 단계는 대기열의 기사를 잠시 기다려 한 번에 모은 뒤 AIService가 배치로 묶어 병렬 처리하게 합니다.
+    대기열 크기는 queue_size로 제한되어 앞 단계가 너무 앞서 나가지 않습니다. 모든 기사가 처리되면
+    카테고리 분류와 템플릿별 최종 렌더링을 수행합니다.
+    """
+
+    def __init__(self, aggregator: NewsAggregator, ai_service: AIService, max_articles: int,
+                 email_service: Optional[EmailService] = None, queue_size: int = 16,
+                 budget: Optional[RunBudget] = None):
+        self.aggregator = aggregator
+        self.budget = budget
+        self.ai_service = ai_service
+        self.email_service = email_service
+        self.max_articles = max_articles
+        self.queue_size = queue_size
+        # 배치 모드에서는 워커마다 배치 하나를 채울 만큼, 아니면 워커 수만큼 기사를 모아 한 번에 처리
+        chunk_size = ai_service.batch_max_articles if ai_service.batch_token_budget > 0 else 1
+        self.ai_collect_size = max(1, ai_service.executor.max_workers) * max(1, chunk_size)
+
+    def run(self, checkpoint: Optional[RunCheckpoint] = None) -> PipelineResult:
+        """파이프라인을 실행하고 결과와 단계별 통계를 반환합니다.
+
+        checkpoint가 주어지면 단계가 끝날 때마다 결과를 저장하고, 이미 저장된 단계는 다시 실행하지 않고
+        마지막으로 끝난 단계부터 이어서 실행합니다.
+        """
+        started = time.monotonic()
+        template_names = self.email_service.get_template_names() if self.email_service else []
+        stats = {name: StageStats(name) for name in ("fetch", "ai", "prerender", "categorize", "render")}
+        articles: Optional[List[Article]] = None
+        categories: Optional[List[Dict[str, Any]]] = None
+        rendered: Optional[Dict[str, Tuple[str, str]]] = None
+        fragments: Dict[int, Dict[str, str]] = {}
+
+        stage = checkpoint.last_completed_stage() if checkpoint else None
+        if stage:
+            logger.info(f"체크포인트({checkpoint.path})의 '{stage}' 단계 이후부터 이어서 실행합니다.")
+            if stage == "raw":
+                articles = checkpoint.load_articles("raw")
+                began = time.monotonic()
+                self.ai_service.process_articles(articles)
+                stats["ai"].record(len(articles), time.monotonic() - began)
+                checkpoint.save_articles("processed", articles)
+            else:
+                articles = checkpoint.load_articles("processed")
+            if stage in ("categories", "rendered"):
+                categories = checkpoint.load_categories()
+            if stage == "rendered":
+                rendered = checkpoint.load_rendered()
+
+        if articles is None:
+            articles, fragments = self._run_streaming(stats, template_names, checkpoint)
+
+        logger.info(f"총 {len(articles)}개의 뉴스를 최종 선택했습니다.")
+        if not articles:
+            return PipelineResult(articles, [], {}, list(stats.values()), time.monotonic() - started)
+
+        if categories is None:
+            began = time.monotonic()
+            try:
+                categories = self.ai_service.categorize_articles(articles)
+            except AIProcessingError as e:
+                logger.error(f"카테고리 분류 중 오류: {e}")
+                categories = [{"category_name": "주요 뉴스", "articles": list(range(len(articles)))}]
+            stats["categorize"].record(len(articles), time.monotonic() - began)
+            if checkpoint:
+                checkpoint.save_categories(categories)
+
+        if rendered is None:
+            rendered = {}
+            if self.email_service:
+                began = time.monotonic()
+                article_fragments = {
+                    template_name: {
+                        index: fragments[id(article)][template_name]
+                        for index, article in enumerate(articles) if id(article) in fragments
+                    }
+                    for template_name in template_names
+                }
+                rendered = self.email_service.render_emails(articles, categories, article_fragments)
+                stats["render"].record(len(rendered), time.monotonic() - began)
+                if checkpoint:
+                    checkpoint.save_rendered(rendered)
+
+        result = PipelineResult(articles, categories, rendered, list(stats.values()), time.monotonic() - started)
+        for stage_stats in result.stats:
+            logger.info(stage_stats.summary())
+        logger.info(f"파이프라인 완료: {result.elapsed:.1f}초")
+        return result
+
+    def _run_streaming(self, stats: Dict[str, StageStats], template_names: List[str],
+                       checkpoint: Optional[RunCheckpoint]) -> Tuple[List[Article], Dict[int, Dict[str, str]]]:
+        """수집, AI 처리, 기사 조각 렌더링 단계를 겹쳐 실행하고 (선택된 기사, 기사별 조각)을 반환합니다."""
+        ai_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        render_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        selector = StreamingTopKSelector(self.aggregator, self.max_articles)
+        fragments: Dict[int, Dict[str, str]] = {}
+        raw_articles: List[Article] = []
+        errors: List[BaseException] = []
+
+        def put(target: queue.Queue, item: Any, stage: StageStats) -> None:
+            target.put(item)
+            stage.observe_queue(target.qsize())
+
+        fetch_deadline = self.aggregator.fetch_deadline
+        fetch_capped = False
+        if self.budget and self.budget.work_remaining() * FETCH_BUDGET_SHARE < fetch_deadline:
+            # 남은 작업 시간의 일부만 수집에 쓰고 나머지는 AI 처리 몫으로 남김 (이번 수집에만 적용)
+            fetch_deadline = self.budget.work_remaining() * FETCH_BUDGET_SHARE
+            fetch_capped = True
+
+        def fetch_stage() -> None:
+            stats["fetch"].start()
+            fetch_started = time.monotonic()
+            try:
+                self.aggregator.last_candidates = []
+                pending = set(self.aggregator.get_enabled_sources())
+                results = self.aggregator.iter_source_results(fetch_deadline)
+                for source, articles in results:
+                    began = time.monotonic()
+                    pending.discard(source)
+                    selector.add(articles)
+                    upper_bound = max((self.aggregator.max_possible_score(s) for s in pending), default=float('-inf'))
+                    released = selector.commit_stable(upper_bound)
+                    stats["fetch"].record(len(articles), time.monotonic() - began)
+                    if released:
+                        logger.info(f"{source.get_source_name()} 수집 후 {len(released)}개 기사를 AI 처리로 넘깁니다.")
+                    for article in released:
+                        # AI 처리 전 원문을 체크포인트용으로 복사해 둠
+                        raw_articles.append(Article.from_dict(article.to_dict()))
+                        put(ai_queue, article, stats["ai"])
+                    if len(selector.committed) >= self.max_articles and pending:
+                        logger.info(f"상위 {self.max_articles}개 기사가 모두 확정되어 남은 소스 {len(pending)}개는 기다리지 않습니다.")
+                        break
+                results.close()
+                if fetch_capped and time.monotonic() - fetch_started >= fetch_deadline:
+                    self.budget.degrade("뉴스 수집", f"시간 예산 때문에 수집 마감을 {fetch_deadline:.0f}초로 줄여 "
+                                                     f"늦게 응답한 소스 결과 제외")
+            except BaseException as e:
+                errors.append(e)
+                logger.error(f"파이프라인 수집 단계 오류: {e}")
+            finally:
+                ai_queue.put(_END)
+
+        def ai_stage() -> None:
+            finished = False
+            while not finished:
+                item = ai_queue.get()
+                if item is _END:
+                    break
+                # 다음 기사가 AI_COLLECT_WAIT초 안에 오면 계속 모아 배치가 실행 타이밍에 따라 쪼개지지 않게 함
+                chunk = [item]
+                while len(chunk) < self.ai_collect_size:
+                    try:
+                        item = ai_queue.get(timeout=AI_COLLECT_WAIT)
+                    except queue.Empty:
+                        break
+                    if item is _END:
+                        finished = True
+                        break
+                    chunk.append(item)
+
+                began = time.monotonic()
+                try:
+                    self.ai_service.process_articles(chunk)
+                except Exception as e:
+                    logger.error(f"파이프라인 AI 처리 단계 오류: {e}")
+                stats["ai"].record(len(chunk), time.monotonic() - began)
+                for article in chunk:
+                    put(render_queue, article, stats["prerender"])
+
+        def prerender_stage() -> None:
+            while True:
+                article = render_queue.get()
+                if article is _END:
+                    break
+                if not template_names:
+                    continue
+                began = time.monotonic()
+                try:
+                    fragments[id(article)] = self.email_service.template_service.prepare_article(article, template_names)
+                except TemplateError as e:
+                    logger.warning(f"기사 조각을 미리 렌더링하지 못했습니다 ({article.title}): {e}")
+                stats["prerender"].record(1, time.monotonic() - began)
+
+        fetch_thread = threading.Thread(target=fetch_stage, name="pipeline-fetch", daemon=True)
+        ai_thread = threading.Thread(target=ai_stage, name="pipeline-ai", daemon=True)
+        prerender_thread = threading.Thread(target=prerender_stage, name="pipeline-prerender", daemon=True)
+
+        fetch_thread.start()
+        ai_thread.start()
+        prerender_thread.start()
+
+        fetch_thread.join()
+        if checkpoint and not errors:
+            checkpoint.save_articles("raw", raw_articles)
+        ai_thread.join()
+        render_queue.put(_END)
+        prerender_thread.join()
+
+        if errors:
+            raise NewsFetchError(f"뉴스 수집 실패: {errors[0]}")
+
+        if checkpoint:
+            checkpoint.save_articles("processed", selector.committed)
+        return selector.committed, fragments
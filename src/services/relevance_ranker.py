@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from contextlib import suppress
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from ..models.article import Article
+from ..utils.logger import get_logger
+from ..utils.url_utils import canonicalize_url
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r'\w+')
+# 특징 구성이 바뀌면 올려서 이전 특징으로 학습한 모델을 쓰지 않도록 함
+FEATURE_VERSION = 2
+
+@lru_cache(maxsize=200000)
+def _bucket(feature: str, dim: int) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=4).digest(), 'little') % dim
+
+def extract_features(article: Article) -> List[str]:
+    """기사의 제목과 설명에서 단어/단어쌍/글자 3-gram 특징을 추출합니다.
+
+    한국어는 조사가 붙어 단어 형태가 자주 바뀌므로 단어 안의 글자 3-gram도 함께 사용합니다.
+    학습 레이블(발송 여부)이 출처 가중치의 영향을 받으므로, 출처 가중치를 다시 학습해 낮은 가중치의 출처를
+    계속 걸러내지 않도록 출처는 특징으로 쓰지 않습니다.
+    """
+    words = _WORD_RE.findall(f"{article.title} {article.description or ''}".lower())
+    features = [f"w:{word}" for word in words]
+    features.extend(f"b:{a} {b}" for a, b in zip(words, words[1:]))
+    for word in words:
+        if len(word) > 3:
+            features.extend(f"c:{word[i:i + 3]}" for i in range(len(word) - 2))
+    return features
+
+class RelevanceRanker:
+    """해시된 n-gram 특징과 로지스틱 회귀로 기사의 AI 관련도(0~1)를 예측하는 로컬 모델
+
+    특징은 dim 크기의 버킷으로 해싱되며, 모든 기사의 특징을 하나의 배열로 이어 붙여
+    한 번의 벡터 연산으로 점수를 계산합니다.
+    """
+
+    def __init__(self, dim: int = 2 ** 18, weights: Optional[np.ndarray] = None, bias: float = 0.0):
+        self.dim = dim
+        self.weights = weights if weights is not None else np.zeros(dim, dtype=np.float32)
+        self.bias = bias
+        self.trained = weights is not None
+
+    def _vectorize(self, articles: Sequence[Article]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """기사별 특징 버킷 번호, 값(행 단위 L2 정규화), 기사 번호를 이어 붙인 배열로 반환합니다."""
+        indices, values, rows = [], [], []
+        for row, article in enumerate(articles):
+            counts: Dict[int, int] = {}
+            for feature in extract_features(article):
+                bucket = _bucket(feature, self.dim)
+                counts[bucket] = counts.get(bucket, 0) + 1
+            norm = np.sqrt(sum(count * count for count in counts.values())) or 1.0
+            for bucket, count in counts.items():
+                indices.append(bucket)
+                values.append(count / norm)
+                rows.append(row)
+        return (np.array(indices, dtype=np.int64), np.array(values, dtype=np.float32),
+                np.array(rows, dtype=np.int64))
+
+    def _logits(self, indices: np.ndarray, values: np.ndarray, rows: np.ndarray, count: int) -> np.ndarray:
+        return np.bincount(rows, weights=self.weights[indices] * values, minlength=count) + self.bias
+
+    def score(self, articles: Sequence[Article]) -> np.ndarray:
+        """기사별 AI 관련도 확률을 반환합니다."""
+        if not articles:
+            return np.zeros(0)
+        indices, values, rows = self._vectorize(articles)
+        return 1.0 / (1.0 + np.exp(-self._logits(indices, values, rows, len(articles))))
+
+    def fit(self, articles: Sequence[Article], labels: Sequence[int], epochs: int = 300,
+            learning_rate: float = 2.0, l2: float = 1e-4) -> 'RelevanceRanker':
+        """전체 배치 경사 하강법으로 모델을 학습합니다. 양성/음성 비율 차이는 샘플 가중치로 보정합니다."""
+        y = np.asarray(labels, dtype=np.float64)
+        if len(articles) != len(y) or len(y) == 0:
+            raise ValueError("학습 데이터와 레이블의 개수가 맞지 않거나 비어 있습니다.")
+
+        indices, values, rows = self._vectorize(articles)
+        positives = max(y.sum(), 1.0)
+        negatives = max(len(y) - y.sum(), 1.0)
+        sample_weight = np.where(y == 1, len(y) / (2 * positives), len(y) / (2 * negatives))
+
+        weights = np.zeros(self.dim, dtype=np.float64)
+        bias = 0.0
+        for _ in range(epochs):
+            logits = np.bincount(rows, weights=weights[indices] * values, minlength=len(y)) + bias
+            error = (1.0 / (1.0 + np.exp(-logits)) - y) * sample_weight / len(y)
+            gradient = np.bincount(indices, weights=error[rows] * values, minlength=self.dim)
+            weights -= learning_rate * (gradient + l2 * weights)
+            bias -= learning_rate * error.sum()
+
+        self.weights = weights.astype(np.float32)
+        self.bias = float(bias)
+        self.trained = True
+        return self
+
+    def save(self, path: str) -> None:
+        """모델을 파일에 저장합니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, weights=self.weights, bias=np.array(self.bias), dim=np.array(self.dim),
+                            feature_version=np.array(FEATURE_VERSION))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['RelevanceRanker']:
+        """저장된 모델을 불러옵니다. 파일이 없거나 읽을 수 없거나 특징 버전이 다르면 None을 반환합니다."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                version = int(data['feature_version']) if 'feature_version' in data.files else 1
+                if version != FEATURE_VERSION:
+                    logger.warning(f"관련도 모델의 특징 버전({version})이 현재 버전({FEATURE_VERSION})과 달라 사용하지 않습니다. "
+                                   f"train-relevance.py로 다시 학습하세요.")
+                    return None
+                return cls(dim=int(data['dim']), weights=data['weights'], bias=float(data['bias']))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"관련도 모델을 불러오지 못했습니다 ({path}): {e}")
+            return None
+
+class RelevanceArchive:
+    """관련도 모델 학습용으로 후보 기사와 발송 여부(delivered/skipped)를 JSONL로 쌓는 저장소"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, candidates: Sequence[Article], delivered: Sequence[Article]) -> None:
+        """후보 기사 중 발송한 기사는 1, 나머지는 0으로 기록합니다."""
+        if not candidates:
+            return
+        delivered_urls = {canonicalize_url(article.url) for article in delivered}
+        now = time.time()
+        lines = []
+        for article in candidates:
+            label = 1 if canonicalize_url(article.url) in delivered_urls else 0
+            lines.append(json.dumps({
+                'title': article.title,
+                'description': article.description,
+                'url': article.url,
+                'source_id': article.source_id,
+                'label': label,
+                'recorded_at': now
+            }, ensure_ascii=False))
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def load(self) -> Tuple[List[Article], List[int]]:
+        """기록된 기사와 레이블을 불러옵니다. 같은 기사가 여러 번 기록되었으면 마지막 레이블을 사용합니다."""
+        records: Dict[str, dict] = {}
+        with suppress(FileNotFoundError), open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    records[canonicalize_url(record['url'])] = record
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+        articles, labels = [], []
+        for record in records.values():
+            try:
+                articles.append(Article(
+                    title=record['title'],
+                    description=record.get('description') or '',
+                    url=record['url'],
+                    source_name=record.get('source_id') or 'Unknown',
+                    source_id=record.get('source_id') or ''
+                ))
+            except ValueError:
+                continue
+            labels.append(int(record['label']))
+        return articles, labels
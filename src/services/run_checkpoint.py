@@ -0,0 +1,158 @@
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+from ..models.article import Article
+from ..models.delivery_result import DeliveryResult
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 파이프라인 단계 순서: 뒤 단계가 저장되어 있으면 앞 단계는 다시 실행할 필요가 없습니다.
+STAGES = ("raw", "processed", "categories", "rendered")
+
+class RunCheckpoint:
+    """실행 단계별 결과를 {base_dir}/{날짜}/{run_id} 디렉터리에 저장하고 다시 불러오는 체크포인트
+
+    raw(선택된 원문 기사), processed(AI 처리된 기사), categories, rendered(템플릿별 HTML)와
+    채널별 발송 완료 여부, 이메일 수신자별 발송 결과를 기록하므로, 실패한 실행을 마지막으로 끝난 단계부터
+    이어서 실행하고 이메일은 받지 못한 수신자에게만 다시 보낼 수 있습니다.
+    """
+
+    def __init__(self, base_dir: str, run_date: str, run_id: str):
+        self.base_dir = base_dir
+        self.run_date = run_date
+        self.run_id = run_id
+        self.path = os.path.join(base_dir, run_date, run_id)
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    @classmethod
+    def create(cls, base_dir: str) -> 'RunCheckpoint':
+        """오늘 날짜로 새 실행 체크포인트를 만듭니다."""
+        now = datetime.now()
+        run_id = f"{now.strftime('%H%M%S')}-{os.getpid()}"
+        return cls(base_dir, now.strftime('%Y-%m-%d'), run_id)
+
+    @classmethod
+    def find_resumable(cls, base_dir: str) -> Optional['RunCheckpoint']:
+        """오늘 실행 중 완료되지 않은 가장 최근 실행을 찾습니다."""
+        day_dir = os.path.join(base_dir, datetime.now().strftime('%Y-%m-%d'))
+        if not os.path.isdir(day_dir):
+            return None
+        for run_id in sorted(os.listdir(day_dir), reverse=True):
+            checkpoint = cls(base_dir, os.path.basename(day_dir), run_id)
+            if not checkpoint.is_completed():
+                return checkpoint
+        return None
+
+    @staticmethod
+    def cleanup(base_dir: str, keep_days: int = 7) -> None:
+        """keep_days보다 오래된 날짜의 실행 기록을 삭제합니다."""
+        if not os.path.isdir(base_dir):
+            return
+        cutoff = (datetime.now() - timedelta(days=keep_days)).strftime('%Y-%m-%d')
+        for run_date in os.listdir(base_dir):
+            if run_date < cutoff:
+                shutil.rmtree(os.path.join(base_dir, run_date), ignore_errors=True)
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _write_json(self, name: str, data: Any) -> None:
+        path = self._file(name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _read_json(self, name: str, default: Any = None) -> Any:
+        try:
+            with open(self._file(name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+        except (OSError, ValueError) as e:
+            logger.warning(f"체크포인트 파일을 읽지 못했습니다 ({name}): {e}")
+            return default
+
+    def has(self, stage: str) -> bool:
+        """단계 결과가 저장되어 있는지 확인합니다."""
+        return os.path.exists(self._file(f"{stage}.json"))
+
+    def last_completed_stage(self) -> Optional[str]:
+        """처음부터 빠짐없이 저장된 단계 중 마지막 단계를 반환합니다."""
+        last = None
+        for stage in STAGES:
+            if not self.has(stage):
+                break
+            last = stage
+        return last
+
+    def save_articles(self, stage: str, articles: List[Article]) -> None:
+        self._write_json(f"{stage}.json", [article.to_dict() for article in articles])
+
+    def load_articles(self, stage: str) -> List[Article]:
+        return [Article.from_dict(data) for data in self._read_json(f"{stage}.json", [])]
+
+    def save_categories(self, categories: List[Dict[str, Any]]) -> None:
+        self._write_json("categories.json", categories)
+
+    def load_categories(self) -> List[Dict[str, Any]]:
+        return self._read_json("categories.json", [])
+
+    def save_rendered(self, rendered: Dict[str, Tuple[str, str]]) -> None:
+        """템플릿별 HTML은 파일로, 제목은 rendered.json에 저장합니다."""
+        index = {}
+        for number, (template_name, (html_content, subject)) in enumerate(rendered.items()):
+            file_name = f"rendered-{number}.html"
+            with open(self._file(file_name), 'w', encoding='utf-8') as f:
+                f.write(html_content)
+            index[template_name] = {"file": file_name, "subject": subject}
+        self._write_json("rendered.json", index)
+
+    def load_rendered(self) -> Dict[str, Tuple[str, str]]:
+        rendered = {}
+        for template_name, entry in self._read_json("rendered.json", {}).items():
+            try:
+                with open(self._file(entry["file"]), 'r', encoding='utf-8') as f:
+                    rendered[template_name] = (f.read(), entry["subject"])
+            except (OSError, KeyError) as e:
+                logger.warning(f"렌더링된 HTML을 읽지 못했습니다 ({template_name}): {e}")
+        return rendered
+
+    def is_delivered(self, channel: str) -> bool:
+        """채널(email, teams 등)로 이미 발송했는지 확인합니다."""
+        return bool(self._read_json("delivery.json", {}).get(channel))
+
+    def mark_delivered(self, channel: str) -> None:
+        with self._lock:
+            delivery = self._read_json("delivery.json", {})
+            delivery[channel] = time.time()
+            self._write_json("delivery.json", delivery)
+
+    def save_email_results(self, results: List[DeliveryResult]) -> None:
+        """이메일 수신자별 발송 결과를 이전 결과에 합쳐 저장합니다. (한 번 성공한 수신자는 성공으로 유지)"""
+        with self._lock:
+            saved = self._read_json("email_delivery.json", {})
+            for result in results:
+                if not saved.get(result.recipient, {}).get('success'):
+                    saved[result.recipient] = asdict(result)
+            self._write_json("email_delivery.json", saved)
+
+    def load_email_recipients_sent(self) -> Set[str]:
+        """이전 실행에서 이메일을 이미 받은 수신자 주소를 반환합니다."""
+        return {recipient for recipient, result in self._read_json("email_delivery.json", {}).items()
+                if result.get('success')}
+
+    def is_completed(self) -> bool:
+        return os.path.exists(self._file("completed"))
+
+    def mark_completed(self) -> None:
+        """모든 단계가 끝났음을 기록하여 다음 --resume 대상에서 제외합니다."""
+        with open(self._file("completed"), 'w', encoding='utf-8') as f:
+            f.write(datetime.now().isoformat())
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Iterable, List, Set
+from ..models.article import Article
+from ..utils.logger import get_logger
+from ..utils.url_utils import canonicalize_url
+
+logger = get_logger(__name__)
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 IN 절을 나누어 조회
+_QUERY_CHUNK = 500
+
+class SeenArticleStore:
+    """이미 발송한 기사의 지문을 보관하여 다음 실행에서 다시 고르지 않도록 하는 SQLite 저장소
+
+    지문은 정규화된 기사 URL의 SHA-1 해시이며 url_hash 기본 키 인덱스로 조회합니다.
+    발송 후 ttl_days가 지난 기록은 만료되어 삭제됩니다.
+    """
+
+    def __init__(self, db_path: str, ttl_days: int = 30):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_db(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_articles (
+                    url_hash TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    title TEXT,
+                    delivered_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_articles_delivered_at ON seen_articles (delivered_at)")
+
+    @staticmethod
+    def url_hash(url: str) -> str:
+        """정규화된 URL의 지문을 계산합니다."""
+        return hashlib.sha1(canonicalize_url(url).encode('utf-8')).hexdigest()
+
+    def _article_hashes(self, article: Article) -> List[str]:
+        return [self.url_hash(url) for url in [article.url] + article.alternate_urls if url]
+
+    def _lookup(self, hashes: Iterable[str]) -> Set[str]:
+        """만료되지 않은 지문 중 저장소에 있는 것을 한 번의 배치 조회로 찾습니다."""
+        hashes = list(hashes)
+        found: Set[str] = set()
+        cutoff = time.time() - self.ttl_seconds
+        with closing(self._connect()) as conn:
+            for start in range(0, len(hashes), _QUERY_CHUNK):
+                chunk = hashes[start:start + _QUERY_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT url_hash FROM seen_articles WHERE url_hash IN ({placeholders}) AND delivered_at >= ?",
+                    (*chunk, cutoff)
+                )
+                found.update(row[0] for row in rows)
+        return found
+
+    def filter_unseen(self, articles: List[Article]) -> List[Article]:
+        """이미 발송된 기사를 제외한 목록을 반환합니다."""
+        if not articles:
+            return articles
+
+        article_hashes = [self._article_hashes(article) for article in articles]
+        seen = self._lookup(h for hashes in article_hashes for h in hashes)
+        unseen = [
+            article for article, hashes in zip(articles, article_hashes)
+            if not any(h in seen for h in hashes)
+        ]
+
+        logger.info(f"이미 발송한 기사 제외: {len(articles)}개 → {len(unseen)}개")
+        return unseen
+
+    def mark_delivered(self, articles: List[Article]) -> None:
+        """발송한 기사의 지문을 기록하고 만료된 기록을 정리합니다."""
+        now = time.time()
+        rows = [
+            (self.url_hash(url), url, article.title, now)
+            for article in articles
+            for url in [article.url] + article.alternate_urls if url
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO seen_articles (url_hash, url, title, delivered_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            deleted = conn.execute(
+                "DELETE FROM seen_articles WHERE delivered_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+
+        logger.info(f"발송 기록 저장: {len(rows)}개 URL (만료 삭제 {deleted}개)")
@@ -0,0 +1,165 @@
+import queue
+import random
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from ..models.delivery_result import DeliveryResult
+from ..utils.rate_limiter import TokenBucket
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@dataclass
+class OutgoingEmail:
+    """발송할 메일 한 통: 메시지 본문은 발송 직전에 render()로 만들어 수신자가 많아도 메모리에 쌓아 두지 않습니다."""
+    recipient: str
+    template: str
+    render: Callable[[], str]
+
+def is_transient_smtp_error(error: Exception) -> bool:
+    """연결 끊김, 타임아웃, 4xx 응답처럼 다시 시도하면 성공할 수 있는 오류인지 판단합니다."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return bool(codes) and all(400 <= code < 500 for code in codes)
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500 or error.smtp_code == -1
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPException):
+        return False
+    return isinstance(error, OSError)
+
+class SMTPDeliveryPool:
+    """인증된 SMTP 세션 여러 개로 메일을 병렬 발송하는 엔진
+
+    워커마다 SMTP 세션을 하나씩 열어 두고 여러 메일에 재사용합니다. 연결이 끊기거나 4xx 같은 일시적 오류가 나면
+    세션을 닫고 지수 백오프 뒤 다시 연결해 그 메일을 재시도하며, 5xx처럼 영구적인 오류는 재시도하지 않습니다.
+    messages_per_minute를 주면 제공자의 발송 한도를 넘지 않도록 모든 워커가 하나의 토큰 버킷을 나눠 씁니다.
+    인증 실패나 연결 불가처럼 모든 메일에 해당하는 오류가 나면 남은 메일은 시도하지 않고 실패로 기록합니다.
+    """
+
+    def __init__(self, host: str, port: int, user: str = "", password: str = "", pool_size: int = 4,
+                 max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 messages_per_minute: float = 0, timeout: float = 30.0, use_tls: bool = True):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.pool_size = max(1, pool_size)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.use_tls = use_tls
+        # 순간적으로 몰아서 보내지 않도록 버킷 용량은 워커 수만큼만 둠
+        self.rate_limiter = TokenBucket(messages_per_minute, capacity=self.pool_size) if messages_per_minute > 0 else None
+        self._fatal_error: Optional[str] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.ehlo()
+            if self.use_tls:
+                connection.starttls()
+                connection.ehlo()
+            if self.user:
+                connection.login(self.user, self.password)
+        except BaseException:
+            self._close(connection)
+            raise
+        return connection
+
+    @staticmethod
+    def _close(connection: Optional[smtplib.SMTP]) -> None:
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def send(self, from_addr: str, emails: List[OutgoingEmail]) -> List[DeliveryResult]:
+        """메일을 병렬로 발송하고 emails와 같은 순서로 수신자별 결과를 반환합니다."""
+        if not emails:
+            return []
+        self._fatal_error = None
+        jobs: queue.Queue = queue.Queue()
+        for index, email in enumerate(emails):
+            jobs.put((index, email))
+        results: Dict[int, DeliveryResult] = {}
+
+        workers = [threading.Thread(target=self._worker, args=(from_addr, jobs, results), name=f"smtp-{i}", daemon=True)
+                   for i in range(min(self.pool_size, len(emails)))]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return [results[index] for index in range(len(emails))]
+
+    def _worker(self, from_addr: str, jobs: queue.Queue, results: Dict[int, DeliveryResult]) -> None:
+        connection: Optional[smtplib.SMTP] = None
+        try:
+            while True:
+                try:
+                    index, email = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                results[index], connection = self._deliver(from_addr, email, connection)
+        finally:
+            self._close(connection)
+
+    def _deliver(self, from_addr: str, email: OutgoingEmail, connection: Optional[smtplib.SMTP]):
+        """메일 한 통을 재시도하며 발송하고 (결과, 다음 메일에 쓸 세션)을 반환합니다."""
+        started = time.monotonic()
+        message: Optional[str] = None
+        attempts = 0
+        error: Optional[Exception] = None
+        ever_connected = connection is not None
+
+        def result(success: bool, detail: Optional[str] = None) -> DeliveryResult:
+            return DeliveryResult(email.recipient, email.template, success, attempts, detail, time.monotonic() - started)
+
+        while attempts <= self.max_retries:
+            if self._fatal_error:
+                return result(False, self._fatal_error), connection
+            attempts += 1
+            try:
+                if connection is None:
+                    connection = self._connect()
+                    ever_connected = True
+                if message is None:
+                    message = email.render()
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+                connection.sendmail(from_addr, [email.recipient], message)
+                return result(True), connection
+            except (smtplib.SMTPAuthenticationError, smtplib.SMTPNotSupportedError) as e:
+                # 설정 문제이므로 다른 메일도 성공할 수 없음
+                self._fatal_error = f"SMTP 세션을 열 수 없습니다: {e}"
+                logger.error(self._fatal_error)
+                self._close(connection)
+                return result(False, self._fatal_error), None
+            except Exception as e:
+                error = e
+                if not is_transient_smtp_error(e):
+                    logger.warning(f"SMTP 발송 실패 ({email.recipient}): {e}")
+                    return result(False, str(e)), connection
+                self._close(connection)
+                connection = None
+                if attempts > self.max_retries:
+                    break
+                delay = self._backoff(attempts)
+                logger.warning(f"SMTP 일시적 오류로 {delay:.1f}초 후 다시 연결하여 재시도합니다 "
+                               f"({email.recipient}, {attempts}/{self.max_retries}): {e}")
+                time.sleep(delay)
+
+        if not ever_connected:
+            self._fatal_error = f"SMTP 서버({self.host}:{self.port})에 연결할 수 없습니다: {error}"
+            logger.error(self._fatal_error)
+        return result(False, str(error)), connection
@@ -1,8 +1,12 @@
+import hashlib
+import json
 import os
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 from jinja2 import Environment, FileSystemLoader
 from premailer import transform
+from .css_inliner import CSSInliner, FRAGMENT_MARKER
 from ..models.article import Article
 from ..utils.logger import get_logger
 from ..utils.exceptions import TemplateError
@@ -10,36 +14,139 @@ from ..utils.exceptions import TemplateError
 logger = get_logger(__name__)
 
 class TemplateService:
-    """템플릿 처리를 담당하는 서비스 클래스"""
+    """템플릿 처리를 담당하는 서비스 클래스
+
+    완성된 이메일 HTML은 (템플릿 이름, 내용 해시)를 키로 메모리에 캐시하므로, 같은 내용을 같은 템플릿으로
+    다시 요청하면 Jinja 렌더링과 CSS 인라이닝을 반복하지 않습니다.
+    CSS 인라이닝은 스타일시트를 한 번만 컴파일해 두는 CSSInliner로 하고, 처리할 수 없는 선택자가 있으면 premailer를 사용합니다.
+
+    기사 조각은 (템플릿 이름, 기사 지문)별로 한 번만 렌더링하고 인라인 결과도 재사용하므로, 템플릿이나 기사 구성이
+    다른 이메일을 여러 벌 만들어도 기사 부분은 캐시된 조각을 이어 붙이는 비용만 듭니다.
+    """
+
+    # 기사 조각 캐시의 최대 항목 수 (넘으면 비움)
+    MAX_CACHED_FRAGMENTS = 5000
 
     def __init__(self):
         self.template_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'templates')
         self.env = Environment(loader=FileSystemLoader(self.template_dir))
+        self.css_inliner = CSSInliner(self.template_dir)
+        self._render_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._render_lock = threading.Lock()
+        self.render_hits = 0
+        self.render_misses = 0
+        self._fragment_cache: Dict[Tuple[str, str], str] = {}
+        self.fragment_hits = 0
+        self.fragment_misses = 0
 
-    def generate_email_html(self, articles: List[Article], categories: List[Dict[str, Any]], template_name: str) -> Tuple[str, str]:
-        """뉴스 데이터와 카테고리를 기반으로 최종 이메일 HTML을 생성합니다."""
-        logger.info(f"'{template_name}' 템플릿을 사용하여 이메일 HTML 생성을 시작합니다...")
+    @staticmethod
+    def _content_hash(template_data: Dict[str, Any]) -> str:
+        payload = json.dumps(template_data, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def article_fingerprint(cls, article: Article) -> str:
+        """기사 조각에 영향을 주는 내용 전체의 해시"""
+        return cls._content_hash(article.to_dict())
+
+    def _article_fragment(self, template_name: str, article: Article, fingerprint: Optional[str] = None) -> str:
+        """템플릿의 render_article 매크로로 기사 조각을 렌더링합니다. 같은 기사 지문이면 캐시에서 돌려줍니다."""
+        key = (template_name, fingerprint or self.article_fingerprint(article))
+        with self._render_lock:
+            fragment = self._fragment_cache.get(key)
+            if fragment is not None:
+                self.fragment_hits += 1
+                return fragment
+            self.fragment_misses += 1
+        try:
+            module = self.env.get_template(template_name).module
+            fragment = str(module.render_article(article.to_dict()))
+        except Exception as e:
+            raise TemplateError(f"'{template_name}' 기사 조각 렌더링 실패: {e}")
+        with self._render_lock:
+            if len(self._fragment_cache) >= self.MAX_CACHED_FRAGMENTS:
+                self._fragment_cache.clear()
+            self._fragment_cache[key] = fragment
+        return fragment
+
+    def prepare_article(self, article: Article, template_names: List[str]) -> Dict[str, str]:
+        """기사 하나의 HTML 조각을 템플릿의 render_article 매크로로 미리 렌더링합니다.
+
+        요약이 끝난 기사부터 조각을 만들어 두면 최종 이메일 생성 시 기사 부분을 다시 렌더링하지 않습니다.
+        """
+        fingerprint = self.article_fingerprint(article)
+        return {template_name: self._article_fragment(template_name, article, fingerprint)
+                for template_name in template_names}
 
+    def _inline_css(self, html_content: str, fragments: Optional[Dict[str, str]] = None) -> str:
+        """컴파일한 인라이너로 CSS를 인라인하고, 처리할 수 없는 문서는 premailer로 인라인합니다.
+
+        fragments가 있으면 html_content의 FRAGMENT_MARKER 자리에 조각을 넣어 인라인합니다.
+        """
+        try:
+            final_html = self.css_inliner.inline(html_content, fragments)
+        except Exception as e:
+            logger.warning(f"컴파일한 CSS 인라이닝에 실패하여 premailer로 처리합니다: {e}")
+            final_html = None
+        if final_html is None:
+            for key, fragment in (fragments or {}).items():
+                html_content = html_content.replace(FRAGMENT_MARKER.format(key), fragment)
+            final_html = transform(html_content, base_path=self.template_dir, allow_loading_external_files=True)
+        return final_html
+
+    def generate_email_html(self, articles: List[Article], categories: List[Dict[str, Any]], template_name: str,
+                            article_fragments: Optional[Dict[int, str]] = None) -> Tuple[str, str]:
+        """뉴스 데이터와 카테고리를 기반으로 최종 이메일 HTML을 생성합니다.
+
+        article_fragments에 기사 번호별로 미리 렌더링한 조각이 있으면 그대로 사용하고, 없으면 기사 지문별 조각 캐시를 사용합니다.
+        같은 템플릿과 같은 내용으로 이미 만든 HTML이 있으면 렌더링 캐시에서 돌려줍니다.
+        """
         today_str = datetime.now().strftime('%Y년 %m월 %d일')
         subject = f"🤖 오늘의 AI 뉴스 ({today_str})"
 
+        # 템플릿에 전달할 데이터
+        template_data = {
+            "subject": subject,
+            "categories": categories,
+            "processed_articles": [article.to_dict() for article in articles],
+            "article_fragments": article_fragments or {}
+        }
+        # 미리 렌더링한 조각은 기사 내용에서 나오므로 해시에서 제외
+        cache_key = (template_name, self._content_hash({**template_data, "article_fragments": None}))
+        with self._render_lock:
+            cached = self._render_cache.get(cache_key)
+            if cached is not None:
+                self.render_hits += 1
+                logger.info(f"'{template_name}' 템플릿의 이메일 HTML을 렌더링 캐시에서 재사용합니다.")
+                return cached
+            self.render_misses += 1
+
+        logger.info(f"'{template_name}' 템플릿을 사용하여 이메일 HTML 생성을 시작합니다...")
         try:
             template = self.env.get_template(template_name)
 
-            # 템플릿에 전달할 데이터
-            template_data = {
-                "subject": subject,
-                "categories": categories,
-                "processed_articles": [article.to_dict() for article in articles]
-            }
+            fragments = None
+            if hasattr(template.module, 'render_article'):
+                # 기사 자리에는 표시만 렌더링하고, 캐시된 기사 조각을 인라인 단계에서 끼워 넣음
+                used = sorted({index for category in categories for index in category.get('articles', [])
+                               if 0 <= index < len(articles)})
+                fragments = {
+                    str(index): template_data["article_fragments"].get(index)
+                    or self._article_fragment(template_name, articles[index])
+                    for index in used
+                }
+                template_data = {**template_data,
+                                 "article_fragments": {index: FRAGMENT_MARKER.format(index) for index in used}}
 
             # HTML 렌더링
             html_content = template.render(template_data)
 
             # CSS 인라이닝
-            final_html = transform(html_content, base_path=self.template_dir, allow_loading_external_files=True)
+            final_html = self._inline_css(html_content, fragments)
 
             logger.info("이메일 HTML 생성 완료.")
+            with self._render_lock:
+                self._render_cache[cache_key] = (final_html, subject)
             return final_html, subject
 
         except Exception as e:
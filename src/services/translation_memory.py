@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Optional, Tuple
+from ..utils.logger import get_logger
+from .near_duplicate import shingle_hashes
+
+logger = get_logger(__name__)
+
+_SPACE_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# 설명이 길어도 앞부분(리드)만 비교하면 같은 기사인지 충분히 판단할 수 있습니다.
+_MAX_SOURCE_CHARS = 600
+# SQLite의 바인딩 변수 개수 제한(기본 999) 안에서 조회하기 위한 최대 shingle 수
+_MAX_QUERY_SHINGLES = 900
+# 정확히 일치하지 않을 때 유사도를 계산해 볼 후보 수
+_FUZZY_CANDIDATES = 5
+
+def normalize_source(title: str, description: str) -> str:
+    """번역 메모리 비교용으로 제목과 설명(앞부분)을 소문자화하고 문장 부호와 공백을 정리합니다."""
+    text = f"{title}\n{(description or '')[:_MAX_SOURCE_CHARS]}".lower()
+    return _SPACE_RE.sub(' ', _PUNCT_RE.sub(' ', text)).strip()
+
+class TranslationMemory:
+    """정규화한 원문(제목+설명)을 번역 결과(korean_title, summary, tags)에 대응시키는 번역 메모리
+
+    원문 해시로 정확히 일치하는 항목을 먼저 찾고, 없으면 단어/단어쌍 shingle 역색인으로 후보를 골라
+    Jaccard 유사도가 threshold 이상인 가장 비슷한 항목을 재사용합니다. 통신사 기사처럼 여러 매체에
+    거의 같은 제목과 리드로 실리는 기사를 모델 호출 없이 처리하기 위한 저장소로, 모델이나 프롬프트 버전과
+    무관하게 LLM 응답 캐시보다 오래(ttl_days) 보관합니다.
+    """
+
+    def __init__(self, db_path: str, threshold: float = 0.8, ttl_days: float = 30):
+        self.db_path = db_path
+        self.threshold = threshold
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.exact_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._init_db()
+        self.evict()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_db(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tm_entries (
+                    entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_hash TEXT NOT NULL UNIQUE,
+                    shingle_count INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tm_shingles (
+                    shingle INTEGER NOT NULL,
+                    entry_id INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tm_shingles_shingle ON tm_shingles (shingle)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tm_shingles_entry_id ON tm_shingles (entry_id)")
+
+    @staticmethod
+    def _source_hash(source: str) -> str:
+        return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _shingles(source: str) -> List[int]:
+        return sorted(shingle_hashes(source))[:_MAX_QUERY_SHINGLES]
+
+    def lookup(self, title: str, description: str) -> Optional[Dict[str, Any]]:
+        """원문과 같거나 충분히 비슷한 원문의 번역 결과를 반환합니다. 없으면 None을 반환합니다."""
+        source = normalize_source(title, description)
+        oldest = time.time() - self.ttl_seconds
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT result FROM tm_entries WHERE source_hash = ? AND created_at >= ?",
+                    (self._source_hash(source), oldest)
+                ).fetchone()
+                if row is not None:
+                    with self._lock:
+                        self.exact_hits += 1
+                    return json.loads(row[0])
+                match = self._find_similar(conn, self._shingles(source), oldest)
+        except sqlite3.Error as e:
+            logger.warning(f"번역 메모리 조회 실패: {e}")
+            match = None
+
+        with self._lock:
+            if match is None:
+                self.misses += 1
+                return None
+            self.fuzzy_hits += 1
+        return json.loads(match)
+
+    def _find_similar(self, conn: sqlite3.Connection, shingles: List[int], oldest: float) -> Optional[str]:
+        """공유하는 shingle이 많은 후보 중 Jaccard 유사도가 threshold 이상인 가장 비슷한 항목의 결과를 찾습니다."""
+        if not shingles:
+            return None
+        placeholders = ",".join("?" * len(shingles))
+        rows = conn.execute(f"""
+            SELECT e.result, e.shingle_count, COUNT(*) AS shared
+            FROM tm_shingles s JOIN tm_entries e ON e.entry_id = s.entry_id
+            WHERE s.shingle IN ({placeholders}) AND e.created_at >= ?
+            GROUP BY s.entry_id
+            ORDER BY shared DESC
+            LIMIT ?
+        """, (*shingles, oldest, _FUZZY_CANDIDATES)).fetchall()
+
+        best: Optional[Tuple[float, str]] = None
+        for result, shingle_count, shared in rows:
+            similarity = shared / (len(shingles) + shingle_count - shared)
+            if similarity >= self.threshold and (best is None or similarity > best[0]):
+                best = (similarity, result)
+        return best[1] if best else None
+
+    def add(self, title: str, description: str, result: Dict[str, Any]) -> None:
+        """원문과 번역 결과를 저장합니다. 같은 원문이 이미 있으면 결과를 새로 고칩니다."""
+        source = normalize_source(title, description)
+        shingles = self._shingles(source)
+        data = json.dumps(result, ensure_ascii=False)
+        try:
+            with closing(self._connect()) as conn, conn:
+                source_hash = self._source_hash(source)
+                row = conn.execute("SELECT entry_id FROM tm_entries WHERE source_hash = ?", (source_hash,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE tm_entries SET result = ?, created_at = ? WHERE entry_id = ?",
+                                 (data, time.time(), row[0]))
+                    return
+                entry_id = conn.execute(
+                    "INSERT INTO tm_entries (source_hash, shingle_count, result, created_at) VALUES (?, ?, ?, ?)",
+                    (source_hash, len(shingles), data, time.time())
+                ).lastrowid
+                conn.executemany("INSERT INTO tm_shingles (shingle, entry_id) VALUES (?, ?)",
+                                 [(shingle, entry_id) for shingle in shingles])
+        except sqlite3.Error as e:
+            logger.warning(f"번역 메모리 저장 실패: {e}")
+
+    def evict(self) -> None:
+        """ttl_days가 지난 항목과 그 색인을 삭제합니다."""
+        with closing(self._connect()) as conn, conn:
+            oldest = time.time() - self.ttl_seconds
+            conn.execute(
+                "DELETE FROM tm_shingles WHERE entry_id IN (SELECT entry_id FROM tm_entries WHERE created_at < ?)",
+                (oldest,)
+            )
+            expired = conn.execute("DELETE FROM tm_entries WHERE created_at < ?", (oldest,)).rowcount
+        if expired:
+            logger.info(f"번역 메모리에서 만료된 항목 {expired}개를 삭제했습니다.")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """조회 통계(정확 일치, 유사 일치, 누락)를 반환합니다."""
+        with self._lock:
+            total = self.exact_hits + self.fuzzy_hits + self.misses
+            return {
+                'exact_hits': self.exact_hits,
+                'fuzzy_hits': self.fuzzy_hits,
+                'misses': self.misses,
+                'hit_rate': (self.exact_hits + self.fuzzy_hits) / total if total else 0.0
+            }
@@ -11,8 +11,11 @@ class NotificationError(Exception):
     pass
 
 class EmailSendError(NotificationError):
-    """이메일 발송 중 발생하는 오류"""
-    pass
+    """이메일 발송 중 발생하는 오류 (일부 수신자만 실패했으면 수신자별 발송 결과 포함)"""
+
+    def __init__(self, message: str, results: list = None):
+        super().__init__(message)
+        self.results = results
 
 class ConfigurationError(Exception):
     """설정 관련 오류"""
@@ -21,3 +24,15 @@ class ConfigurationError(Exception):
 class TemplateError(Exception):
     """템플릿 처리 중 발생하는 오류"""
     pass
+
+class AIBackendError(AIProcessingError):
+    """AI 백엔드 호출이 실패했을 때 발생하는 오류 (HTTP 상태 코드와 재시도 대기 시간 포함)"""
+
+    def __init__(self, message: str, status_code: int = None, retry_after: float = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+class DeadlineExceededError(AIProcessingError):
+    """실행 전체의 시간 예산이 소진되어 AI 호출을 더 하지 않을 때 발생하는 오류"""
+    pass
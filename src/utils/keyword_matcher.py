@@ -0,0 +1,92 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+class KeywordMatcher:
+    """여러 키워드를 텍스트 한 번 순회로 찾는 Aho-Corasick 오토마톤
+
+    대소문자를 구분하지 않으며, 키워드 수와 관계없이 텍스트 길이에 비례하는 시간으로 동작합니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        seen = set()
+        for keyword in keywords:
+            normalized = keyword.lower()
+            if not normalized or normalized in seen:
+                continue
+            seen.add(normalized)
+            self._add(normalized, len(self.keywords))
+            self.keywords.append(keyword)
+
+        self._build()
+
+    def _add(self, keyword: str, index: int) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (index,)
+
+    def _build(self) -> None:
+        """실패 링크를 계산하고 출력 집합을 실패 링크를 따라 병합합니다."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _step(self, state: int, char: str) -> int:
+        goto, fail = self._goto, self._fail
+        while state and char not in goto[state]:
+            state = fail[state]
+        return goto[state].get(char, 0)
+
+    def contains(self, text: str) -> bool:
+        """텍스트에 키워드가 하나라도 포함되어 있는지 확인합니다."""
+        state = 0
+        output = self._output
+        for char in text.lower():
+            state = self._step(state, char)
+            if output[state]:
+                return True
+        return False
+
+    def count(self, text: str) -> Dict[str, int]:
+        """텍스트에 포함된 키워드별 등장 횟수를 반환합니다."""
+        counts: Dict[str, int] = {}
+        state = 0
+        output = self._output
+        for char in text.lower():
+            state = self._step(state, char)
+            for index in output[state]:
+                keyword = self.keywords[index]
+                counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+@lru_cache(maxsize=32)
+def _compile(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+def get_keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """키워드 집합별로 한 번만 컴파일된 매처를 반환합니다."""
+    return _compile(tuple(keywords))
@@ -0,0 +1,58 @@
+import threading
+import time
+from typing import Optional
+
+class TokenBucket:
+    """분당 허용량을 기준으로 토큰을 채우는 스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """토큰을 예약하고, 예약분을 쓸 수 있을 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        # 버킷 용량보다 큰 요청도 언젠가는 통과하도록 용량으로 제한
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """토큰을 사용할 수 있을 때까지 대기하고, 대기한 시간(초)을 반환합니다."""
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+class RateLimiter:
+    """요청 수(RPM)와 토큰 수(TPM)를 함께 제한하는 레이트 리미터"""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    def reserve(self, tokens: int = 0) -> float:
+        """요청 1건과 토큰 tokens개를 예약하고, 사용할 수 있을 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        wait = self.request_bucket.reserve(1)
+        if self.token_bucket and tokens:
+            wait = max(wait, self.token_bucket.reserve(tokens))
+        return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """요청 1건과 토큰 tokens개를 사용할 수 있을 때까지 대기합니다."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,67 @@
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+class RunBudget:
+    """실행 전체가 함께 쓰는 시간 예산
+
+    total_seconds 중 delivery_reserve초는 발송 단계 몫으로 남겨 두고, 수집/AI 처리/분류/렌더링은
+    나머지 시간(작업 마감 시각)까지만 진행합니다. 마감으로 품질을 낮춘 처리(원문 사용, 로컬 분류 등)는
+    단계별로 기록하여 실행이 끝날 때 한 번에 보고합니다.
+    """
+
+    def __init__(self, total_seconds: float, delivery_reserve: float = 120.0,
+                 started_at: Optional[float] = None):
+        self.total_seconds = total_seconds
+        self.delivery_reserve = min(delivery_reserve, total_seconds)
+        self.started_at = started_at if started_at is not None else time.monotonic()
+        self._degradations: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def deadline(self) -> float:
+        """실행 전체 마감 시각 (time.monotonic 기준)"""
+        return self.started_at + self.total_seconds
+
+    @property
+    def work_deadline(self) -> float:
+        """발송 몫을 뺀 작업 단계 마감 시각 (time.monotonic 기준)"""
+        return self.deadline - self.delivery_reserve
+
+    def remaining(self) -> float:
+        """실행 전체에 남은 시간(초)"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def work_remaining(self) -> float:
+        """작업 단계에 남은 시간(초)"""
+        return max(0.0, self.work_deadline - time.monotonic())
+
+    def work_expired(self) -> bool:
+        return time.monotonic() >= self.work_deadline
+
+    def degrade(self, stage: str, detail: str, count: int = 1) -> None:
+        """마감 때문에 낮춘 처리를 기록합니다. 같은 내용은 처음 한 번만 로그로 남기고 건수만 셉니다."""
+        key = (stage, detail)
+        with self._lock:
+            first = key not in self._degradations
+            self._degradations[key] = self._degradations.get(key, 0) + count
+        if first:
+            logger.warning(f"[시간 예산] {stage}: {detail}")
+
+    def get_degradations(self) -> List[Dict[str, object]]:
+        with self._lock:
+            return [{'stage': stage, 'detail': detail, 'count': count}
+                    for (stage, detail), count in self._degradations.items()]
+
+    def log_summary(self) -> None:
+        """사용한 시간과 발생한 품질 저하를 로그로 남깁니다."""
+        elapsed = time.monotonic() - self.started_at
+        degradations = self.get_degradations()
+        if not degradations:
+            logger.info(f"실행 시간 {elapsed:.0f}초 / 예산 {self.total_seconds:.0f}초, 품질 저하 없음")
+            return
+        details = ", ".join(f"{d['stage']}: {d['detail']} ({d['count']}건)" for d in degradations)
+        logger.warning(f"실행 시간 {elapsed:.0f}초 / 예산 {self.total_seconds:.0f}초, 시간 부족으로 품질을 낮춘 처리: {details}")
@@ -0,0 +1,138 @@
+import html
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List
+
+_BLOCK_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_BREAK_RE = re.compile(r'<\s*(br|/p|/div|/li|/h[1-6])\b[^>]*>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'[ \t\r\f\v]+')
+_NEWLINES_RE = re.compile(r'\s*\n\s*')
+# 문장 끝: 마침표/물음표/느낌표 뒤의 공백, 또는 줄바꿈
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수를 대략 추정합니다. (ASCII 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰)"""
+    ascii_count = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_count // 4 + (len(text) - ascii_count) + 1
+
+def strip_html(text: str) -> str:
+    """HTML 태그, 스크립트/스타일, 주석을 제거하고 엔티티를 풀어 일반 텍스트로 만듭니다. 문단 구분은 줄바꿈으로 남깁니다."""
+    if not text or '<' not in text and '&' not in text:
+        return (text or '').strip()
+    text = _COMMENT_RE.sub('', _BLOCK_RE.sub('', text))
+    text = _TAG_RE.sub(' ', _BREAK_RE.sub('\n', text))
+    text = _SPACE_RE.sub(' ', html.unescape(text).replace('\xa0', ' '))
+    return _NEWLINES_RE.sub('\n', text).strip()
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens를 넘지 않도록 문장 단위로 자릅니다.
+
+    첫 문장부터 예산을 넘으면 그 문장을 글자 단위로 자르고 말줄임표를 붙입니다.
+    """
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+
+    kept: List[str] = []
+    used = 0
+    for sentence in _SENTENCE_END_RE.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        tokens = estimate_tokens(sentence)
+        if used + tokens > max_tokens:
+            break
+        kept.append(sentence)
+        used += tokens
+    if kept:
+        return " ".join(kept)
+
+    # 한 문장이 예산보다 길면 예산에 맞을 때까지 글자를 줄임
+    end = len(text)
+    while end > 0 and estimate_tokens(text[:end]) > max_tokens:
+        end = end * 3 // 4
+    return text[:end].rstrip() + "…"
+
+@dataclass
+class UsageRecord:
+    """모델 호출 1회의 입력/출력 토큰 수(추정)와 지연 시간"""
+    kind: str
+    prompt_tokens: int
+    response_tokens: int
+    latency: float
+    failed: bool = False
+
+def _percentile(values: List[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))]
+
+class TokenUsageTracker:
+    """호출별 토큰 사용량과 지연 시간을 모아 실행 단위의 비용/지연 보고서를 만드는 스레드 안전 기록기
+
+    가격은 백만 토큰당 달러 단위입니다.
+    """
+
+    def __init__(self, input_price_per_mtok: float = 0.0, output_price_per_mtok: float = 0.0):
+        self.input_price_per_mtok = input_price_per_mtok
+        self.output_price_per_mtok = output_price_per_mtok
+        self.records: List[UsageRecord] = []
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, prompt_tokens: int, response_tokens: int, latency: float,
+               failed: bool = False) -> None:
+        with self._lock:
+            self.records.append(UsageRecord(kind, prompt_tokens, response_tokens, latency, failed))
+
+    def _summarize(self, records: List[UsageRecord]) -> Dict[str, Any]:
+        prompt_tokens = sum(record.prompt_tokens for record in records)
+        response_tokens = sum(record.response_tokens for record in records)
+        latencies = [record.latency for record in records if not record.failed]
+        cost = (prompt_tokens * self.input_price_per_mtok + response_tokens * self.output_price_per_mtok) / 1_000_000
+        return {
+            'calls': len(records),
+            'failed': sum(1 for record in records if record.failed),
+            'prompt_tokens': prompt_tokens,
+            'response_tokens': response_tokens,
+            'cost_usd': cost,
+            'latency_mean': sum(latencies) / len(latencies) if latencies else 0.0,
+            'latency_p50': _percentile(latencies, 0.5),
+            'latency_p95': _percentile(latencies, 0.95)
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """전체 합계와 호출 종류별(article, batch, categorize 등) 합계를 반환합니다."""
+        with self._lock:
+            records = list(self.records)
+        kinds = sorted({record.kind for record in records})
+        return {
+            'total': self._summarize(records),
+            'by_kind': {kind: self._summarize([r for r in records if r.kind == kind]) for kind in kinds}
+        }
+
+    def format_report(self) -> str:
+        """로그에 남길 보고서를 전체와 호출 종류별로 한 줄씩 만듭니다."""
+        report = self.report()
+        lines = []
+        for name, stats in [('전체', report['total'])] + list(report['by_kind'].items()):
+            lines.append(
+                f"{name}: 호출 {stats['calls']}회(실패 {stats['failed']}), 입력 {stats['prompt_tokens']:,}토큰, "
+                f"출력 {stats['response_tokens']:,}토큰, 비용 ${stats['cost_usd']:.4f}, "
+                f"지연 평균 {stats['latency_mean']:.2f}초/p95 {stats['latency_p95']:.2f}초"
+            )
+        return "\n".join(lines)
+
+    def save(self, path: str) -> None:
+        """보고서와 호출별 기록을 JSON 파일로 저장합니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            calls = [asdict(record) for record in self.records]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'report': self.report(), 'calls': calls}, f, ensure_ascii=False, indent=2)
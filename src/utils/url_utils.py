@@ -0,0 +1,84 @@
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote, unquote
+
+# 기사 내용과 무관한 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'ref_src', 'ncid', 'ocid', 'cmpid', 'smid', 'spm', 'sr_share', 'guccounter',
+}
+TRACKING_PREFIXES = ('utm_', 'guce_')
+
+# 모바일/AMP 전용 호스트 접두어
+HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+
+NAVER_NEWS_HOSTS = {'news.naver.com', 'n.news.naver.com'}
+_NAVER_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(\d+)/(\d+)')
+_NAVER_READ_PATH = re.compile(r'^/main/read\.(?:naver|nhn)$')
+
+_PATH_SAFE = "/:@!$&'()*+,;=-._~%"
+
+def _normalize_host(host: str) -> str:
+    host = host.lower().rstrip('.')
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix) and host.count('.') > 1:
+            host = host[len(prefix):]
+            break
+    return host
+
+def _canonical_naver(host: str, path: str, query: str):
+    """네이버 뉴스의 read.naver / article 형식 URL을 oid/aid 기준 하나의 URL로 통일합니다."""
+    if host not in NAVER_NEWS_HOSTS:
+        return None
+    match = _NAVER_ARTICLE_PATH.match(path)
+    if match:
+        oid, aid = match.groups()
+    elif _NAVER_READ_PATH.match(path):
+        params = dict(parse_qsl(query))
+        oid, aid = params.get('oid'), params.get('aid')
+        if not oid or not aid:
+            return None
+    else:
+        return None
+    return f"https://n.news.naver.com/article/{oid}/{aid}"
+
+@lru_cache(maxsize=8192)
+def canonicalize_url(url: str) -> str:
+    """중복 제거와 캐시 키에 사용할 정규화된 URL을 반환합니다.
+
+    스킴과 호스트를 통일하고, 추적 파라미터와 프래그먼트, AMP 경로, 끝 슬래시를 제거하며
+    쿼리 파라미터를 정렬합니다. 파싱할 수 없는 값은 앞뒤 공백만 제거해 돌려줍니다.
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme == 'http':
+        scheme = 'https'
+    host = _normalize_host(parts.hostname or '')
+    if port and not (port == 443 or port == 80):
+        host = f"{host}:{port}"
+
+    naver_url = _canonical_naver(host, parts.path, parts.query)
+    if naver_url:
+        return naver_url
+
+    path = quote(unquote(parts.path), safe=_PATH_SAFE)
+    path = re.sub(r'/{2,}', '/', path)
+    if path.endswith('/amp') or path.endswith('/amp/'):
+        path = path[:path.rindex('/amp')]
+    path = path.rstrip('/')
+
+    params = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, host, path, query, ''))
@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from premailer import Premailer, transform
+
+from src.models.article import Article
+from src.services.template_service import TemplateService
+
+TEMPLATE_NAMES = ['email_template.html', 'email_template_minimal.html']
+
+def _sample_data():
+    articles = [
+        Article(
+            title=f"Sample news {index}: OpenAI & Google",
+            description="설명 & 'quote' \"double\"",
+            url=f"https://www.example.com/news?id={index}&ref=rss",
+            source_name="Reuters",
+            source_id="reuters",
+            published_at=datetime(2026, 1, 2, 9, index),
+            korean_title=f"샘플 뉴스 {index}: 오픈AI & 구글",
+            summary=f"{index}번째 요약 'a' & \"b\"",
+            tags=["AI", "R&D"]
+        )
+        for index in range(4)
+    ]
+    categories = [
+        {'category_name': '기술 & 동향', 'articles': [0, 1]},
+        {'category_name': '신제품 소식', 'articles': [2, 3]}
+    ]
+    return articles, categories
+
+def _normalize(html: str) -> str:
+    # premailer(lxml)는 텍스트의 &를 &amp;로 다시 직렬화하고, 컴파일한 인라이너는 원문 그대로 둠
+    return html.replace('&amp;', '&')
+
+class _PremailerWithoutInternals(Premailer):
+    """컴파일한 인라이너가 쓰는 내부 메서드가 없어진 premailer 버전을 흉내 냄"""
+
+    def __getattribute__(self, name):
+        if name == '_parse_style_rules':
+            raise AttributeError(name)
+        return super().__getattribute__(name)
+
+class CSSInlinerTest(unittest.TestCase):
+
+    def test_compiled_inliner_matches_premailer(self):
+        articles, categories = _sample_data()
+        for template_name in TEMPLATE_NAMES:
+            with self.subTest(template=template_name):
+                compiled = TemplateService()
+                self.assertTrue(compiled.css_inliner.available)
+                # 컴파일한 인라이너가 처리하지 못하고 premailer로 넘어가면 비교 의미가 없으므로 실패로 처리
+                with mock.patch('src.services.template_service.transform',
+                                side_effect=AssertionError("premailer로 처리됨")):
+                    compiled_html, _ = compiled.generate_email_html(articles, categories, template_name)
+
+                reference = TemplateService()
+                reference.css_inliner.available = False
+                reference_html, _ = reference.generate_email_html(articles, categories, template_name)
+
+                self.assertIn('style="', compiled_html)
+                self.assertEqual(_normalize(compiled_html), _normalize(reference_html))
+
+    def test_missing_premailer_internals_fall_back_to_premailer(self):
+        articles, categories = _sample_data()
+        with mock.patch('src.services.css_inliner.Premailer', _PremailerWithoutInternals):
+            service = TemplateService()
+        self.assertFalse(service.css_inliner.available)
+        self.assertIsNone(service.css_inliner.inline("<html><head><style>p { color: red }</style></head>"
+                                                     "<body><p>x</p></body></html>"))
+
+        with mock.patch('src.services.template_service.transform', wraps=transform) as fallback:
+            html, _ = service.generate_email_html(articles, categories, TEMPLATE_NAMES[0])
+        self.assertEqual(fallback.call_count, 1)
+        self.assertIn('style="', html)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import argparse
+import random
+import numpy as np
+from dotenv import load_dotenv
+from src.services.relevance_ranker import RelevanceRanker, RelevanceArchive
+
+# .env 파일에서 환경 변수를 로드합니다.
+load_dotenv()
+
+# 발송/미발송 기록(relevance_archive.jsonl)으로 로컬 관련도 모델을 학습하여 저장합니다.
+cache_dir = os.getenv("CACHE_DIR", ".cache")
+parser = argparse.ArgumentParser(description="로컬 AI 관련도 모델 학습")
+parser.add_argument('--archive', default=os.path.join(cache_dir, 'relevance_archive.jsonl'), help="학습 데이터 JSONL 경로")
+parser.add_argument('--model', default=os.path.join(cache_dir, 'relevance_model.npz'), help="모델 저장 경로")
+parser.add_argument('--epochs', type=int, default=300)
+parser.add_argument('--holdout', type=float, default=0.2, help="평가용으로 떼어둘 비율")
+args = parser.parse_args()
+
+articles, labels = RelevanceArchive(args.archive).load()
+if len(set(labels)) < 2:
+    print(f"오류: 발송/미발송 기록이 모두 있어야 학습할 수 있습니다. (기록 {len(labels)}개)")
+    exit()
+
+order = list(range(len(articles)))
+random.Random(42).shuffle(order)
+split = int(len(order) * (1 - args.holdout))
+train, test = order[:split], order[split:]
+
+ranker = RelevanceRanker().fit([articles[i] for i in train], [labels[i] for i in train], epochs=args.epochs)
+if test:
+    predicted = ranker.score([articles[i] for i in test]) >= 0.5
+    actual = np.array([labels[i] for i in test]) == 1
+    true_positive = int(np.sum(predicted & actual))
+    precision = true_positive / max(int(predicted.sum()), 1)
+    recall = true_positive / max(int(actual.sum()), 1)
+    print(f"평가 ({len(test)}개): 정확도 {np.mean(predicted == actual):.2%}, 정밀도 {precision:.2%}, 재현율 {recall:.2%}")
+
+# 평가가 끝나면 전체 데이터로 다시 학습하여 저장
+ranker = RelevanceRanker().fit(articles, labels, epochs=args.epochs)
+ranker.save(args.model)
+print(f"학습 데이터 {len(articles)}개 (발송 {sum(labels)}개)로 학습한 모델을 '{args.model}'에 저장했습니다.")